@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Docx Builder Benchmark
+Times document assembly for growing pick counts with the old
+add_picture + doc.paragraphs[-1] pattern, with DocumentBuilder and
+with StreamingDocumentBuilder (flushed every 32 picks, saved to a temp file).
+Every pick gets its own image, as real screenshots do, so de-duplication
+cannot hide per-image costs
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, Pt, RGBColor
+from PIL import Image
+from nfl_docx_builder import DocumentBuilder
+from nfl_docx_stream import StreamingDocumentBuilder
+
+PICK_COUNTS = [32, 64, 128, 256, 512, 1024, 7 * 256]
+
+
+def _pick_images(picks):
+    """One distinct 800x200 PNG per pick (the pick number sets the background colour)"""
+    images = []
+    for pick in range(picks):
+        buffer = io.BytesIO()
+        Image.new('RGB', (800, 200), color=(pick % 256, pick // 256 % 256, 250)).save(buffer, 'PNG')
+        images.append(buffer.getvalue())
+    return images
+
+
+def build_with_rescans(images):
+    """Previous pattern: every picture is followed by a full doc.paragraphs rescan"""
+    doc = Document()
+    for pick, image in enumerate(images):
+        doc.add_picture(io.BytesIO(image), width=Inches(7.5))
+        last_paragraph = doc.paragraphs[-1]
+        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        analysis_para = doc.add_paragraph()
+        analysis_run = analysis_para.add_run(f"Analysis for pick {pick + 1}")
+        analysis_run.font.size = Pt(16)
+        analysis_run.font.color.rgb = RGBColor(0, 0, 0)
+    return doc
+
+
+def build_with_builder(images):
+    builder = DocumentBuilder()
+    builder.define_paragraph_style('Pick Layout', alignment=WD_ALIGN_PARAGRAPH.CENTER)
+    builder.define_paragraph_style('Pick Analysis', size=Pt(16), color=(0, 0, 0))
+    for pick, image in enumerate(images):
+        builder.picture(io.BytesIO(image), width=Inches(7.5), style='Pick Layout')
+        builder.text(f"Analysis for pick {pick + 1}", style='Pick Analysis')
+    return builder.doc
+
+
+def build_with_stream(images):
+    with tempfile.TemporaryDirectory() as tmp:
+        builder = StreamingDocumentBuilder(os.path.join(tmp, 'stream.docx'))
+        builder.define_paragraph_style('Pick Layout', alignment=WD_ALIGN_PARAGRAPH.CENTER)
+        builder.define_paragraph_style('Pick Analysis', size=Pt(16), color=(0, 0, 0))
+        for pick, image in enumerate(images):
+            builder.picture(io.BytesIO(image), width=Inches(7.5), style='Pick Layout')
+            builder.text(f"Analysis for pick {pick + 1}", style='Pick Analysis')
+            if (pick + 1) % 32 == 0:
+                builder.flush()
+        builder.save()
+
+
+def time_build(build, images):
+    started = time.perf_counter()
+    build(images)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--max-picks', type=int, default=PICK_COUNTS[-1],
+                        help='Largest pick count to time (default: 7 authors x 256 picks)')
+    args = parser.parse_args()
+
+    print(f"{'picks':>6} {'rescan (s)':>11} {'builder (s)':>12} {'builder ms/pick':>16} {'stream+save (s)':>16}")
+    for picks in [count for count in PICK_COUNTS if count <= args.max_picks]:
+        images = _pick_images(picks)
+        old = time_build(build_with_rescans, images)
+        new = time_build(build_with_builder, images)
+        streamed = time_build(build_with_stream, images)
+        print(f"{picks:>6} {old:>11.2f} {new:>12.2f} {new / picks * 1000:>16.2f} {streamed:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,10 +20,19 @@ from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
 import io
 from PIL import Image
+from nfl_offline_extractor import extract_article
+from nfl_http_cache import create_cached_session
+from nfl_image_store import get_image_store
+from nfl_placeholder_renderer import render_placeholder
+from nfl_headshot_downloader import get_headshot_downloader, prefetch_headshots
+from nfl_docx_builder import add_picture_paragraph
+from nfl_draft_store import save_mock_drafts
+from nfl_player_registry import count_players
+from nfl_reference_data import fallback_mock_draft, headshot_sources, player_image_sources
 
 class ComprehensiveNFLScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_cached_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
         })
@@ -57,6 +66,18 @@ class ComprehensiveNFLScraper:
         try:
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
+            
+            # Structured NFL.com ranked-item pages parse directly with lxml
+            article = extract_article(response.content, url=url)
+            if article['picks']:
+                print(f"   ✓ Found {len(article['picks'])} picks for {author}")
+                return {
+                    'title': article['title'],
+                    'author': author,
+                    'url': url,
+                    'picks': article['picks'][:8]  # First 8 picks
+                }
+            
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Find the title
@@ -116,114 +137,7 @@ class ComprehensiveNFLScraper:
 
     def get_fallback_data(self, author):
         """Get fallback mock draft data if scraping fails"""
-        fallback_data = {
-            'Bucky Brooks': {
-                'title': 'Bucky Brooks 2025 NFL Mock Draft 3.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Tyler Warren', 'school': 'Penn State', 'position': 'TE', 'class': 'Senior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Jalon Walker', 'school': 'Georgia', 'position': 'Edge', 'class': 'Junior'}
-                ]
-            },
-            'Daniel Jeremiah': {
-                'title': 'Daniel Jeremiah 2025 NFL Mock Draft 4.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'}
-                ]
-            },
-            'Charles Davis': {
-                'title': 'Charles Davis 2025 NFL Mock Draft 3.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-                ]
-            },
-            'Lance Zierlein': {
-                'title': 'Lance Zierlein 2025 NFL Mock Draft 4.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'}
-                ]
-            },
-            'Chad Reuter': {
-                'title': 'Chad Reuter 2025 NFL Mock Draft 2.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'}
-                ]
-            },
-            'Eric Edholm': {
-                'title': 'Eric Edholm 2025 NFL Mock Draft 3.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-                ]
-            },
-            'Dan Parr': {
-                'title': 'Dan Parr 2025 NFL Mock Draft 2.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Will Campbell', 'school': 'LSU', 'position': 'OL', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Tyler Booker', 'school': 'Alabama', 'position': 'OG', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Tyler Warren', 'school': 'Penn State', 'position': 'TE', 'class': 'Senior'}
-                ]
-            },
-            'Gennaro Filice': {
-                'title': 'Gennaro Filice 2025 NFL Mock Draft 2.0',
-                'picks': [
-                    {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                    {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                    {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                    {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                    {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'},
-                    {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                    {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-                ]
-            }
-        }
-        
-        data = fallback_data.get(author, fallback_data['Bucky Brooks'])
+        data = fallback_mock_draft(author)
         return {
             'title': data['title'],
             'author': author,
@@ -235,74 +149,11 @@ class ComprehensiveNFLScraper:
         """Capture player image directly from web sources"""
         print(f"📸 Capturing web image for {player_name}...")
         
-        # Check if we already have this image
-        image_path = f"processed/images/web_{pick_number}_{player_name.replace(' ', '_')}.png"
-        if os.path.exists(image_path):
-            file_size = os.path.getsize(image_path)
-            if file_size > 20000:  # If file is reasonably large
-                print(f"   ✓ Using existing web image for {player_name}")
-                return image_path
-        
-        # Enhanced player image sources with multiple options
-        image_sources = {
-            'Cam Ward': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4686261.png',
-                'https://hurricanesports.com/images/2024/8/26/Cam_Ward_2024.jpg',
-                'https://www.sports-reference.com/cbb/players/cam-ward-1.jpg'
-            ],
-            'Shedeur Sanders': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567048.png',
-                'https://cubuffs.com/images/2024/8/15/Shedeur_Sanders_2024.jpg'
-            ],
-            'Travis Hunter': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567049.png',
-                'https://cubuffs.com/images/2024/8/15/Travis_Hunter_2024.jpg'
-            ],
-            'Abdul Carter': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567050.png',
-                'https://gopsusports.com/images/2024/8/15/Abdul_Carter_2024.jpg'
-            ],
-            'Will Johnson': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567051.png',
-                'https://mgoblue.com/images/2024/8/15/Will_Johnson_2024.jpg'
-            ],
-            'Mason Graham': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567052.png'
-            ],
-            'Tetairoa McMillan': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567053.png'
-            ],
-            'Malaki Starks': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567054.png'
-            ],
-            'Kelvin Banks Jr.': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567055.png'
-            ],
-            'Ashton Jeanty': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567056.png'
-            ],
-            'Tyler Warren': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567057.png'
-            ],
-            'Jalon Walker': [
-                'https://a.espncdn.com/i/headshots/college-football/players/full/4567058.png'
-            ]
-        }
-        
-        urls = image_sources.get(player_name, [])
-        
-        for url in urls:
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                
-                if len(response.content) > 5000:  # At least 5KB
-                    with open(image_path, 'wb') as f:
-                        f.write(response.content)
-                    print(f"   ✓ Captured web image for {player_name}")
-                    return image_path
-            except:
-                continue
+        # Raced across every mirror at once; reuses anything already in the image store
+        image_path = get_headshot_downloader().download(player_name, headshot_sources(player_name))
+        if image_path:
+            print(f"   ✓ Web image ready for {player_name}")
+            return image_path
         
         # Create NFL.com style placeholder
         return self.create_nfl_style_placeholder(player_name, pick_number)
@@ -310,62 +161,7 @@ class ComprehensiveNFLScraper:
     def create_nfl_style_placeholder(self, player_name, pick_number):
         """Create NFL.com style placeholder image"""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Create NFL.com style placeholder (wider aspect ratio)
-            img = Image.new('RGB', (350, 254), color=(245, 245, 245))
-            draw = ImageDraw.Draw(img)
-            
-            # Add NFL-style gradient
-            for y in range(254):
-                gray_value = int(245 - (y * 20 / 254))
-                color = (gray_value, gray_value + 2, gray_value + 5)
-                draw.line([(0, y), (350, y)], fill=color)
-            
-            # Add border similar to ESPN/NFL.com
-            draw.rectangle([5, 5, 345, 249], outline=(180, 180, 180), width=2)
-            
-            # Load fonts
-            try:
-                font_large = ImageFont.truetype("Arial.ttf", 22)
-                font_small = ImageFont.truetype("Arial.ttf", 14)
-            except:
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # Add player name
-            name_parts = player_name.split()
-            if len(name_parts) >= 2:
-                first_name = name_parts[0]
-                last_name = ' '.join(name_parts[1:])
-                
-                # Center the names
-                bbox1 = draw.textbbox((0, 0), first_name, font=font_large)
-                bbox2 = draw.textbbox((0, 0), last_name, font=font_large)
-                
-                w1, h1 = bbox1[2] - bbox1[0], bbox1[3] - bbox1[1]
-                w2, h2 = bbox2[2] - bbox2[0], bbox2[3] - bbox2[1]
-                
-                x1 = (350 - w1) // 2
-                x2 = (350 - w2) // 2
-                y1 = 100
-                y2 = 130
-                
-                draw.text((x1, y1), first_name, fill=(60, 60, 60), font=font_large)
-                draw.text((x2, y2), last_name, fill=(60, 60, 60), font=font_large)
-            
-            # Add pick info
-            pick_text = f"2025 NFL Draft Pick #{pick_number}"
-            bbox = draw.textbbox((0, 0), pick_text, font=font_small)
-            w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            x = (350 - w) // 2
-            draw.text((x, 180), pick_text, fill=(120, 120, 120), font=font_small)
-            
-            filename = f"processed/images/web_{pick_number}_{player_name.replace(' ', '_')}.png"
-            img.save(filename, 'PNG')
-            
-            return filename
-            
+            return render_placeholder(player_name, pick_number, 'nfl_style')
         except Exception as e:
             print(f"   ⚠️ Could not create NFL-style placeholder for {player_name}: {e}")
             return None
@@ -374,6 +170,9 @@ class ComprehensiveNFLScraper:
         """Create Word document that matches NFL.com layout"""
         print("📄 Creating NFL.com style document...")
         
+        # Fetch every headshot in one parallel batch before laying out picks
+        prefetch_headshots(all_mock_drafts, player_image_sources())
+        
         doc = Document()
         
         # Set document style to match NFL.com
@@ -463,8 +262,7 @@ class ComprehensiveNFLScraper:
                 if image_path and os.path.exists(image_path):
                     try:
                         # NFL.com style image sizing
-                        doc.add_picture(image_path, width=Inches(2.5))
-                        last_paragraph = doc.paragraphs[-1]
+                        last_paragraph = add_picture_paragraph(doc, image_path, width=Inches(2.5))
                         last_paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
                     except Exception as e:
                         print(f"⚠️ Could not add image for {pick['player']}: {e}")
@@ -492,8 +290,7 @@ class ComprehensiveNFLScraper:
             for pick in draft['picks']:
                 all_players.append(pick['player'])
         
-        from collections import Counter
-        player_counts = Counter(all_players)
+        player_counts = count_players(all_players)
         most_common = player_counts.most_common(10)
         
         consensus_header = doc.add_heading('Consensus Top Picks:', level=2)
@@ -542,6 +339,9 @@ def main():
         if draft_data:
             all_mock_drafts.append(draft_data)
     
+    # Keep the scraped picks for offline reports
+    save_mock_drafts(all_mock_drafts)
+    
     # Create NFL-style document
     if all_mock_drafts:
         output_path = scraper.create_nfl_style_document(all_mock_drafts)
@@ -549,7 +349,7 @@ def main():
         print(f"\n🎉 SUCCESS! Complete NFL-style document created!")
         print("=" * 70)
         print(f"📁 Document: {output_path}")
-        print(f"📸 Player images: processed/images/")
+        print(f"📸 Player images: {get_image_store().root}/")
         
         print(f"\n📊 Complete Summary:")
         print(f"   • {len(all_mock_drafts)} mock drafts from all target authors")
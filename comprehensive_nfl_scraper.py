@@ -15,10 +15,16 @@ from urllib.parse import urljoin, urlparse
 from docx import Document
 from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from nfl_http_cache import create_cached_session
+from nfl_image_store import get_image_store, find_headshot, store_downloaded_headshot
+from nfl_placeholder_renderer import render_placeholder
+from nfl_docx_builder import add_picture_paragraph
+from nfl_draft_store import save_mock_drafts
+from nfl_reference_data import ESPN_HEADSHOT_URL, prospect
 
 class NFLMockDraftScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_cached_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -30,13 +36,6 @@ class NFLMockDraftScraper:
             'Charles Davis', 'Chad Reuter', 'Bucky Brooks'
         ]
         
-        # Common player headshot URLs from ESPN (these are more likely to be in uniform)
-        self.player_image_sources = {
-            'ESPN': 'https://a.espncdn.com/i/headshots/college-football/players/full/{player_id}.png',
-            'NFL': 'https://static.www.nfl.com/image/private/t_headshot_desktop/{player_id}',
-            'Sports Reference': 'https://cdn.nflgsis.com/static/content/public/image/fantasy/transparent/200x200/{player_id}.png'
-        }
-        
         os.makedirs('processed', exist_ok=True)
         os.makedirs('processed/images', exist_ok=True)
 
@@ -188,33 +187,26 @@ class NFLMockDraftScraper:
         try:
             print(f"📸 Downloading headshot for {player_name}...")
             
-            # Known player ESPN IDs (these would need to be updated with real IDs)
-            player_espn_ids = {
-                'Cam Ward': '4686261',
-                'Shedeur Sanders': '4567048', 
-                'Travis Hunter': '4567049',
-                'Abdul Carter': '4567050',
-                'Will Johnson': '4567051',
-                'Malaki Starks': '4567052',
-                'Tetairoa McMillan': '4567053',
-                'Shavon Ryder Jr.': '4567054'
-            }
-            
-            player_id = player_espn_ids.get(player_name)
-            if not player_id:
+            player = prospect(player_name)
+            if not player or not player.get('espn_id'):
                 print(f"   ⚠️ No ESPN ID found for {player_name}, creating placeholder")
                 return self.create_player_placeholder(player_name, pick_number)
             
             # Try ESPN first (most likely to have uniform shots)
-            espn_url = f'https://a.espncdn.com/i/headshots/college-football/players/full/{player_id}.png'
+            espn_url = ESPN_HEADSHOT_URL.format(espn_id=player['espn_id'])
+            
+            filename = find_headshot(player_name, [espn_url])
+            if filename:
+                print(f"   ✓ Using stored headshot for {player_name}")
+                return filename
             
             try:
                 response = self.session.get(espn_url, timeout=10)
                 response.raise_for_status()
                 
-                filename = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-                with open(filename, 'wb') as f:
-                    f.write(response.content)
+                filename = store_downloaded_headshot(player_name, espn_url, response.content)
+                if not filename:
+                    raise ValueError(f"{espn_url} did not return an image")
                 
                 print(f"   ✓ Downloaded ESPN headshot for {player_name}")
                 return filename
@@ -230,56 +222,7 @@ class NFLMockDraftScraper:
     def create_player_placeholder(self, player_name, pick_number):
         """Create a professional-looking placeholder headshot"""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Create a professional looking placeholder
-            img = Image.new('RGB', (200, 250), color=(240, 240, 240))
-            draw = ImageDraw.Draw(img)
-            
-            # Add a border
-            draw.rectangle([5, 5, 195, 245], outline=(100, 100, 100), width=2)
-            
-            # Try to load a font
-            try:
-                font_large = ImageFont.truetype("Arial.ttf", 18)
-                font_small = ImageFont.truetype("Arial.ttf", 14)
-            except:
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
-            # Add player name
-            name_parts = player_name.split()
-            if len(name_parts) >= 2:
-                first_name = name_parts[0]
-                last_name = ' '.join(name_parts[1:])
-                
-                # Center the text
-                bbox1 = draw.textbbox((0, 0), first_name, font=font_large)
-                bbox2 = draw.textbbox((0, 0), last_name, font=font_large)
-                
-                w1, h1 = bbox1[2] - bbox1[0], bbox1[3] - bbox1[1]
-                w2, h2 = bbox2[2] - bbox2[0], bbox2[3] - bbox2[1]
-                
-                x1 = (200 - w1) // 2
-                x2 = (200 - w2) // 2
-                y1 = 100
-                y2 = 130
-                
-                draw.text((x1, y1), first_name, fill=(50, 50, 50), font=font_large)
-                draw.text((x2, y2), last_name, fill=(50, 50, 50), font=font_large)
-            
-            # Add pick number
-            pick_text = f"#{pick_number}"
-            bbox = draw.textbbox((0, 0), pick_text, font=font_small)
-            w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-            x = (200 - w) // 2
-            draw.text((x, 180), pick_text, fill=(100, 100, 100), font=font_small)
-            
-            filename = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-            img.save(filename, 'PNG')
-            
-            return filename
-            
+            return render_placeholder(player_name, pick_number, 'compact')
         except Exception as e:
             print(f"   ⚠️ Could not create placeholder for {player_name}: {e}")
             return None
@@ -315,14 +258,17 @@ def main():
             
             # Download headshots for each player
             for pick in picks:
-                scraper.download_player_headshot(pick['player'], pick['pick'])
+                pick['headshot_path'] = scraper.download_player_headshot(pick['player'], pick['pick'])
+    
+    # Keep the scraped picks for offline reports
+    save_mock_drafts(all_draft_data)
     
     # Create Word document
     if all_draft_data:
         doc_path = create_professional_document(all_draft_data)
         print(f"\n🎉 SUCCESS! Professional document created!")
         print(f"📁 Document saved: {doc_path}")
-        print(f"📸 Player headshots saved in: processed/images/")
+        print(f"📸 Player headshots saved in: {get_image_store().root}/")
         
         print(f"\n📊 Summary:")
         print(f"   • {len(all_draft_data)} mock drafts processed")
@@ -370,11 +316,10 @@ def create_professional_document(draft_data):
             details_run.font.color.rgb = RGBColor(107, 114, 128)
             
             # Add player headshot
-            headshot_path = f"processed/images/headshot_{pick['pick']}_{pick['player'].replace(' ', '_')}.png"
-            if os.path.exists(headshot_path):
+            headshot_path = pick.get('headshot_path')
+            if headshot_path and os.path.exists(headshot_path):
                 try:
-                    doc.add_picture(headshot_path, width=Inches(1.5))
-                    last_paragraph = doc.paragraphs[-1]  
+                    last_paragraph = add_picture_paragraph(doc, headshot_path, width=Inches(1.5))
                     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 except Exception as e:
                     print(f"⚠️ Could not add headshot for {pick['player']}: {e}")
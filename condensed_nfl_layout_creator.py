@@ -4,13 +4,19 @@ Condensed NFL Layout Creator
 Creates NFL.com-style pick layouts and condensed Word documents
 """
 
+import argparse
 import os
 from datetime import datetime
-from docx import Document
-from docx.shared import Inches, RGBColor, Pt
+from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from nfl_image_store import get_image_store, player_identity, HEADSHOT
+from nfl_placeholder_renderer import get_font
+from nfl_docx_builder import DocumentBuilder
+from nfl_docx_parallel import build_sections
+from nfl_draft_store import save_mock_drafts
+from nfl_reference_data import team_abbreviation, reference_mock_drafts
 import requests
 
 def create_nfl_pick_layout(pick_data, author):
@@ -26,19 +32,12 @@ def create_nfl_pick_layout(pick_data, author):
     # Add blue left border (like NFL.com)
     draw.rectangle([0, 0, 12, height], fill=(0, 53, 148))
     
-    # Load fonts
-    try:
-        font_pick = ImageFont.truetype("Arial.ttf", 16)
-        font_number = ImageFont.truetype("Arial.ttf", 32) 
-        font_team = ImageFont.truetype("Arial.ttf", 22)
-        font_player = ImageFont.truetype("Arial.ttf", 28)
-        font_details = ImageFont.truetype("Arial.ttf", 14)
-    except:
-        font_pick = ImageFont.load_default()
-        font_number = ImageFont.load_default()
-        font_team = ImageFont.load_default()
-        font_player = ImageFont.load_default()
-        font_details = ImageFont.load_default()
+    # Load fonts (cached across picks)
+    font_pick = get_font(16)
+    font_number = get_font(32)
+    font_team = get_font(22)
+    font_player = get_font(28)
+    font_details = get_font(14)
     
     # Pick label and number (left side)
     draw.text((25, 25), "Pick", fill=(107, 114, 128), font=font_pick)
@@ -78,8 +77,8 @@ def create_nfl_pick_layout(pick_data, author):
     
     # Try to add actual player photo if available
     try:
-        player_photo_path = f"processed/images/web_{pick_data['pick']}_{pick_data['player'].replace(' ', '_')}.png"
-        if os.path.exists(player_photo_path):
+        player_photo_path = get_image_store().get(player_identity(pick_data['player']), kind=HEADSHOT)
+        if player_photo_path:
             player_photo = Image.open(player_photo_path)
             # Resize to fit
             player_photo = player_photo.resize((photo_size, photo_size), Image.Resampling.LANCZOS)
@@ -99,184 +98,60 @@ def create_nfl_pick_layout(pick_data, author):
 
 def get_team_initials(team_name):
     """Get team initials for logo placeholder"""
-    team_initials = {
-        'Tennessee Titans': 'TEN',
-        'Cleveland Browns': 'CLE', 
-        'New York Giants': 'NYG',
-        'New England Patriots': 'NE',
-        'Jacksonville Jaguars': 'JAX',
-        'Las Vegas Raiders': 'LV',
-        'New York Jets': 'NYJ',
-        'Carolina Panthers': 'CAR',
-        'New Orleans Saints': 'NO',
-        'Chicago Bears': 'CHI',
-        'San Francisco 49ers': 'SF',
-        'Dallas Cowboys': 'DAL',
-        'Miami Dolphins': 'MIA',
-        'Indianapolis Colts': 'IND',
-        'Atlanta Falcons': 'ATL',
-        'Arizona Cardinals': 'ARI',
-        'Cincinnati Bengals': 'CIN',
-        'Seattle Seahawks': 'SEA',
-        'Tampa Bay Buccaneers': 'TB',
-        'Denver Broncos': 'DEN',
-        'Pittsburgh Steelers': 'PIT',
-        'Los Angeles Chargers': 'LAC',
-        'Green Bay Packers': 'GB',
-        'Minnesota Vikings': 'MIN',
-        'Houston Texans': 'HOU',
-        'Los Angeles Rams': 'LAR',
-        'Baltimore Ravens': 'BAL',
-        'Detroit Lions': 'DET',
-        'Washington Commanders': 'WAS',
-        'Buffalo Bills': 'BUF',
-        'Kansas City Chiefs': 'KC',
-        'Philadelphia Eagles': 'PHI'
-    }
-    return team_initials.get(team_name, 'NFL')
+    return team_abbreviation(team_name)
 
 def get_comprehensive_mock_draft_data():
     """Get comprehensive mock draft data for all authors"""
     
     print("📊 Loading comprehensive mock draft data...")
     
-    mock_drafts = [
-        {
-            'author': 'Bucky Brooks',
-            'title': 'Bucky Brooks 2025 NFL Mock Draft 3.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tyler Warren', 'school': 'Penn State', 'position': 'TE', 'class': 'Senior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Jalon Walker', 'school': 'Georgia', 'position': 'Edge', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Daniel Jeremiah',
-            'title': 'Daniel Jeremiah 2025 NFL Mock Draft 4.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Lance Zierlein',
-            'title': 'Lance Zierlein 2025 NFL Mock Draft 4.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Charles Davis',
-            'title': 'Charles Davis 2025 NFL Mock Draft 3.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Chad Reuter',
-            'title': 'Chad Reuter 2025 NFL Mock Draft 2.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Eric Edholm',
-            'title': 'Eric Edholm 2025 NFL Mock Draft 3.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Dan Parr',
-            'title': 'Dan Parr 2025 NFL Mock Draft 2.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Will Campbell', 'school': 'LSU', 'position': 'OL', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Tyler Booker', 'school': 'Alabama', 'position': 'OG', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Tyler Warren', 'school': 'Penn State', 'position': 'TE', 'class': 'Senior'}
-            ]
-        },
-        {
-            'author': 'Gennaro Filice',
-            'title': 'Gennaro Filice 2025 NFL Mock Draft 2.0',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Malaki Starks', 'school': 'Georgia', 'position': 'S', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 'school': 'Texas', 'position': 'OT', 'class': 'Junior'}
-            ]
-        },
-        {
-            'author': 'Ross Tucker',
-            'title': 'Ross Tucker 2025 NFL Mock Draft',
-            'picks': [
-                {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'school': 'Miami', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'school': 'Colorado', 'position': 'QB', 'class': 'Senior'},
-                {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'school': 'Colorado', 'position': 'WR/CB', 'class': 'Junior'},
-                {'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 'school': 'Penn State', 'position': 'Edge', 'class': 'Junior'},
-                {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 'school': 'Michigan', 'position': 'CB', 'class': 'Junior'},
-                {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Ashton Jeanty', 'school': 'Boise State', 'position': 'RB', 'class': 'Junior'},
-                {'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 'school': 'Arizona', 'position': 'WR', 'class': 'Junior'},
-                {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'school': 'Michigan', 'position': 'DT', 'class': 'Junior'}
-            ]
-        }
-    ]
+    mock_drafts = reference_mock_drafts('fallback')
     
     print(f"✓ Loaded {len(mock_drafts)} mock drafts")
     return mock_drafts
 
-def create_super_condensed_document(mock_drafts):
-    """Create super condensed Word document with NFL-style pick layouts"""
+def define_condensed_styles(builder):
+    """Named styles of the condensed layout (also defined in every section worker)"""
+    builder.define_paragraph_style('Condensed Tight', space_before=Pt(0), space_after=Pt(0))
+    builder.define_paragraph_style('Condensed Layout', alignment=WD_ALIGN_PARAGRAPH.CENTER,
+                                   space_before=Pt(0), space_after=Pt(0))
+    builder.define_run_style('Condensed Author', size=Pt(14), bold=True, color=(0, 53, 148))
+
+def add_condensed_author_section(builder, draft):
+    """One author's header and pick layouts; runs in a worker process when rendering in parallel"""
+    
+    # Super minimal author header with all spacing removed
+    builder.text(f"{draft['author']}", style='Condensed Tight', run_style='Condensed Author')
+    
+    # Create NFL-style layouts for each pick
+    for pick in draft['picks']:
+        
+        # Create the NFL-style pick layout
+        layout_path = create_nfl_pick_layout(pick, draft['author'])
+        
+        # Add the layout image to document
+        try:
+            if os.path.exists(layout_path):
+                # Add image with minimal size and no spacing for condensed layout
+                builder.picture(layout_path, width=Inches(7.0), style='Condensed Layout')
+                
+        except Exception as e:
+            print(f"⚠️ Could not add layout for {draft['author']} Pick {pick['pick']}: {e}")
+    
+    # Minimal spacing between authors (just one small paragraph)
+    builder.paragraph(style='Condensed Tight')
+
+def create_super_condensed_document(mock_drafts, workers=1):
+    """Create super condensed Word document with NFL-style pick layouts
+
+    workers > 1 (or None for one per CPU) renders each author's section in its
+    own process and merges them in order.
+    """
     print("📄 Creating super condensed document...")
     
-    doc = Document()
+    builder = DocumentBuilder()
+    doc = builder.doc
+    define_condensed_styles(builder)
     
     # Extremely tight margins
     sections = doc.sections
@@ -299,44 +174,8 @@ def create_super_condensed_document(mock_drafts):
     date_para_run.font.size = Pt(9)
     
     # Process each author with minimal spacing
-    for draft in mock_drafts:
-        
-        # Super minimal author header
-        author_para = doc.add_paragraph()
-        author_run = author_para.add_run(f"{draft['author']}")
-        author_run.font.size = Pt(14)
-        author_run.font.bold = True
-        author_run.font.color.rgb = RGBColor(0, 53, 148)
-        
-        # Remove all spacing
-        author_para.space_before = Pt(0)
-        author_para.space_after = Pt(0)
-        
-        # Create NFL-style layouts for each pick
-        for pick in draft['picks']:
-            
-            # Create the NFL-style pick layout
-            layout_path = create_nfl_pick_layout(pick, draft['author'])
-            
-            # Add the layout image to document
-            try:
-                if os.path.exists(layout_path):
-                    # Add image with minimal size for condensed layout
-                    doc.add_picture(layout_path, width=Inches(7.0))
-                    
-                    # Remove all spacing from image
-                    last_paragraph = doc.paragraphs[-1]
-                    last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    last_paragraph.space_before = Pt(0)
-                    last_paragraph.space_after = Pt(0)
-                    
-            except Exception as e:
-                print(f"⚠️ Could not add layout for {draft['author']} Pick {pick['pick']}: {e}")
-        
-        # Minimal spacing between authors (just one small paragraph)
-        spacer = doc.add_paragraph("")
-        spacer.space_before = Pt(0)
-        spacer.space_after = Pt(0)
+    build_sections(builder, add_condensed_author_section, [(draft,) for draft in mock_drafts],
+                   workers=workers, define_styles=define_condensed_styles)
     
     # Save document
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -346,7 +185,14 @@ def create_super_condensed_document(mock_drafts):
     print(f"✓ Super condensed document saved: {output_path}")
     return output_path
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create the super condensed NFL.com-style mock draft document")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes rendering author sections (default: 1, in-process; 0 = one per CPU)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     print("=== Condensed NFL Layout Creator ===")
     print("✓ Creating NFL.com-style pick layouts")
     print("✓ Super condensed Word document")
@@ -359,9 +205,10 @@ def main():
     
     # Get mock draft data
     mock_drafts = get_comprehensive_mock_draft_data()
+    save_mock_drafts(mock_drafts)
     
     # Create condensed document
-    output_path = create_super_condensed_document(mock_drafts)
+    output_path = create_super_condensed_document(mock_drafts, workers=args.workers or None)
     
     print(f"\n🎉 SUCCESS! Super condensed document created!")
     print("=" * 45)
@@ -0,0 +1,9 @@
+"""pytest configuration: the unit tests need no browser or network"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# test_scraper.py is a live scrape run at import time, not a test module
+collect_ignore = ['test_scraper.py']
@@ -9,6 +9,7 @@ from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
 import os
+from nfl_player_registry import count_players
 
 def create_clean_layout_document():
     """Create a clean, simple Word document matching the image layout"""
@@ -169,8 +170,7 @@ def create_clean_layout_document():
         for pick in draft['picks']:
             all_players.append(pick['player'])
     
-    from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(5)
     
     doc.add_heading('Most Popular Players:', level=2)
@@ -9,6 +9,7 @@ from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
 import os
+from nfl_player_registry import count_players
 
 def create_enhanced_mock_draft_document():
     """Create an enhanced Word document with detailed picks and analysis"""
@@ -180,7 +181,7 @@ def create_enhanced_mock_draft_document():
                 all_players.append(pick['player'])
     
     from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(10)
     
     doc.add_heading('Most Frequently Selected Players:', level=2)
@@ -11,31 +11,26 @@ from datetime import datetime
 import os
 import requests
 import time
+from nfl_image_store import (get_image_store, find_headshot, store_downloaded_headshot,
+                             player_identity, placeholder_identity, HEADSHOT, PLACEHOLDER)
+from nfl_placeholder_renderer import get_font
+from nfl_docx_builder import add_picture_paragraph
+from nfl_player_registry import count_players
+from nfl_reference_data import headshot_sources
 
 def download_player_image(player_name, pick_number):
     """Download player image from a reliable source"""
     try:
-        # Create images directory
-        os.makedirs('processed/images', exist_ok=True)
-        
-        # Common player image URLs (these are example URLs - you may need to update them)
-        player_image_urls = {
-            'Cam Ward': 'https://a.espncdn.com/combiner/i?img=/i/headshots/college-football/players/full/4686261.png&w=350&h=254',
-            'Shedeur Sanders': 'https://a.espncdn.com/combiner/i?img=/i/headshots/college-football/players/full/4567048.png&w=350&h=254',
-            'Travis Hunter': 'https://a.espncdn.com/combiner/i?img=/i/headshots/college-football/players/full/4567049.png&w=350&h=254',
-            'Abdul Carter': 'https://a.espncdn.com/combiner/i?img=/i/headshots/college-football/players/full/4567050.png&w=350&h=254',
-            'Will Johnson': 'https://a.espncdn.com/combiner/i?img=/i/headshots/college-football/players/full/4567051.png&w=350&h=254'
-        }
-        
-        # If we don't have a specific URL, try a generic search approach
-        if player_name not in player_image_urls:
-            # Create a simple placeholder image name
-            filename = f"processed/images/player_{pick_number}_{player_name.replace(' ', '_')}.jpg"
+        # ESPN headshot from the shared reference data
+        sources = headshot_sources(player_name)
+        if not sources:
             return None
+        url = sources[0]
         
-        url = player_image_urls.get(player_name)
-        if not url:
-            return None
+        filename = find_headshot(player_name, [url])
+        if filename:
+            print(f"✓ Using stored image for {player_name}")
+            return filename
             
         # Download the image
         headers = {
@@ -46,9 +41,9 @@ def download_player_image(player_name, pick_number):
         response.raise_for_status()
         
         # Save the image
-        filename = f"processed/images/player_{pick_number}_{player_name.replace(' ', '_')}.jpg"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
+        filename = store_downloaded_headshot(player_name, url, response.content)
+        if not filename:
+            raise ValueError(f"{url} did not return an image")
             
         print(f"✓ Downloaded image for {player_name}")
         return filename
@@ -62,10 +57,8 @@ def create_sample_player_images():
     try:
         import PIL.Image
         import PIL.ImageDraw
-        import PIL.ImageFont
-        
-        os.makedirs('processed/images', exist_ok=True)
         
+        store = get_image_store()
         players = [
             ('Cam Ward', 1),
             ('Shedeur Sanders', 2), 
@@ -79,11 +72,8 @@ def create_sample_player_images():
             img = PIL.Image.new('RGB', (200, 250), color='lightblue')
             draw = PIL.ImageDraw.Draw(img)
             
-            # Try to use a font, fall back to default if not available
-            try:
-                font = PIL.ImageFont.truetype("Arial.ttf", 16)
-            except:
-                font = PIL.ImageFont.load_default()
+            # Cached font, falls back to default if not available
+            font = get_font(16)
             
             # Add player name to image
             text = f"{player_name}\nPick #{pick_num}"
@@ -96,8 +86,8 @@ def create_sample_player_images():
             
             draw.text((x, y), text, fill='black', font=font)
             
-            filename = f"processed/images/player_{pick_num}_{player_name.replace(' ', '_')}.jpg"
-            img.save(filename, 'JPEG')
+            store.put_image(img, placeholder_identity(player_name, pick_num, 'sample'), PLACEHOLDER,
+                            'create_sample_player_images', fmt='JPEG')
             
         print("✓ Created sample player images")
         return True
@@ -239,17 +229,18 @@ def create_layout_with_real_images():
             details_run.font.size = Inches(0.13)
             details_run.font.color.rgb = RGBColor(107, 114, 128)  # Gray color
             
-            # Try to add actual player image
-            image_filename = f"processed/images/player_{pick['pick']}_{pick['player'].replace(' ', '_')}.jpg"
+            # Try to add actual player image, falling back to the sample placeholder
+            store = get_image_store()
+            image_filename = (store.get(player_identity(pick['player']), kind=HEADSHOT) or
+                              store.get(placeholder_identity(pick['player'], pick['pick'], 'sample'), kind=PLACEHOLDER))
             
-            if os.path.exists(image_filename):
+            if image_filename:
                 try:
                     # Add the actual player image
                     image_para = doc.add_paragraph()
-                    doc.add_picture(image_filename, width=Inches(2.0))
+                    last_paragraph = add_picture_paragraph(doc, image_filename, width=Inches(2.0))
                     
                     # Center the image
-                    last_paragraph = doc.paragraphs[-1]
                     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     
                     print(f"✓ Added image for {pick['player']}")
@@ -292,8 +283,7 @@ def create_layout_with_real_images():
         for pick in draft['picks']:
             all_players.append(pick['player'])
     
-    from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(5)
     
     doc.add_heading('Most Popular Players:', level=2)
@@ -10,6 +10,7 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL
 from datetime import datetime
 import os
+from nfl_player_registry import count_players
 
 def create_visual_mock_draft_document():
     """Create a simplified visual Word document matching the image layout"""
@@ -215,8 +216,7 @@ def create_visual_mock_draft_document():
         for pick in draft['picks']:
             all_players.append(pick['player'])
     
-    from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(5)
     
     doc.add_heading('Most Frequently Selected Players:', level=2)
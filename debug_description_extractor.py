@@ -3,22 +3,15 @@
 Comprehensive debug script to understand exact pick-to-analysis mapping
 """
 
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, scroll_to
+from nfl_text_classifier import classify
 
 def setup_selenium():
     """Setup Selenium WebDriver"""
     try:
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1800,1400')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        
-        driver = webdriver.Chrome(options=chrome_options)
+        driver = get_driver()
         print("✓ Selenium WebDriver setup complete")
         return driver
     except Exception as e:
@@ -37,7 +30,7 @@ def comprehensive_mapping_analysis():
     try:
         print(f"🔍 Loading: {test_url}")
         driver.get(test_url)
-        time.sleep(8)
+        wait_for_page_ready(driver, ['.nfl-o-ranked-item'])
         
         # Remove overlays quickly
         overlay_selectors = [
@@ -57,11 +50,9 @@ def comprehensive_mapping_analysis():
         
         # Fast scroll to load content
         for i in range(6):
-            driver.execute_script(f"window.scrollTo(0, {2000 * (i+1)});")
-            time.sleep(1)
+            scroll_to(driver, 2000 * (i+1))
         
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        scroll_to(driver, 0)
         
         print("\n🎯 COMPREHENSIVE PICK-TO-ANALYSIS MAPPING:")
         
@@ -102,7 +93,7 @@ def comprehensive_mapping_analysis():
                 player_name = None
                 
                 for line in lines:
-                    if any(team in line.lower() for team in ['titans', 'browns', 'giants', 'patriots', 'raiders', 'jaguars', 'jets', 'panthers', 'saints', 'lions', 'cowboys', 'dolphins', 'colts', 'falcons', 'cardinals', 'bengals', 'vikings', 'buccaneers', 'broncos', 'chargers', 'steelers', 'packers', 'texans', 'rams', 'eagles', 'bills', 'chiefs', 'seahawks', 'commanders']):
+                    if 'team' in classify(line):
                         team_name = line
                     elif len(line.split()) == 2 and line[0].isupper() and 'pick' not in line.lower():
                         player_name = line
@@ -219,7 +210,7 @@ def comprehensive_mapping_analysis():
         import traceback
         traceback.print_exc()
     finally:
-        driver.quit()
+        release_driver(driver)
 
 if __name__ == "__main__":
     comprehensive_mapping_analysis() 
\ No newline at end of file
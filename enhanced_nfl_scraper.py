@@ -14,12 +14,17 @@ import re
 from datetime import datetime
 import time
 from urllib.parse import urljoin
-from collections import Counter
+from nfl_http_cache import create_cached_session
+from nfl_image_store import find_headshot, store_downloaded_headshot
+from nfl_docx_builder import add_picture_paragraph
+from nfl_draft_store import save_mock_drafts
+from nfl_player_registry import count_players
+from nfl_reference_data import sample_picks, team_names
 
 class EnhancedNFLMockDraftScraper:
     def __init__(self):
         self.base_url = "https://www.nfl.com"
-        self.session = requests.Session()
+        self.session = create_cached_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -34,16 +39,7 @@ class EnhancedNFLMockDraftScraper:
         self.images_folder = "processed/images"
         
         # NFL teams for recognition
-        self.nfl_teams = [
-            "Cleveland Browns", "New York Giants", "New England Patriots", "Carolina Panthers",
-            "Jacksonville Jaguars", "Tennessee Titans", "Las Vegas Raiders", "New York Jets",
-            "Chicago Bears", "New Orleans Saints", "Minnesota Vikings", "Denver Broncos",
-            "Detroit Lions", "Atlanta Falcons", "Arizona Cardinals", "Philadelphia Eagles",
-            "Los Angeles Chargers", "Pittsburgh Steelers", "Houston Texans", "Washington Commanders",
-            "Tampa Bay Buccaneers", "Seattle Seahawks", "Green Bay Packers", "Indianapolis Colts",
-            "Baltimore Ravens", "Cincinnati Bengals", "Buffalo Bills", "Miami Dolphins",
-            "Dallas Cowboys", "San Francisco 49ers", "Los Angeles Rams", "Kansas City Chiefs"
-        ]
+        self.nfl_teams = team_names()
         
     def get_page_content(self, url):
         """Fetch page content with error handling"""
@@ -55,8 +51,8 @@ class EnhancedNFLMockDraftScraper:
             print(f"Error fetching {url}: {e}")
             return None
             
-    def download_image(self, img_url, filename):
-        """Download and save player image"""
+    def download_image(self, img_url, player_name):
+        """Download player image into the shared image store"""
         try:
             if not img_url:
                 return None
@@ -66,18 +62,17 @@ class EnhancedNFLMockDraftScraper:
                 img_url = 'https:' + img_url
             elif img_url.startswith('/'):
                 img_url = self.base_url + img_url
+            
+            filepath = find_headshot(player_name, [img_url])
+            if filepath:
+                return filepath
                 
             response = self.session.get(img_url, timeout=15)
             response.raise_for_status()
             
-            # Create images directory if it doesn't exist
-            os.makedirs(self.images_folder, exist_ok=True)
-            
-            # Save image
-            filepath = os.path.join(self.images_folder, filename)
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-                
+            filepath = store_downloaded_headshot(player_name, img_url, response.content)
+            if not filepath:
+                print(f"Image at {img_url} could not be decoded")
             return filepath
             
         except Exception as e:
@@ -178,8 +173,7 @@ class EnhancedNFLMockDraftScraper:
         # Download images for picks
         for pick in picks[:10]:  # Limit to first 10 for demo
             if pick.get('player') and pick.get('image_url'):
-                filename = f"{pick['pick']}_{pick['player'].replace(' ', '_').replace('.', '')}.jpg"
-                image_path = self.download_image(pick['image_url'], filename)
+                image_path = self.download_image(pick['image_url'], pick['player'])
                 if image_path:
                     pick['image_path'] = image_path
         
@@ -189,30 +183,7 @@ class EnhancedNFLMockDraftScraper:
         """Create sample picks based on common 2025 mock draft players when extraction fails"""
         
         # Common top prospects in 2025 mock drafts
-        sample_picks = [
-            {'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 'position': 'QB', 'school': 'Miami', 
-             'reasoning': f'{author} believes Cam Ward is the most NFL-ready quarterback in this class with excellent arm strength and pocket presence.'},
-            {'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 'position': 'QB', 'school': 'Colorado',
-             'reasoning': f'{author} sees Sanders as having elite accuracy and football IQ, perfect for a Browns team needing a franchise quarterback.'},
-            {'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 'position': 'CB/WR', 'school': 'Colorado',
-             'reasoning': f'{author} values Hunter\'s rare two-way ability and game-changing talent on both sides of the ball.'},
-            {'pick': 4, 'team': 'New England Patriots', 'player': 'Ashton Jeanty', 'position': 'RB', 'school': 'Boise State',
-             'reasoning': f'{author} believes Jeanty is a generational running back talent who can transform an offense immediately.'},
-            {'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Tetairoa McMillan', 'position': 'WR', 'school': 'Arizona',
-             'reasoning': f'{author} sees McMillan as having the size and athleticism to be a true #1 receiver in the NFL.'},
-            {'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Abdul Carter', 'position': 'EDGE', 'school': 'Penn State',
-             'reasoning': f'{author} believes Carter has the pass rush upside to be a dominant edge defender.'},
-            {'pick': 7, 'team': 'New York Jets', 'player': 'Will Johnson', 'position': 'CB', 'school': 'Michigan',
-             'reasoning': f'{author} values Johnson\'s lockdown coverage ability and physicality in press coverage.'},
-            {'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 'position': 'DT', 'school': 'Michigan',
-             'reasoning': f'{author} sees Graham as a disruptive interior presence who can anchor a defense.'},
-            {'pick': 9, 'team': 'Chicago Bears', 'player': 'Kelvin Banks Jr.', 'position': 'OT', 'school': 'Texas',
-             'reasoning': f'{author} believes Banks has the technique and athleticism to be an elite left tackle.'},
-            {'pick': 10, 'team': 'New Orleans Saints', 'player': 'TreVeyon Henderson', 'position': 'RB', 'school': 'Ohio State',
-             'reasoning': f'{author} values Henderson\'s speed and big-play ability as a complementary offensive weapon.'}
-        ]
-        
-        return sample_picks
+        return sample_picks(author)
     
     def extract_mock_draft_data(self, url):
         """Extract enhanced mock draft data"""
@@ -365,8 +336,7 @@ class EnhancedNFLMockDraftScraper:
                     # Add player image if available
                     if pick.get('image_path') and os.path.exists(pick['image_path']):
                         try:
-                            doc.add_picture(pick['image_path'], width=Inches(2.5))
-                            last_paragraph = doc.paragraphs[-1]
+                            last_paragraph = add_picture_paragraph(doc, pick['image_path'], width=Inches(2.5))
                             last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                         except Exception as e:
                             print(f"Could not add image for {player_name}: {e}")
@@ -396,7 +366,7 @@ class EnhancedNFLMockDraftScraper:
                     all_players.append(pick['player'])
         
         if all_players:
-            player_counts = Counter(all_players)
+            player_counts = count_players(all_players)
             most_common = player_counts.most_common(10)
             
             doc.add_heading('Most Frequently Selected Players:', level=2)
@@ -427,6 +397,9 @@ class EnhancedNFLMockDraftScraper:
             all_mock_drafts.extend(mock_drafts)
             time.sleep(1)
         
+        # Keep every scraped draft for offline reports, not just the target authors
+        save_mock_drafts(all_mock_drafts)
+        
         # Filter by target authors
         filtered_drafts = self.filter_by_authors(all_mock_drafts)
         
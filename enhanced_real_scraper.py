@@ -15,6 +15,12 @@ from urllib.parse import urljoin
 from docx import Document
 from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from nfl_placeholder_renderer import render_placeholder
+from nfl_headshot_downloader import get_headshot_downloader, prefetch_headshots
+from nfl_docx_builder import add_picture_paragraph
+from nfl_draft_store import save_mock_drafts
+from nfl_player_registry import count_players
+from nfl_reference_data import headshot_sources, player_image_sources
 
 def get_real_nfl_mock_drafts():
     """Get actual mock draft data from NFL.com"""
@@ -113,54 +119,11 @@ def download_real_player_headshot(player_name, pick_number):
     
     print(f"📸 Getting real headshot for {player_name}...")
     
-    # Check if we already have this headshot
-    headshot_path = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-    if os.path.exists(headshot_path):
-        file_size = os.path.getsize(headshot_path)
-        if file_size > 50000:  # If file is large, it's probably a real photo
-            print(f"   ✓ Using existing headshot for {player_name}")
-            return headshot_path
-    
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
-    
-    # Known player IDs and image URLs (these would be updated with real data)
-    player_image_urls = {
-        'Cam Ward': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4686261.png',
-            'https://hurricanesports.com/images/2024/8/26/Cam_Ward_2024.jpg'
-        ],
-        'Shedeur Sanders': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567048.png',
-            'https://cubuffs.com/images/2024/8/15/Shedeur_Sanders_2024.jpg'
-        ],
-        'Travis Hunter': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567049.png',
-            'https://cubuffs.com/images/2024/8/15/Travis_Hunter_2024.jpg'
-        ],
-        'Abdul Carter': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567050.png',
-            'https://gopsusports.com/images/2024/8/15/Abdul_Carter_2024.jpg'
-        ]
-    }
-    
-    urls_to_try = player_image_urls.get(player_name, [])
-    
-    for url in urls_to_try:
-        try:
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Check if we got a valid image
-            if len(response.content) > 10000:  # At least 10KB
-                with open(headshot_path, 'wb') as f:
-                    f.write(response.content)
-                print(f"   ✓ Downloaded real headshot for {player_name}")
-                return headshot_path
-        except:
-            continue
+    # Raced across every mirror at once; reuses anything already in the image store
+    headshot_path = get_headshot_downloader().download(player_name, headshot_sources(player_name))
+    if headshot_path:
+        print(f"   ✓ Real headshot ready for {player_name}")
+        return headshot_path
     
     # If no real photo found, create a professional placeholder
     print(f"   ⚠️ Creating professional placeholder for {player_name}")
@@ -169,71 +132,7 @@ def download_real_player_headshot(player_name, pick_number):
 def create_professional_placeholder(player_name, pick_number):
     """Create professional placeholder headshot"""
     try:
-        from PIL import Image, ImageDraw, ImageFont
-        
-        # Create professional looking image
-        img = Image.new('RGB', (300, 400), color=(245, 245, 245))
-        draw = ImageDraw.Draw(img)
-        
-        # Add gradient background
-        for y in range(400):
-            color_value = int(245 - (y * 20 / 400))
-            draw.line([(0, y), (300, y)], fill=(color_value, color_value, color_value))
-        
-        # Add border
-        draw.rectangle([10, 10, 290, 390], outline=(100, 100, 100), width=3)
-        
-        # Try to load fonts
-        try:
-            font_large = ImageFont.truetype("Arial.ttf", 24)
-            font_medium = ImageFont.truetype("Arial.ttf", 18)
-            font_small = ImageFont.truetype("Arial.ttf", 14)
-        except:
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-        
-        # Add player name (split into first and last)
-        name_parts = player_name.split()
-        if len(name_parts) >= 2:
-            first_name = name_parts[0]
-            last_name = ' '.join(name_parts[1:])
-            
-            # Calculate text positions
-            bbox1 = draw.textbbox((0, 0), first_name, font=font_large)
-            bbox2 = draw.textbbox((0, 0), last_name, font=font_large)
-            
-            w1, h1 = bbox1[2] - bbox1[0], bbox1[3] - bbox1[1]
-            w2, h2 = bbox2[2] - bbox2[0], bbox2[3] - bbox2[1]
-            
-            x1 = (300 - w1) // 2
-            x2 = (300 - w2) // 2
-            y1 = 150
-            y2 = 185
-            
-            draw.text((x1, y1), first_name, fill=(50, 50, 50), font=font_large)
-            draw.text((x2, y2), last_name, fill=(50, 50, 50), font=font_large)
-        
-        # Add pick number
-        pick_text = f"2025 NFL Draft Pick #{pick_number}"
-        bbox = draw.textbbox((0, 0), pick_text, font=font_small)
-        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-        x = (300 - w) // 2
-        draw.text((x, 250), pick_text, fill=(100, 100, 100), font=font_small)
-        
-        # Add team logo area placeholder
-        draw.rectangle([100, 300, 200, 350], outline=(150, 150, 150), width=2)
-        logo_text = "TEAM"
-        bbox = draw.textbbox((0, 0), logo_text, font=font_small)
-        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-        x = 150 - w//2
-        draw.text((x, 320), logo_text, fill=(150, 150, 150), font=font_small)
-        
-        filename = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-        img.save(filename, 'PNG')
-        
-        return filename
-        
+        return render_placeholder(player_name, pick_number, 'professional')
     except Exception as e:
         print(f"   ⚠️ Could not create placeholder for {player_name}: {e}")
         return None
@@ -243,6 +142,9 @@ def create_final_document_with_headshots(mock_drafts):
     
     print("📄 Creating final document with real headshots...")
     
+    # Fetch every headshot in one parallel batch before laying out picks
+    prefetch_headshots(mock_drafts, player_image_sources())
+    
     doc = Document()
     
     # Title page
@@ -308,10 +210,9 @@ def create_final_document_with_headshots(mock_drafts):
             if headshot_path and os.path.exists(headshot_path):
                 try:
                     # Add the headshot image
-                    doc.add_picture(headshot_path, width=Inches(2.0))
+                    last_paragraph = add_picture_paragraph(doc, headshot_path, width=Inches(2.0))
                     
                     # Center the image
-                    last_paragraph = doc.paragraphs[-1]
                     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     
                 except Exception as e:
@@ -338,8 +239,7 @@ def create_final_document_with_headshots(mock_drafts):
         for pick in draft['picks']:
             all_players.append(pick['player'])
     
-    from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(10)
     
     doc.add_heading('Most Frequently Mocked Players:', level=2)
@@ -367,6 +267,7 @@ def main():
     
     # Get real mock draft data
     mock_drafts = get_real_nfl_mock_drafts()
+    save_mock_drafts(mock_drafts)
     
     # Create final document
     output_path = create_final_document_with_headshots(mock_drafts)
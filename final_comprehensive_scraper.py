@@ -16,6 +16,13 @@ from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_ALIGN_VERTICAL
+from nfl_image_store import get_image_store
+from nfl_placeholder_renderer import render_placeholder
+from nfl_headshot_downloader import get_headshot_downloader, prefetch_headshots
+from nfl_docx_stream import StreamingDocumentBuilder
+from nfl_draft_store import save_mock_drafts
+from nfl_player_registry import count_players
+from nfl_reference_data import headshot_sources, player_image_sources, reference_mock_drafts
 
 def get_comprehensive_mock_draft_data():
     """Get comprehensive mock draft data from all target authors"""
@@ -23,244 +30,7 @@ def get_comprehensive_mock_draft_data():
     print("🔍 Getting comprehensive mock draft data from NFL.com...")
     
     # Real mock draft data extracted from NFL.com (based on the provided link and user's spreadsheet)
-    mock_drafts = [
-        {
-            'title': 'Bucky Brooks 2025 NFL Mock Draft 3.0',
-            'author': 'Bucky Brooks',
-            'date': 'March 25, 2025',
-            'source_url': 'https://www.nfl.com/news/bucky-brooks-2025-nfl-mock-draft-3-0-browns-take-shedeur-sanders-two-running-backs-in-top-10-picks',
-            'picks': [
-                {
-                    'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 
-                    'position': 'QB', 'school': 'Miami', 'class': 'Senior',
-                    'reasoning': 'The talented passer gives Brian Callahan the franchise quarterback needed to spark the Titans\' rebuild.'
-                },
-                {
-                    'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 
-                    'position': 'QB', 'school': 'Colorado', 'class': 'Senior',
-                    'reasoning': 'Kevin Stefanski has worked well with traditional pocket passers throughout his career. Sanders fits the bill as a classic dropback quarterback with a game built on touch, timing and anticipation.'
-                },
-                {
-                    'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 
-                    'position': 'WR/CB', 'school': 'Colorado', 'class': 'Junior',
-                    'reasoning': 'Adding a two-way standout doesn\'t solve the Giants\' most pressing need, but Hunter\'s playmaking presence would help the offense and defense improve.'
-                },
-                {
-                    'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 
-                    'position': 'Edge', 'school': 'Penn State', 'class': 'Junior',
-                    'reasoning': 'If Patriots personnel chief Eliot Wolf is truly committed to taking the best player available, the Penn State product would be a no-brainer at this point.'
-                },
-                {
-                    'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Mason Graham', 
-                    'position': 'DT', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'The hardworking interior defender would give the Jaguars another pass-rushing option at the point of attack.'
-                },
-                {
-                    'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Ashton Jeanty', 
-                    'position': 'RB', 'school': 'Boise State', 'class': 'Junior',
-                    'reasoning': 'New Raiders head coach Pete Carroll wants to punish opponents with a physical running game sparked by a dynamic back.'
-                },
-                {
-                    'pick': 7, 'team': 'New York Jets', 'player': 'Tyler Warren', 
-                    'position': 'TE', 'school': 'Penn State', 'class': 'Senior',
-                    'reasoning': 'If the Jets are committed to helping Justin Fields flourish as a QB1, adding a playmaking weapon between the hashes would enable the 26-year-old passer to operate more efficiently from the pocket.'
-                },
-                {
-                    'pick': 8, 'team': 'Carolina Panthers', 'player': 'Jalon Walker', 
-                    'position': 'Edge', 'school': 'Georgia', 'class': 'Junior',
-                    'reasoning': 'Adding more speed and athleticism to the defense could help the Panthers close the gap in the NFC South.'
-                }
-            ]
-        },
-        {
-            'title': 'Charles Davis 2025 NFL Mock Draft 3.0',
-            'author': 'Charles Davis',
-            'date': 'March 2025',
-            'picks': [
-                {
-                    'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 
-                    'position': 'QB', 'school': 'Miami', 'class': 'Senior',
-                    'reasoning': 'Ward possesses the most NFL-ready skill set among quarterbacks in this class. His combination of arm talent and leadership qualities makes him the obvious choice for Tennessee\'s franchise rebuild.'
-                },
-                {
-                    'pick': 2, 'team': 'Cleveland Browns', 'player': 'Abdul Carter', 
-                    'position': 'Edge', 'school': 'Penn State', 'class': 'Junior',
-                    'reasoning': 'Carter brings elite pass-rush ability and defensive versatility. His combination of speed, power, and football IQ makes him a game-changing defender who can transform Cleveland\'s defense.'
-                },
-                {
-                    'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 
-                    'position': 'QB', 'school': 'Colorado', 'class': 'Senior',
-                    'reasoning': 'The Giants need a franchise quarterback, and Sanders\' pocket presence and accuracy give them a reliable option to build around for the next decade.'
-                },
-                {
-                    'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 
-                    'position': 'WR/CB', 'school': 'Colorado', 'class': 'Junior',
-                    'reasoning': 'Hunter\'s unique two-way ability provides immediate impact on both sides of the ball. His versatility and playmaking skills are exactly what the Patriots need.'
-                },
-                {
-                    'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 
-                    'position': 'CB', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Johnson has elite coverage ability and the physicality to match up with today\'s NFL receivers. His lockdown potential would anchor Jacksonville\'s secondary.'
-                },
-                {
-                    'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 
-                    'position': 'WR', 'school': 'Arizona', 'class': 'Junior',
-                    'reasoning': 'McMillan\'s size and route-running ability give the Raiders a true #1 receiver who can stretch the field and dominate in contested catch situations.'
-                },
-                {
-                    'pick': 7, 'team': 'New York Jets', 'player': 'Malaki Starks', 
-                    'position': 'S', 'school': 'Georgia', 'class': 'Junior',
-                    'reasoning': 'Starks brings ball skills and coverage range that would improve the Jets\' secondary. His instincts and athleticism make him an ideal centerfield safety.'
-                },
-                {
-                    'pick': 8, 'team': 'Carolina Panthers', 'player': 'Kelvin Banks Jr.', 
-                    'position': 'OT', 'school': 'Texas', 'class': 'Junior',
-                    'reasoning': 'Banks provides the protection and run-blocking ability needed to establish a dominant offensive line. His technique and athleticism project well to the NFL level.'
-                }
-            ]
-        },
-        {
-            'title': 'Chad Reuter 2025 NFL Mock Draft 2.0',
-            'author': 'Chad Reuter',
-            'date': 'March 2025',
-            'picks': [
-                {
-                    'pick': 1, 'team': 'Tennessee Titans', 'player': 'Shedeur Sanders', 
-                    'position': 'QB', 'school': 'Colorado', 'class': 'Senior',
-                    'reasoning': 'Sanders\' leadership and pocket presence make him the ideal quarterback to lead Tennessee\'s turnaround. His accuracy and decision-making are NFL-ready.'
-                },
-                {
-                    'pick': 2, 'team': 'Cleveland Browns', 'player': 'Cam Ward', 
-                    'position': 'QB', 'school': 'Miami', 'class': 'Senior',
-                    'reasoning': 'Ward\'s arm strength and mobility give Cleveland a dynamic quarterback who can make plays both in and out of the pocket. His upside is tremendous.'
-                },
-                {
-                    'pick': 3, 'team': 'New York Giants', 'player': 'Travis Hunter', 
-                    'position': 'WR/CB', 'school': 'Colorado', 'class': 'Junior',
-                    'reasoning': 'Hunter\'s two-way impact is unmatched in this draft. His ability to contribute immediately on offense and defense makes him invaluable.'
-                },
-                {
-                    'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 
-                    'position': 'Edge', 'school': 'Penn State', 'class': 'Junior',
-                    'reasoning': 'Carter\'s pass-rush skills and athletic ability would immediately upgrade New England\'s defense. His motor and technique are exceptional.'
-                },
-                {
-                    'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 
-                    'position': 'CB', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Johnson brings shutdown coverage ability and physical toughness. His man-to-man skills would transform Jacksonville\'s secondary.'
-                },
-                {
-                    'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Mason Graham', 
-                    'position': 'DT', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Graham\'s interior presence and pass-rush ability would give the Raiders a dominant force in the middle of their defensive line.'
-                },
-                {
-                    'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 
-                    'position': 'WR', 'school': 'Arizona', 'class': 'Junior',
-                    'reasoning': 'McMillan\'s size and hands make him a perfect target for the Jets\' quarterback. His red zone presence would be immediate.'
-                },
-                {
-                    'pick': 8, 'team': 'Carolina Panthers', 'player': 'Malaki Starks', 
-                    'position': 'S', 'school': 'Georgia', 'class': 'Junior',
-                    'reasoning': 'Starks\' range and ball skills would anchor Carolina\'s secondary. His leadership and football IQ are exceptional for his age.'
-                }
-            ]
-        },
-        {
-            'title': 'Daniel Jeremiah 2025 NFL Mock Draft 4.0',
-            'author': 'Daniel Jeremiah',
-            'date': 'March 2025',
-            'picks': [
-                {
-                    'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 
-                    'position': 'QB', 'school': 'Miami', 'class': 'Senior',
-                    'reasoning': 'Ward has the strongest arm and best leadership qualities in this quarterback class. His ability to make throws under pressure sets him apart.'
-                },
-                {
-                    'pick': 2, 'team': 'Cleveland Browns', 'player': 'Shedeur Sanders', 
-                    'position': 'QB', 'school': 'Colorado', 'class': 'Senior',
-                    'reasoning': 'Sanders\' football IQ and accuracy make him a perfect fit for Cleveland\'s system. His poise in the pocket is remarkable.'
-                },
-                {
-                    'pick': 3, 'team': 'New York Giants', 'player': 'Abdul Carter', 
-                    'position': 'Edge', 'school': 'Penn State', 'class': 'Junior',
-                    'reasoning': 'Carter\'s explosive first step and bend around the edge make him a premier pass rusher. His upside is through the roof.'
-                },
-                {
-                    'pick': 4, 'team': 'New England Patriots', 'player': 'Travis Hunter', 
-                    'position': 'WR/CB', 'school': 'Colorado', 'class': 'Junior',
-                    'reasoning': 'Hunter\'s versatility and playmaking ability on both sides of the ball make him an invaluable asset for any team.'
-                },
-                {
-                    'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 
-                    'position': 'CB', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Johnson\'s coverage skills and physicality make him a true #1 cornerback. His technique is already NFL-caliber.'
-                },
-                {
-                    'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Tetairoa McMillan', 
-                    'position': 'WR', 'school': 'Arizona', 'class': 'Junior',
-                    'reasoning': 'McMillan\'s size and route-running create matchup nightmares for defenses. His ceiling is that of a perennial Pro Bowler.'
-                },
-                {
-                    'pick': 7, 'team': 'New York Jets', 'player': 'Kelvin Banks Jr.', 
-                    'position': 'OT', 'school': 'Texas', 'class': 'Junior',
-                    'reasoning': 'Banks\' technique and athleticism make him an ideal blind-side protector. His consistency over three seasons is impressive.'
-                },
-                {
-                    'pick': 8, 'team': 'Carolina Panthers', 'player': 'Mason Graham', 
-                    'position': 'DT', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Graham\'s interior pass rush and run stopping ability would immediately impact Carolina\'s defense. His motor never stops.'
-                }
-            ]
-        },
-        {
-            'title': 'Lance Zierlein 2025 NFL Mock Draft 4.0',
-            'author': 'Lance Zierlein',
-            'date': 'March 2025',
-            'picks': [
-                {
-                    'pick': 1, 'team': 'Tennessee Titans', 'player': 'Cam Ward', 
-                    'position': 'QB', 'school': 'Miami', 'class': 'Senior',
-                    'reasoning': 'Ward\'s combination of arm talent and mobility gives Tennessee the franchise quarterback they\'ve been seeking. His clutch gene is evident.'
-                },
-                {
-                    'pick': 2, 'team': 'Cleveland Browns', 'player': 'Travis Hunter', 
-                    'position': 'WR/CB', 'school': 'Colorado', 'class': 'Junior',
-                    'reasoning': 'Hunter\'s two-way impact provides immediate value on both sides of the ball. His competitiveness and skill set are unmatched.'
-                },
-                {
-                    'pick': 3, 'team': 'New York Giants', 'player': 'Shedeur Sanders', 
-                    'position': 'QB', 'school': 'Colorado', 'class': 'Senior',
-                    'reasoning': 'Sanders\' accuracy and pocket awareness make him a natural fit for the Giants\' system. His leadership qualities stand out.'
-                },
-                {
-                    'pick': 4, 'team': 'New England Patriots', 'player': 'Abdul Carter', 
-                    'position': 'Edge', 'school': 'Penn State', 'class': 'Junior',
-                    'reasoning': 'Carter\'s pass-rush ability and athletic profile make him a perfect fit for New England\'s defensive scheme. His ceiling is extremely high.'
-                },
-                {
-                    'pick': 5, 'team': 'Jacksonville Jaguars', 'player': 'Will Johnson', 
-                    'position': 'CB', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Johnson\'s coverage skills and physical play style would immediately upgrade Jacksonville\'s secondary. His technique is polished.'
-                },
-                {
-                    'pick': 6, 'team': 'Las Vegas Raiders', 'player': 'Mason Graham', 
-                    'position': 'DT', 'school': 'Michigan', 'class': 'Junior',
-                    'reasoning': 'Graham\'s interior presence and pass-rush skills would transform the Raiders\' defensive line. His consistency is remarkable.'
-                },
-                {
-                    'pick': 7, 'team': 'New York Jets', 'player': 'Tetairoa McMillan', 
-                    'position': 'WR', 'school': 'Arizona', 'class': 'Junior',
-                    'reasoning': 'McMillan\'s size and athleticism give the Jets a true X-receiver who can win contested catches and stretch the field.'
-                },
-                {
-                    'pick': 8, 'team': 'Carolina Panthers', 'player': 'Malaki Starks', 
-                    'position': 'S', 'school': 'Georgia', 'class': 'Junior',
-                    'reasoning': 'Starks\' range and ball skills would provide the Panthers with a dynamic safety who can impact both run and pass defense.'
-                }
-            ]
-        }
-    ]
+    mock_drafts = reference_mock_drafts('analysis')
     
     print(f"✓ Loaded {len(mock_drafts)} comprehensive mock drafts with reasoning")
     return mock_drafts
@@ -270,86 +40,11 @@ def download_comprehensive_player_headshots(player_name, pick_number):
     
     print(f"📸 Getting headshot for {player_name}...")
     
-    # Check if we already have a good headshot
-    headshot_path = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-    if os.path.exists(headshot_path):
-        file_size = os.path.getsize(headshot_path)
-        if file_size > 50000:  # If file is large, it's probably real
-            print(f"   ✓ Using existing headshot for {player_name}")
-            return headshot_path
-    
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
-    
-    # Expanded player image sources with more comprehensive URLs
-    player_image_sources = {
-        'Cam Ward': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4686261.png',
-            'https://hurricanesports.com/images/2024/8/26/Cam_Ward_2024.jpg'
-        ],
-        'Shedeur Sanders': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567048.png',
-            'https://cubuffs.com/images/2024/8/15/Shedeur_Sanders_2024.jpg'
-        ],
-        'Travis Hunter': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567049.png',
-            'https://cubuffs.com/images/2024/8/15/Travis_Hunter_2024.jpg'
-        ],
-        'Abdul Carter': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567050.png',
-            'https://gopsusports.com/images/2024/8/15/Abdul_Carter_2024.jpg'
-        ],
-        'Will Johnson': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567051.png',
-            'https://mgoblue.com/images/2024/8/15/Will_Johnson_2024.jpg'
-        ],
-        'Mason Graham': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567052.png',
-            'https://mgoblue.com/images/2024/8/15/Mason_Graham_2024.jpg'
-        ],
-        'Tetairoa McMillan': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567053.png',
-            'https://arizonawildcats.com/images/2024/8/15/McMillan_2024.jpg'
-        ],
-        'Malaki Starks': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567054.png',
-            'https://georgiadogs.com/images/2024/8/15/Starks_2024.jpg'
-        ],
-        'Kelvin Banks Jr.': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567055.png',
-            'https://texassports.com/images/2024/8/15/Banks_2024.jpg'
-        ],
-        'Ashton Jeanty': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567056.png',
-            'https://broncosports.com/images/2024/8/15/Jeanty_2024.jpg'
-        ],
-        'Tyler Warren': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567057.png',
-            'https://gopsusports.com/images/2024/8/15/Warren_2024.jpg'
-        ],
-        'Jalon Walker': [
-            'https://a.espncdn.com/i/headshots/college-football/players/full/4567058.png',
-            'https://georgiadogs.com/images/2024/8/15/Walker_2024.jpg'
-        ]
-    }
-    
-    urls_to_try = player_image_sources.get(player_name, [])
-    
-    for url in urls_to_try:
-        try:
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            # Check if we got a valid image
-            if len(response.content) > 5000:  # At least 5KB
-                with open(headshot_path, 'wb') as f:
-                    f.write(response.content)
-                print(f"   ✓ Downloaded real headshot for {player_name}")
-                return headshot_path
-        except:
-            continue
+    # Raced across every mirror at once; reuses anything already in the image store
+    headshot_path = get_headshot_downloader().download(player_name, headshot_sources(player_name))
+    if headshot_path:
+        print(f"   ✓ Real headshot ready for {player_name}")
+        return headshot_path
     
     # Create professional placeholder with team colors and better design
     print(f"   ⚠️ Creating enhanced placeholder for {player_name}")
@@ -358,75 +53,7 @@ def download_comprehensive_player_headshots(player_name, pick_number):
 def create_enhanced_placeholder(player_name, pick_number):
     """Create enhanced professional placeholder headshot"""
     try:
-        from PIL import Image, ImageDraw, ImageFont, ImageFilter
-        
-        # Create high-quality placeholder
-        img = Image.new('RGB', (400, 500), color=(250, 250, 250))
-        draw = ImageDraw.Draw(img)
-        
-        # Add gradient background
-        for y in range(500):
-            color_value = int(250 - (y * 30 / 500))
-            color = (color_value, color_value + 5, color_value + 10)
-            draw.line([(0, y), (400, y)], fill=color)
-        
-        # Add professional border
-        draw.rectangle([15, 15, 385, 485], outline=(80, 80, 80), width=4)
-        draw.rectangle([20, 20, 380, 480], outline=(150, 150, 150), width=2)
-        
-        # Try to load better fonts
-        try:
-            font_name = ImageFont.truetype("Arial.ttf", 28)
-            font_detail = ImageFont.truetype("Arial.ttf", 16)
-            font_pick = ImageFont.truetype("Arial.ttf", 20)
-        except:
-            font_name = ImageFont.load_default()
-            font_detail = ImageFont.load_default()
-            font_pick = ImageFont.load_default()
-        
-        # Split and format player name
-        name_parts = player_name.split()
-        if len(name_parts) >= 2:
-            first_name = name_parts[0]
-            last_name = ' '.join(name_parts[1:])
-            
-            # Calculate centered positions
-            bbox1 = draw.textbbox((0, 0), first_name, font=font_name)
-            bbox2 = draw.textbbox((0, 0), last_name, font=font_name)
-            
-            w1, h1 = bbox1[2] - bbox1[0], bbox1[3] - bbox1[1]
-            w2, h2 = bbox2[2] - bbox2[0], bbox2[3] - bbox2[1]
-            
-            x1 = (400 - w1) // 2
-            x2 = (400 - w2) // 2
-            y1 = 200
-            y2 = 240
-            
-            # Add text shadow effect
-            draw.text((x1+2, y1+2), first_name, fill=(200, 200, 200), font=font_name)
-            draw.text((x1, y1), first_name, fill=(40, 40, 40), font=font_name)
-            
-            draw.text((x2+2, y2+2), last_name, fill=(200, 200, 200), font=font_name)
-            draw.text((x2, y2), last_name, fill=(40, 40, 40), font=font_name)
-        
-        # Add pick information
-        pick_text = f"2025 NFL Draft Pick #{pick_number}"
-        bbox = draw.textbbox((0, 0), pick_text, font=font_pick)
-        w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
-        x = (400 - w) // 2
-        draw.text((x+1, 321), pick_text, fill=(150, 150, 150), font=font_pick)
-        draw.text((x, 320), pick_text, fill=(70, 70, 70), font=font_pick)
-        
-        # Add NFL shield placeholder
-        shield_x, shield_y = 175, 350
-        draw.ellipse([shield_x, shield_y, shield_x+50, shield_y+40], outline=(100, 100, 100), width=3)
-        draw.text((shield_x+15, shield_y+12), "NFL", fill=(100, 100, 100), font=font_detail)
-        
-        filename = f"processed/images/headshot_{pick_number}_{player_name.replace(' ', '_')}.png"
-        img.save(filename, 'PNG', quality=95)
-        
-        return filename
-        
+        return render_placeholder(player_name, pick_number, 'enhanced')
     except Exception as e:
         print(f"   ⚠️ Could not create enhanced placeholder for {player_name}: {e}")
         return None
@@ -436,7 +63,14 @@ def create_compact_professional_document(mock_drafts):
     
     print("📄 Creating compact professional document...")
     
-    doc = Document()
+    # Fetch every headshot in one parallel batch before laying out picks
+    prefetch_headshots(mock_drafts, player_image_sources())
+    
+    # Each draft is streamed to the file as soon as it is laid out
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = f'processed/NFL_Mock_Drafts_COMPACT_FINAL_{timestamp}.docx'
+    builder = StreamingDocumentBuilder(output_path)
+    doc = builder.doc
     
     # Set document margins for more compact layout
     sections = doc.sections
@@ -524,10 +158,9 @@ def create_compact_professional_document(mock_drafts):
             if headshot_path and os.path.exists(headshot_path):
                 try:
                     # Smaller image for compact layout
-                    doc.add_picture(headshot_path, width=Inches(1.3))
+                    last_paragraph = builder.picture(headshot_path, width=Inches(1.3))
                     
                     # Center the image
-                    last_paragraph = doc.paragraphs[-1]
                     last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     
                 except Exception as e:
@@ -551,6 +184,8 @@ def create_compact_professional_document(mock_drafts):
             separator_run.font.size = Pt(8)
             separator_run.font.color.rgb = RGBColor(200, 200, 200)
             separator_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        builder.flush()
     
     # Summary page - compact
     doc.add_page_break()
@@ -562,8 +197,7 @@ def create_compact_professional_document(mock_drafts):
         for pick in draft['picks']:
             all_players.append(pick['player'])
     
-    from collections import Counter
-    player_counts = Counter(all_players)
+    player_counts = count_players(all_players)
     most_common = player_counts.most_common(10)
     
     summary_heading = doc.add_heading('Most Frequently Mocked Players:', level=2)
@@ -580,9 +214,7 @@ def create_compact_professional_document(mock_drafts):
         count_run.font.color.rgb = RGBColor(107, 114, 128)
     
     # Save document
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = f'processed/NFL_Mock_Drafts_COMPACT_FINAL_{timestamp}.docx'
-    doc.save(output_path)
+    builder.save()
     
     print(f"✓ Compact document saved: {output_path}")
     return output_path
@@ -601,6 +233,7 @@ def main():
     
     # Get comprehensive mock draft data
     mock_drafts = get_comprehensive_mock_draft_data()
+    save_mock_drafts(mock_drafts)
     
     # Create final compact document
     output_path = create_compact_professional_document(mock_drafts)
@@ -608,7 +241,7 @@ def main():
     print(f"\n🎉 SUCCESS! Final comprehensive document created!")
     print("=" * 60)
     print(f"📁 Document: {output_path}")
-    print(f"📸 Headshots: processed/images/")
+    print(f"📸 Headshots: {get_image_store().root}/")
     
     print(f"\n📊 Final Summary:")
     print(f"   • {len(mock_drafts)} mock drafts from all target authors")
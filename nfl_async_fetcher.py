@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+NFL Async Fetcher - Concurrent article fetch stage with per-host politeness
+Fetches many URLs at once over one pooled keep-alive session, limiting each host
+with a token bucket and retrying transient failures with jittered backoff
+"""
+
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+import requests
+from nfl_http_cache import create_cached_session
+
+# Status codes worth retrying: rate limited or transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncArticleFetcher:
+    """Fetch article HTML for many URLs concurrently"""
+
+    def __init__(self, session=None, concurrency=8, rate_per_host=2.0, burst=2,
+                 retries=3, backoff=0.5, timeout=30):
+        self.session = session or create_cached_session(pool_maxsize=concurrency)
+        self.concurrency = concurrency
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.buckets = {}
+        self.latencies = {}
+
+    def _bucket_for(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+        return self.buckets[host]
+
+    def _is_cached(self, url):
+        """Fresh cache entries are served locally and need no politeness delay"""
+        cache = getattr(self.session, 'cache', None)
+        if cache is None:
+            return False
+        entry = cache.lookup(url)
+        return bool(entry and cache.is_fresh(entry))
+
+    def _get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        if response.status_code in RETRY_STATUSES:
+            raise requests.HTTPError(f"{response.status_code} from {url}", response=response)
+        response.raise_for_status()
+        return response.text
+
+    async def fetch(self, url, semaphore):
+        """Fetch one URL, returning its text or None after exhausting retries"""
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                if not self._is_cached(url):
+                    await self._bucket_for(url).acquire()
+                started = time.perf_counter()
+                try:
+                    text = await asyncio.to_thread(self._get, url)
+                    self.latencies[url] = time.perf_counter() - started
+                    return text
+                except requests.RequestException as e:
+                    status = getattr(e.response, 'status_code', None) if isinstance(e, requests.HTTPError) else None
+                    if attempt == self.retries or (status is not None and status not in RETRY_STATUSES):
+                        print(f"   ⚠️ Giving up on {url}: {e}")
+                        return None
+                    delay = self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                    print(f"   ↻ Retry {attempt + 1}/{self.retries} for {url} in {delay:.1f}s ({e})")
+                    await asyncio.sleep(delay)
+
+    async def fetch_all_async(self, urls):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(url, semaphore) for url in unique_urls))
+        return dict(zip(unique_urls, results))
+
+    def fetch_all(self, urls):
+        """Fetch every URL concurrently; returns {url: html or None} in input order"""
+        started = time.perf_counter()
+        pages = asyncio.run(self.fetch_all_async(urls))
+        fetched = sum(1 for html in pages.values() if html)
+        print(f"⚡ Fetched {fetched}/{len(pages)} pages in {time.perf_counter() - started:.1f}s")
+        return pages
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+NFL Capture Manifest - Incremental re-runs of the screenshot capture
+Records per article URL the hash of its parsed pick list, when it was captured and
+the files produced, so unchanged articles reuse their assets instead of a browser pass
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from nfl_http_cache import create_cached_session
+from nfl_offline_extractor import extract_picks
+
+MANIFEST_PATH = 'processed/capture_manifest.json'
+
+# Everything on a pick card that shows up in a screenshot or description
+HASH_FIELDS = ('pick', 'team', 'player', 'school', 'position', 'class', 'analysis', 'headshot_url')
+
+# {author}_pick_{n}.png, or the .jpg/.webp an optimization pass renamed it to
+PICK_FILE_PATTERN = re.compile(r'_pick_(\d+)\.\w+$')
+
+
+def pick_list_hash(picks):
+    """Stable SHA-256 of a pick list in nfl_offline_extractor format"""
+    rows = [[pick.get(field) for field in HASH_FIELDS] for pick in picks]
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def pick_numbers(files):
+    """Pick numbers of the per-pick crops among files (headers, sections and full pages have none)"""
+    matches = (PICK_FILE_PATTERN.search(os.path.basename(path)) for path in files)
+    return sorted(int(match.group(1)) for match in matches if match)
+
+
+def fetch_pick_hash(session, url, max_picks=32):
+    """(hash, pick count) of the article's current pick list, (None, 0) when it cannot be determined
+
+    The GET is sent with Cache-Control: no-cache, so the shared HTTP cache
+    revalidates it (usually a 304) instead of trusting a fresh entry.
+    """
+    response = session.get(url, timeout=30, headers={'Cache-Control': 'no-cache'})
+    response.raise_for_status()
+    picks = extract_picks(response.content, max_picks=max_picks)
+    return (pick_list_hash(picks), len(picks)) if picks else (None, 0)
+
+
+class CaptureManifest:
+    """JSON manifest: {url: {author, content_hash, pick_count, captured_at, files, descriptions, players}}"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, url, content_hash):
+        """True when url was captured from identical content and its files still exist"""
+        entry = self.entries.get(url)
+        return bool(content_hash and entry and entry['content_hash'] == content_hash and entry['files']
+                    and entry.get('pick_count')
+                    and all(os.path.exists(path) for path in entry['files']))
+
+    def record(self, url, author, content_hash, pick_count, files, descriptions, players=None):
+        """Store a capture only if it holds one crop per hashed pick
+
+        Section, full-page and partial captures are failures to retry, so any
+        previous entry for url is dropped instead and the next run captures again.
+        """
+        files = [path for path in files if isinstance(path, str) and os.path.exists(path)]
+        if not content_hash or pick_numbers(files) != list(range(1, pick_count + 1)):
+            self.entries.pop(url, None)  # Nothing reusable; capture again next run
+            return
+        self.entries[url] = {
+            'author': author,
+            'content_hash': content_hash,
+            'pick_count': pick_count,
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'files': files,
+            'descriptions': {str(pick): text for pick, text in (descriptions or {}).items()},
+            'players': players,
+        }
+
+    def files(self, url):
+        return list(self.entries[url]['files'])
+
+    def descriptions(self, url):
+        return {int(pick): text for pick, text in self.entries[url]['descriptions'].items()}
+
+    def players(self, url):
+        return self.entries[url].get('players')
+
+
+def split_unchanged(creator, manifest, session=None):
+    """Restore unchanged authors from the manifest into creator
+
+    Returns ({author: reused screenshot paths}, {author: (current content hash, pick count)}).
+    Authors missing from the first dict need a fresh capture.
+    """
+    session = session or create_cached_session()
+    reused, hashes = {}, {}
+    for author, url in creator.author_urls.items():
+        try:
+            hashes[author] = fetch_pick_hash(session, url)
+        except Exception as e:
+            print(f"   ⚠️ Could not check {author} for changes: {e}")
+            hashes[author] = (None, 0)
+
+        if manifest.is_current(url, hashes[author][0]):
+            reused[author] = manifest.files(url)
+            creator.pick_descriptions[author] = manifest.descriptions(url)
+            if manifest.players(url) is not None:
+                creator.pick_players[author] = manifest.players(url)
+            print(f"   ♻️ {author}: unchanged since {manifest.entries[url]['captured_at']}, reusing "
+                  f"{len(reused[author])} screenshots")
+        else:
+            print(f"   🔄 {author}: new or changed, will re-capture")
+    return reused, hashes
+
+
+def record_captured(creator, manifest, captured, hashes):
+    """Store freshly captured authors (final, post-optimization paths) in the manifest"""
+    for author, files in captured.items():
+        url = creator.author_urls[author]
+        content_hash, pick_count = hashes.get(author, (None, 0))
+        manifest.record(url, author, content_hash, pick_count, files,
+                        creator.pick_descriptions.get(author), creator.pick_players.get(author))
+    manifest.save()
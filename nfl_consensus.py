@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+NFL Consensus Ranking - Vectorized player consensus across many mock drafts
+Selections are laid out as a players x authors pick matrix so frequency, pick
+statistics, weighted consensus and team affinity come out of one NumPy pass
+"""
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from nfl_player_registry import canonical_name
+
+CONSENSUS_COLUMNS = ['player', 'selections', 'weighted_share', 'mean_pick', 'median_pick',
+                     'min_pick', 'max_pick', 'pick_std', 'top_team', 'team_share']
+
+
+def recency_weights(published, half_life_days=30.0):
+    """{author: weight} halving every half_life_days an article is older than the newest one
+
+    published maps author -> publication date (datetime or ISO string);
+    authors without a usable date get the weight of the oldest dated article.
+    """
+    dates = {}
+    for author, date in published.items():
+        try:
+            dates[author] = date if isinstance(date, datetime) else datetime.fromisoformat(str(date)[:19])
+        except (TypeError, ValueError):
+            dates[author] = None
+    known = [date for date in dates.values() if date is not None]
+    if not known:
+        return {author: 1.0 for author in published}
+    newest, oldest = max(known), min(known)
+    return {author: 0.5 ** ((newest - (date or oldest)).total_seconds() / 86400 / half_life_days)
+            for author, date in dates.items()}
+
+
+def pick_matrix(selections):
+    """(players, authors, matrix) with matrix[i, j] = author j's pick for player i, NaN if not picked
+
+    selections are {name, pick, author} dicts as kept by the ranking analyzers;
+    names are joined through the player registry, and an author who lists a
+    player twice counts their earliest pick.
+    """
+    frame = pd.DataFrame.from_records(selections, columns=['name', 'pick', 'author'])
+    player_codes, players = pd.factorize(frame['name'].map(canonical_name))
+    author_codes, authors = pd.factorize(frame['author'])
+    picks = (pd.DataFrame({'p': player_codes, 'a': author_codes, 'pick': frame['pick'].astype(float)})
+             .groupby(['p', 'a'], sort=False)['pick'].min())
+    matrix = np.full((len(players), len(authors)), np.nan)
+    matrix[picks.index.get_level_values('p'), picks.index.get_level_values('a')] = picks.to_numpy()
+    return list(players), list(authors), matrix
+
+
+def selected_by(selections):
+    """{player: {author: pick}} joined exactly as pick_matrix does, for per-author detail lines"""
+    players, authors, matrix = pick_matrix(selections)
+    return {player: {author: int(pick) for author, pick in zip(authors, row) if not np.isnan(pick)}
+            for player, row in zip(players, matrix)}
+
+
+def team_affinity(selections, players):
+    """(top team, share of the player's selections made by that team) per player, aligned to players"""
+    frame = pd.DataFrame.from_records(selections, columns=['name', 'author', 'team']).dropna(subset=['team'])
+    if frame.empty:
+        return [None] * len(players), np.zeros(len(players))
+    frame['name'] = frame['name'].map(canonical_name)
+    counts = frame.drop_duplicates(['name', 'author']).groupby(['name', 'team']).size().rename('count')
+    top = counts.sort_values(ascending=False, kind='stable').groupby(level='name').head(1)
+    top = top.reset_index(level='team').reindex(players)
+    teams = top['team'].astype(object).where(top['team'].notna(), None)
+    return teams.tolist(), top['count'].fillna(0).to_numpy()
+
+
+def consensus_rankings(selections, author_weights=None):
+    """DataFrame of CONSENSUS_COLUMNS, one row per player, in consensus order (rank = row + 1)
+
+    weighted_share is the weighted fraction of authors who selected the player
+    (weights default to 1 per author, see recency_weights). Players are ordered
+    by weighted_share, then mean pick, then name.
+    """
+    if not selections:
+        return pd.DataFrame(columns=CONSENSUS_COLUMNS)
+
+    players, authors, matrix = pick_matrix(selections)
+    selected = ~np.isnan(matrix)
+    weights = np.array([(author_weights or {}).get(author, 1.0) for author in authors])
+
+    counts = selected.sum(axis=1)
+    top_team, top_team_count = team_affinity(selections, players)
+    table = pd.DataFrame({
+        'player': players,
+        'selections': counts,
+        'weighted_share': (selected * weights).sum(axis=1) / weights.sum(),
+        'mean_pick': np.nanmean(matrix, axis=1),
+        'median_pick': np.nanmedian(matrix, axis=1),
+        'min_pick': np.nanmin(matrix, axis=1),
+        'max_pick': np.nanmax(matrix, axis=1),
+        'pick_std': np.nanstd(matrix, axis=1),
+        'top_team': top_team,
+        'team_share': top_team_count / counts,
+    })
+    table = table.sort_values(['weighted_share', 'mean_pick', 'player'],
+                              ascending=[False, True, True], kind='stable')
+    return table.reset_index(drop=True)
+
+
+def ranked_counts(rankings):
+    """[(player, selections)] in consensus order, the shape the analyzers return"""
+    return [(player, int(count)) for player, count in zip(rankings['player'], rankings['selections'])]
+
+
+def describe_consensus(row):
+    """One-line pick summary for a consensus row, for the ranking documents"""
+    summary = f"Avg pick {row['mean_pick']:.1f} • Median {row['median_pick']:g}"
+    if row['min_pick'] != row['max_pick']:
+        summary += f" • Range #{row['min_pick']:g}–#{row['max_pick']:g} • Std dev {row['pick_std']:.1f}"
+    if pd.notna(row['top_team']):
+        summary += f" • Most often to {row['top_team']} ({row['team_share']:.0%})"
+    return summary
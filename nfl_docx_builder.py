@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+NFL Docx Builder - Linear-time Word document assembly on top of python-docx
+Every add call returns the paragraph/run it created, so callers never rescan
+doc.paragraphs, and formatting is defined once as named styles and applied by id
+"""
+
+import hashlib
+import io
+import time
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_BREAK
+from docx.image.image import Image as DocxImage
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.oxml import OxmlElement
+from docx.oxml.shape import CT_Inline
+from docx.parts.image import ImagePart
+from docx.shared import RGBColor
+from docx.text.paragraph import Paragraph
+from PIL import Image
+
+# recompress= options: lossless keeps the original bytes
+RECOMPRESS_MODES = (None, 'palette', 'jpeg')
+
+
+def recompress_image(data, mode, jpeg_quality=85):
+    """Re-encode image bytes; returns the smaller of the original and the re-encoding
+
+    'palette' quantizes to a 256-colour PNG (screenshots shrink ~4x with little
+    visible change); 'jpeg' writes a quality-85 JPEG.
+    """
+    if mode is None:
+        return data
+    with Image.open(io.BytesIO(data)) as img:
+        if mode == 'palette' and img.mode == 'P':
+            return data  # Already palette-encoded (e.g. by nfl_image_pipeline)
+        img = img.convert('RGB')
+        buffer = io.BytesIO()
+        if mode == 'palette':
+            img.quantize(256, method=Image.Quantize.FASTOCTREE).save(buffer, 'PNG')
+        elif mode == 'jpeg':
+            img.save(buffer, 'JPEG', quality=jpeg_quality, optimize=True)
+        else:
+            raise ValueError(f"Unknown recompress mode: {mode}")
+    encoded = buffer.getvalue()
+    return encoded if len(encoded) < len(data) else data
+
+
+class DocumentBuilder:
+    """Append-only builder whose add_* methods are O(1) in document length"""
+
+    def __init__(self, doc=None, recompress=None):
+        if recompress not in RECOMPRESS_MODES:
+            raise ValueError(f"recompress must be one of {RECOMPRESS_MODES}")
+        self.doc = doc if doc is not None else Document()
+        self.recompress = recompress
+        self.body = self.doc.element.body
+        # Looked up once: finding it per append would scan every body child
+        self.sect_pr = self.body.sectPr
+        self.style_ids = {}
+        # python-docx finds a free drawing id by scanning every @id in the document
+        # per picture; the builder seeds a counter from that scan once instead
+        self.next_shape_id = None
+
+        # Embedded media keyed by SHA-256 of the source bytes: identical images share one part
+        self.media = {}
+        # python-docx's get_or_add_image SHA1-scans every image part and searches for a
+        # free partname and rId per image; new parts are numbered from these counters
+        self.next_image_number = 1
+        self.image_partnames = None
+        self.media_stats = {'pictures': 0, 'source_bytes': 0, 'embedded_bytes': 0,
+                            'deduplicated_bytes': 0, 'recompressed_bytes': 0}
+
+    # -- styles -----------------------------------------------------------
+
+    @staticmethod
+    def _apply_font(font, size=None, bold=None, italic=None, color=None, name=None):
+        if size is not None:
+            font.size = size
+        if bold is not None:
+            font.bold = bold
+        if italic is not None:
+            font.italic = italic
+        if color is not None:
+            font.color.rgb = color if isinstance(color, RGBColor) else RGBColor(*color)
+        if name is not None:
+            font.name = name
+
+    def _get_or_add_style(self, name, style_type):
+        try:
+            return self.doc.styles[name]
+        except KeyError:
+            return self.doc.styles.add_style(name, style_type)
+
+    def define_run_style(self, name, size=None, bold=None, italic=None, color=None, font=None):
+        """Register a character style once; runs then reference it by id"""
+        if name not in self.style_ids:
+            style = self._get_or_add_style(name, WD_STYLE_TYPE.CHARACTER)
+            self._apply_font(style.font, size, bold, italic, color, font)
+            self.style_ids[name] = style.style_id
+        return name
+
+    def define_paragraph_style(self, name, alignment=None, space_before=None, space_after=None,
+                               size=None, bold=None, italic=None, color=None, font=None, base='Normal'):
+        """Register a paragraph style (layout plus default font) once"""
+        if name not in self.style_ids:
+            style = self._get_or_add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            if base:
+                style.base_style = self.doc.styles[base]
+            fmt = style.paragraph_format
+            if alignment is not None:
+                fmt.alignment = alignment
+            if space_before is not None:
+                fmt.space_before = space_before
+            if space_after is not None:
+                fmt.space_after = space_after
+            self._apply_font(style.font, size, bold, italic, color, font)
+            self.style_ids[name] = style.style_id
+        return name
+
+    def _style_id(self, name, style_type):
+        style_id = self.style_ids.get(name)
+        if style_id is None:
+            style = self.doc.styles[name]
+            if style.type != style_type:
+                raise ValueError(f"Style '{name}' is not a {style_type} style")
+            style_id = self.style_ids[name] = style.style_id
+        return style_id
+
+    # -- content ----------------------------------------------------------
+
+    def paragraph(self, text='', style=None):
+        """Append a paragraph before the final section properties and return it"""
+        p = OxmlElement('w:p')
+        if self.sect_pr is not None:
+            self.sect_pr.addprevious(p)
+        else:
+            self.body.append(p)
+        paragraph = Paragraph(p, self.doc._body)
+        if style:
+            p.get_or_add_pPr().style = self._style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        if text:
+            paragraph.add_run(text)
+        return paragraph
+
+    def run(self, paragraph, text='', style=None):
+        """Append a run to paragraph, optionally with a registered character style"""
+        run = paragraph.add_run(text)
+        if style:
+            run._r.get_or_add_rPr().style = self._style_id(style, WD_STYLE_TYPE.CHARACTER)
+        return run
+
+    def text(self, text, style=None, run_style=None):
+        """Paragraph holding a single (optionally styled) run"""
+        paragraph = self.paragraph(style=style)
+        self.run(paragraph, text, run_style)
+        return paragraph
+
+    def heading(self, text, level=1):
+        return self.paragraph(text, 'Title' if level == 0 else f'Heading {level}')
+
+    def _shape_id(self):
+        if self.next_shape_id is None:
+            self.next_shape_id = self.doc.part.next_id
+        shape_id = self.next_shape_id
+        self.next_shape_id += 1
+        return shape_id
+
+    @staticmethod
+    def _read_image(image_path_or_stream):
+        if hasattr(image_path_or_stream, 'read'):
+            image_path_or_stream.seek(0)
+            return image_path_or_stream.read()
+        with open(image_path_or_stream, 'rb') as f:
+            return f.read()
+
+    def _media_part(self, image_path_or_stream):
+        """(rId, Image) for the source, embedding each distinct image only once"""
+        data = self._read_image(image_path_or_stream)
+        digest = hashlib.sha256(data).hexdigest()
+        stats = self.media_stats
+        stats['pictures'] += 1
+        stats['source_bytes'] += len(data)
+
+        if digest in self.media:
+            stats['deduplicated_bytes'] += len(data)
+            return self.media[digest]
+
+        embedded = recompress_image(data, self.recompress)
+        stats['recompressed_bytes'] += len(data) - len(embedded)
+        stats['embedded_bytes'] += len(embedded)
+        self.media[digest] = self._embed_image(embedded)
+        return self.media[digest]
+
+    def _embed_image(self, data):
+        """(rId, Image) of a new image part holding data, related to the document in O(1)"""
+        image = DocxImage.from_blob(data)
+        package = self.doc.part.package
+        if self.image_partnames is None:
+            # Parts of a loaded document: scanned once, then only the counter moves
+            self.image_partnames = {part.partname for part in package.image_parts}
+        rels = self.doc.part.rels
+        while True:
+            number = self.next_image_number
+            self.next_image_number += 1
+            rId, partname = f'rIdPicture{number}', PackURI(f'/word/media/picture{number}.{image.ext}')
+            if rId not in rels and partname not in self.image_partnames:
+                break
+        part = ImagePart.from_image(image, partname)
+        package.image_parts.append(part)
+        self.image_partnames.add(partname)
+        rels.add_relationship(RT.IMAGE, part, rId)
+        return rId, image
+
+    def picture(self, image_path_or_stream, width=None, height=None, style=None):
+        """Picture in its own paragraph; returns that paragraph
+
+        Pictures added through the builder take ids from its own counter, so add
+        them all through the builder rather than mixing in doc.add_picture.
+        """
+        rId, image = self._media_part(image_path_or_stream)
+        cx, cy = image.scaled_dimensions(width, height)
+        inline = CT_Inline.new_pic_inline(self._shape_id(), rId, image.filename, cx, cy)
+
+        paragraph = self.paragraph(style=style)
+        paragraph.add_run()._r.add_drawing(inline)
+        return paragraph
+
+    def page_break(self):
+        paragraph = self.paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def save(self, path):
+        started = time.perf_counter()
+        self.doc.save(path)
+        self.media_stats['save_seconds'] = time.perf_counter() - started
+        return path
+
+    def print_media_report(self):
+        """Bytes saved by media de-duplication and recompression"""
+        stats = self.media_stats
+        saved = stats['source_bytes'] - stats['embedded_bytes']
+        print(f"🗜️ Media: {stats['pictures']} pictures, {len(self.media)} embedded, "
+              f"{stats['source_bytes'] / 1e6:.1f} MB → {stats['embedded_bytes'] / 1e6:.1f} MB "
+              f"(dedup {stats['deduplicated_bytes'] / 1e6:.1f} MB, "
+              f"recompress {stats['recompressed_bytes'] / 1e6:.1f} MB, {saved / 1e6:.1f} MB saved)")
+        if 'save_seconds' in stats:
+            print(f"   Saved in {stats['save_seconds']:.2f}s")
+
+
+def add_picture_paragraph(doc, image_path_or_stream, width=None, height=None):
+    """doc.add_picture that returns the picture's paragraph instead of needing doc.paragraphs[-1]"""
+    paragraph = doc.add_paragraph()
+    paragraph.add_run().add_picture(image_path_or_stream, width, height)
+    return paragraph
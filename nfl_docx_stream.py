@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+NFL Docx Stream - Word documents written section by section instead of all at once
+A StreamingDocumentBuilder appends like DocumentBuilder, but flush() moves the
+finished body XML to a temp file and every image goes straight into the .docx
+zip, so memory stays bounded by one section no matter how many drafts it holds
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from lxml import etree
+from docx.image.image import Image as DocxImage
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Emu
+from nfl_docx_builder import DocumentBuilder
+
+
+class StreamedImage:
+    """Size and name of an image already written to the zip (its bytes are not kept)"""
+
+    def __init__(self, image):
+        self.filename = image.filename
+        self.width = image.width
+        self.height = image.height
+
+    def scaled_dimensions(self, width=None, height=None):
+        """Same rule as docx Image: a missing dimension keeps the aspect ratio"""
+        if width is None and height is None:
+            return self.width, self.height
+        if width is None:
+            width = round(self.width * float(height) / float(self.height))
+        if height is None:
+            height = round(self.height * float(width) / float(self.width))
+        return Emu(width), Emu(height)
+
+
+class StreamingDocumentBuilder(DocumentBuilder):
+    """DocumentBuilder that writes each flushed section straight to path
+
+    Call flush() after each author (or any other unit of content); save()
+    flushes what is left and finishes the package. Pictures must be added
+    through picture(): doc.add_picture would keep the image in memory.
+    """
+
+    def __init__(self, path, doc=None, recompress=None):
+        super().__init__(doc, recompress)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        self.body_xml = tempfile.TemporaryFile()
+        self.media_rels = []      # (rId, target relative to word/)
+        self.media_types = {}     # extension -> content type
+        # Namespace declarations the root element already makes; stripped from each flushed element
+        self.root_declarations = [
+            (f' xmlns:{prefix}="{uri}"' if prefix else f' xmlns="{uri}"').encode()
+            for prefix, uri in self.doc.element.nsmap.items()
+        ]
+        self.media_stats['flushes'] = 0
+        self.media_stats['body_bytes'] = 0
+
+    def _embed_image(self, data):
+        """(rId, StreamedImage) for data, written to the zip right away rather than kept in the package"""
+        image = DocxImage.from_blob(data)
+        number = len(self.media_rels) + 1
+        rId, target = f'rIdStream{number}', f'media/stream{number}.{image.ext}'
+        self.zip.writestr(f'word/{target}', data)
+        self.media_rels.append((rId, target))
+        self.media_types[image.ext] = image.content_type
+        return rId, StreamedImage(image)
+
+    def _serialize(self, element):
+        xml = etree.tostring(element, encoding='utf-8')
+        end = xml.index(b'>')
+        opening = xml[:end]
+        for declaration in self.root_declarations:
+            opening = opening.replace(declaration, b'', 1)
+        return opening + xml[end:]
+
+    def flush(self):
+        """Move every body element written so far to the temp file; returns how many"""
+        flushed = 0
+        for element in list(self.body):
+            if element is self.sect_pr:
+                continue
+            xml = self._serialize(element)
+            self.body_xml.write(xml)
+            self.media_stats['body_bytes'] += len(xml)
+            self.body.remove(element)
+            flushed += 1
+        if flushed:
+            self.media_stats['flushes'] += 1
+        return flushed
+
+    def _with_media_rels(self, rels_xml):
+        rels = etree.fromstring(rels_xml)
+        for rId, target in self.media_rels:
+            etree.SubElement(rels, '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship',
+                             Id=rId, Type=RT.IMAGE, Target=target)
+        return etree.tostring(rels, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    def _with_media_types(self, types_xml):
+        types = etree.fromstring(types_xml)
+        namespace = '{http://schemas.openxmlformats.org/package/2006/content-types}'
+        known = {default.get('Extension').lower() for default in types.iter(f'{namespace}Default')}
+        for extension, content_type in self.media_types.items():
+            if extension.lower() not in known:
+                types.insert(0, etree.Element(f'{namespace}Default', Extension=extension, ContentType=content_type))
+        return etree.tostring(types, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    def _write_document(self, name, document_xml):
+        """Template document.xml with the streamed body spliced in before its sectPr"""
+        start = document_xml.index(b'<w:body>') + len(b'<w:body>')
+        end = document_xml.find(b'<w:sectPr', start)
+        if end == -1:
+            end = document_xml.index(b'</w:body>', start)
+        self.body_xml.seek(0)
+        with self.zip.open(name, 'w') as out:
+            out.write(document_xml[:start])
+            shutil.copyfileobj(self.body_xml, out, 1 << 20)
+            out.write(document_xml[end:])
+
+    def save(self, path=None):
+        """Flush the remaining body and write the other package parts; returns the output path"""
+        if path is not None and path != self.path:
+            raise ValueError(f"StreamingDocumentBuilder writes to {self.path}, not {path}")
+        started = time.perf_counter()
+        self.flush()
+
+        # With the body flushed, the in-memory package holds only styles, settings and the sectPr
+        package = tempfile.SpooledTemporaryFile()
+        self.doc.save(package)
+        document_name = self.doc.part.partname.lstrip('/')
+        rels_name = self.doc.part.partname.rels_uri.lstrip('/')
+        with zipfile.ZipFile(package) as template:
+            for name in template.namelist():
+                data = template.read(name)
+                if name == document_name:
+                    self._write_document(name, data)
+                    continue
+                if name == rels_name:
+                    data = self._with_media_rels(data)
+                elif name == '[Content_Types].xml':
+                    data = self._with_media_types(data)
+                self.zip.writestr(name, data)
+        self.close()
+        self.media_stats['save_seconds'] = time.perf_counter() - started
+        return self.path
+
+    def close(self):
+        """Release the zip and temp file (save() calls this; call it directly to abandon a document)"""
+        self.zip.close()
+        self.body_xml.close()
+
+    def print_media_report(self):
+        super().print_media_report()
+        stats = self.media_stats
+        print(f"   Streamed {stats['body_bytes'] / 1e6:.1f} MB of body XML in {stats['flushes']} flushes")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+NFL Draft Pipeline - Screenshots, descriptions and player rankings in one pass
+Each article is loaded once; the same page yields the pick screenshots, the pick
+descriptions and the player selections that feed the ranking document
+"""
+
+import argparse
+from nfl_driver_factory import add_profile_argument
+from nfl_player_ranking_analyzer_enhanced import NFLPlayerRankingAnalyzerEnhanced
+from nfl_screenshot_complete import NFLScreenshotComplete, run_capture
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the screenshot and player-ranking documents from one capture pass")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of concurrent headless Chrome sessions (default: 1, sequential)")
+    parser.add_argument('--per-element', action='store_true',
+                        help="Screenshot each pick separately instead of cropping one full-page capture")
+    parser.add_argument('--optimize', choices=['palette', 'jpeg', 'png', 'none'], default='palette',
+                        help="Downscale and re-encode captured screenshots (default: palette)")
+    parser.add_argument('--recompress', choices=['palette', 'jpeg', 'none'], default='none',
+                        help="Lossy re-encoding of screenshots before embedding them in the document "
+                             "(default: none, embed as captured)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-capture authors whose articles changed since the last run")
+    add_profile_argument(parser)
+    return parser.parse_args()
+
+
+def rank_from_capture(creator, analyzer):
+    """Feed the player selections read during capture into the ranking analyzer
+
+    Authors whose page yielded no picks fall back to the analyzer's own
+    (cached, offline-first) extraction.
+    """
+    for author, url in creator.author_urls.items():
+        picks = creator.pick_players.get(author)
+        if picks:
+            print(f"🔍 {author}: {len(picks)} selections from the capture pass")
+            players = analyzer.record_picks(author, picks)
+        else:
+            players = analyzer.extract_players_from_author(url, author)
+        analyzer.all_players.extend(players)
+
+    print(f"\n✓ Analysis complete! Found {len(analyzer.all_players)} total player selections")
+
+
+def main():
+    args = parse_args()
+    workers = max(1, args.workers)
+
+    print("=== NFL Draft Pipeline ===")
+    print("📸 Screenshots, descriptions and player rankings from one page load per author")
+    print("=" * 60)
+
+    # The browser is started by run_capture, and only if something needs capturing
+    creator = NFLScreenshotComplete(setup_driver=False, full_page=not args.per_element,
+                                    profile=args.profile, collect_players=True)
+
+    analyzer = NFLPlayerRankingAnalyzerEnhanced()
+    analyzer.author_urls = creator.author_urls
+
+    try:
+        all_screenshots = run_capture(creator, workers, args.optimize, args.incremental)
+        if not all_screenshots:
+            return
+
+        # The browser work is done; everything below reads from the capture results
+        rank_from_capture(creator, analyzer)
+
+        screenshot_path = creator.create_word_document(
+            all_screenshots, recompress=None if args.recompress == 'none' else args.recompress)
+        ranking_path, ranked_players = analyzer.create_player_ranking_document()
+
+        print(f"\n🎉 SUCCESS! Both documents built from a single capture pass")
+        print("=" * 60)
+        print(f"📁 Screenshots: {screenshot_path}")
+        print(f"📁 Rankings: {ranking_path}")
+        print(f"📊 Top 10 Most Selected Players:")
+        for rank, (player_name, count) in enumerate(ranked_players[:10], 1):
+            print(f"   {rank:2d}. {player_name} ({count} selections)")
+
+    finally:
+        creator.cleanup()
+        analyzer.cleanup()
+
+
+if __name__ == "__main__":
+    main()
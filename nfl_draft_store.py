@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+NFL Draft Store - Persistent SQLite store for mock drafts, picks and analysis text
+Scrapers bulk-upsert what they extract; reports and rankings can then be rebuilt
+from the database without touching the network
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import threading
+import time
+from nfl_image_store import player_identity
+from nfl_player_registry import ALIASES_PATH, canonical_name, get_player_registry
+
+DEFAULT_DB_PATH = 'processed/nfl_drafts.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    school TEXT,
+    position TEXT,
+    class TEXT,
+    headshot_url TEXT,
+    merged_into INTEGER REFERENCES players(id)
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT,
+    author_id INTEGER NOT NULL REFERENCES authors(id),
+    published TEXT,
+    draft_year INTEGER,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS picks (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    pick_number INTEGER NOT NULL,
+    team_id INTEGER REFERENCES teams(id),
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    PRIMARY KEY (article_id, pick_number)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS analysis (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    pick_number INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (article_id, pick_number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS picks_by_player ON picks(player_id);
+CREATE INDEX IF NOT EXISTS picks_by_team ON picks(team_id);
+CREATE INDEX IF NOT EXISTS picks_by_number ON picks(pick_number);
+CREATE INDEX IF NOT EXISTS articles_by_author ON articles(author_id);
+"""
+
+# Scrapers name the per-pick write-up differently
+ANALYSIS_FIELDS = ('analysis', 'reasoning', 'description')
+
+PICK_ROWS_SQL = """
+SELECT au.name AS author, ar.url, ar.title, ar.published, ar.draft_year,
+       p.pick_number AS pick, t.name AS team, pl.name AS player, pl.school, pl.position,
+       pl.class, pl.headshot_url, an.text AS analysis
+FROM picks p
+JOIN articles ar ON ar.id = p.article_id
+JOIN authors au ON au.id = ar.author_id
+JOIN players pl ON pl.id = p.player_id
+LEFT JOIN teams t ON t.id = p.team_id
+LEFT JOIN analysis an ON an.article_id = p.article_id AND an.pick_number = p.pick_number
+"""
+
+SQL_CHUNK = 500  # Stay well under SQLite's bound-variable limit
+
+
+def article_key(draft):
+    """Article URL, or a stable local key for hand-entered drafts without one"""
+    url = draft.get('url') or draft.get('source_url')
+    return url or f"local:{draft.get('author', 'Unknown')}:{draft.get('title', '')}"
+
+
+def draft_year(draft):
+    """Draft year from the title ('2025 NFL Mock Draft'), else the publication year"""
+    match = re.search(r'\b(20\d\d)\b', draft.get('title') or '')
+    if match:
+        return int(match.group(1))
+    match = re.match(r'(20\d\d)', str(draft.get('date') or ''))
+    return int(match.group(1)) if match else None
+
+
+def pick_analysis(pick):
+    for field in ANALYSIS_FIELDS:
+        if pick.get(field):
+            return pick[field]
+    return None
+
+
+class DraftStore:
+    """SQLite-backed mock draft database with bulk upserts and indexed lookups"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self._add_missing_columns()
+
+    def close(self):
+        self.conn.close()
+
+    def _add_missing_columns(self):
+        """Bring databases created before a column existed up to SCHEMA (rows are untouched)"""
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(players)')}
+        if 'merged_into' not in columns:
+            self.conn.execute('ALTER TABLE players ADD COLUMN merged_into INTEGER REFERENCES players(id)')
+
+    def migrate_player_keys(self, dry_run=False):
+        """Re-derive stored player keys through the registry; returns (merged, re-keyed)
+
+        Only exact matches join rows: the same normalized name or an alias table
+        entry. Picks of a duplicate move to the kept (oldest, or already correctly
+        keyed) row; the duplicate stays in players with merged_into set, so a
+        wrong alias can be undone. Run explicitly, never on open.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT id, key, name FROM players WHERE merged_into IS NULL ORDER BY id').fetchall()
+            groups = {}
+            for row in rows:
+                groups.setdefault(player_identity(row['name']), []).append(row)
+
+            merged, changed = [], []
+            for key, group in groups.items():
+                keep = next((row for row in group if row['key'] == key), group[0])
+                merged.extend((keep['id'], row['id']) for row in group if row is not keep)
+                if keep['key'] != key:
+                    changed.append((key, keep['id']))
+            if dry_run or (not merged and not changed):
+                return len(merged), len(changed)
+
+            keepers = {row_id for _, row_id in changed}
+            with self.conn:
+                for keep_id, duplicate_id in merged:
+                    self.conn.execute('UPDATE picks SET player_id = ? WHERE player_id = ?', (keep_id, duplicate_id))
+                    self.conn.execute("""
+                        UPDATE players SET
+                            school = COALESCE(school, (SELECT school FROM players WHERE id = :dup)),
+                            position = COALESCE(position, (SELECT position FROM players WHERE id = :dup)),
+                            class = COALESCE(class, (SELECT class FROM players WHERE id = :dup)),
+                            headshot_url = COALESCE(headshot_url, (SELECT headshot_url FROM players WHERE id = :dup))
+                        WHERE id = :keep
+                    """, {'keep': keep_id, 'dup': duplicate_id})
+                    self.conn.execute('UPDATE players SET merged_into = ? WHERE id = ? OR merged_into = ?',
+                                      (keep_id, duplicate_id, duplicate_id))
+                # Rows (merged or not) holding a key a kept row now needs move aside; then two steps
+                # so a new key never collides with an old one still in place
+                for key, keep_id in changed:
+                    self.conn.execute("UPDATE players SET key = 'merged:' || id || ':' || key WHERE key = ? AND id != ?",
+                                      (key, keep_id))
+                self.conn.executemany("UPDATE players SET key = '~' || id WHERE id = ?", [(row_id,) for row_id in keepers])
+                self.conn.executemany('UPDATE players SET key = ? WHERE id = ?', changed)
+        print(f"♻️ Player keys: merged {len(merged)} and re-keyed {len(changed)} stored players")
+        return len(merged), len(changed)
+
+    def candidate_merges(self):
+        """[(name, name, score)] stored players whose names look alike; review, then add aliases"""
+        with self.lock:
+            names = [row[0] for row in self.conn.execute('SELECT name FROM players WHERE merged_into IS NULL')]
+        registry = get_player_registry()
+        registry.register(names)
+        stored = set(names)
+        return [pair for pair in registry.candidate_merges() if pair[0] in stored and pair[1] in stored]
+
+    # -- upserts ----------------------------------------------------------
+
+    def _ensure_names(self, table, names):
+        """{name: id} for authors/teams, inserting new names in one statement"""
+        names = sorted({name for name in names if name})
+        self.conn.executemany(f'INSERT INTO {table}(name) VALUES (?) ON CONFLICT(name) DO NOTHING',
+                              [(name,) for name in names])
+        ids = {}
+        for start in range(0, len(names), SQL_CHUNK):
+            chunk = names[start:start + SQL_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            ids.update(self.conn.execute(f'SELECT name, id FROM {table} WHERE name IN ({placeholders})', chunk))
+        return ids
+
+    def _ensure_players(self, picks):
+        """{player key: id}; non-empty details (school, position, ...) overwrite stored ones"""
+        rows = {}
+        for pick in picks:
+            key = player_identity(pick['player'])
+            row = (key, canonical_name(pick['player']), pick.get('school') or None, pick.get('position') or None,
+                   pick.get('class') or None, pick.get('headshot_url') or None)
+            previous = rows.get(key)
+            # Within a batch the first row is kept and gaps are filled from later picks
+            rows[key] = row if previous is None else tuple(old or new for old, new in zip(previous, row))
+        self.conn.executemany("""
+            INSERT INTO players(key, name, school, position, class, headshot_url) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                school = COALESCE(excluded.school, players.school),
+                position = COALESCE(excluded.position, players.position),
+                class = COALESCE(excluded.class, players.class),
+                headshot_url = COALESCE(excluded.headshot_url, players.headshot_url)
+        """, list(rows.values()))
+        keys = list(rows)
+        ids = {}
+        for start in range(0, len(keys), SQL_CHUNK):
+            chunk = keys[start:start + SQL_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            ids.update(self.conn.execute(
+                f'SELECT key, COALESCE(merged_into, id) FROM players WHERE key IN ({placeholders})', chunk))
+        return ids
+
+    def upsert_mock_drafts(self, mock_drafts, merge=False):
+        """Insert or update mock drafts in one transaction; returns picks written
+
+        Each draft is {title, author, date, url|source_url, picks: [...]} with picks
+        in the nfl_offline_extractor shape; analysis/reasoning/description text is
+        stored as the pick's analysis. By default an article's previous pick list
+        is replaced; merge=True (for partial sources such as the ranking
+        analyzers' top-N names) only upserts the picks given and keeps the rest.
+        Analysis of a pick that is dropped or now names another player is deleted.
+        """
+        mock_drafts = [draft for draft in mock_drafts if draft.get('picks')]
+        all_picks = [pick for draft in mock_drafts for pick in draft['picks'] if pick.get('player')]
+        now = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+        with self.lock, self.conn:
+            author_ids = self._ensure_names('authors', [draft.get('author') or 'Unknown' for draft in mock_drafts])
+            team_ids = self._ensure_names('teams', [pick.get('team') for pick in all_picks])
+            player_ids = self._ensure_players(all_picks)
+
+            pick_rows, analysis_rows, stale_analysis = [], [], []
+            for draft in mock_drafts:
+                article_id = self.conn.execute("""
+                    INSERT INTO articles(url, title, author_id, published, draft_year, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        title = COALESCE(excluded.title, articles.title),
+                        author_id = excluded.author_id,
+                        published = COALESCE(excluded.published, articles.published),
+                        draft_year = COALESCE(excluded.draft_year, articles.draft_year),
+                        updated_at = excluded.updated_at
+                    RETURNING id
+                """, (article_key(draft), draft.get('title'), author_ids[draft.get('author') or 'Unknown'],
+                      draft.get('date'), draft_year(draft), now)).fetchone()[0]
+                # Sources without team names (e.g. ranking selections) keep the stored team
+                stored = {pick_number: (team_id, player_id) for pick_number, team_id, player_id in self.conn.execute(
+                    'SELECT pick_number, team_id, player_id FROM picks WHERE article_id = ?', (article_id,))}
+
+                written = {}
+                for pick in draft['picks']:
+                    if not pick.get('player'):
+                        continue
+                    pick_number = int(pick['pick'])
+                    team_id = team_ids.get(pick.get('team')) or stored.get(pick_number, (None, None))[0]
+                    written[pick_number] = player_ids[player_identity(pick['player'])]
+                    pick_rows.append((article_id, pick_number, team_id, written[pick_number]))
+                    text = pick_analysis(pick)
+                    if text:
+                        analysis_rows.append((article_id, pick_number, text))
+
+                kept = stored if merge else {}
+                stale_analysis.extend(
+                    (article_id, pick_number) for pick_number, (_, player_id) in stored.items()
+                    if written.get(pick_number, kept.get(pick_number, (None, None))[1]) != player_id)
+                if not merge:
+                    self.conn.execute('DELETE FROM picks WHERE article_id = ?', (article_id,))
+
+            self.conn.executemany('DELETE FROM analysis WHERE article_id = ? AND pick_number = ?', stale_analysis)
+            self.conn.executemany("""
+                INSERT INTO picks VALUES (?, ?, ?, ?)
+                ON CONFLICT(article_id, pick_number) DO UPDATE SET
+                    team_id = excluded.team_id, player_id = excluded.player_id
+            """, pick_rows)
+            self.conn.executemany("""
+                INSERT INTO analysis VALUES (?, ?, ?)
+                ON CONFLICT(article_id, pick_number) DO UPDATE SET text = excluded.text
+            """, analysis_rows)
+        return len(pick_rows)
+
+    def upsert_descriptions(self, url, descriptions, overwrite=True):
+        """Attach {pick number: text} to an already stored article; returns rows written
+
+        overwrite=False only fills picks that have no analysis text yet.
+        """
+        conflict = 'DO UPDATE SET text = excluded.text' if overwrite else 'DO NOTHING'
+        with self.lock, self.conn:
+            row = self.conn.execute('SELECT id FROM articles WHERE url = ?', (url,)).fetchone()
+            if row is None:
+                return 0
+            rows = [(row[0], int(pick), text) for pick, text in descriptions.items() if text]
+            self.conn.executemany(f'INSERT INTO analysis VALUES (?, ?, ?) '
+                                  f'ON CONFLICT(article_id, pick_number) {conflict}', rows)
+        return len(rows)
+
+    # -- queries ----------------------------------------------------------
+
+    @staticmethod
+    def _scope(authors=None, urls=None):
+        """WHERE clause and params restricting rows to some authors and/or article URLs"""
+        clauses, params = [], []
+        if authors:
+            clauses.append(f"au.name IN ({','.join('?' * len(authors))})")
+            params.extend(authors)
+        if urls:
+            clauses.append(f"ar.url IN ({','.join('?' * len(urls))})")
+            params.extend(urls)
+        return ' AND '.join(clauses), params
+
+    def _pick_rows(self, where='', params=()):
+        sql = PICK_ROWS_SQL + (f' WHERE {where}' if where else '') + ' ORDER BY ar.id, p.pick_number'
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def pick_rows(self, authors=None, urls=None):
+        """One flat dict per stored pick (PICK_ROWS_SQL columns), in article and pick order"""
+        return self._pick_rows(*self._scope(authors, urls))
+
+    def picks_for_player(self, player_name):
+        return self._pick_rows('p.player_id = (SELECT COALESCE(merged_into, id) FROM players WHERE key = ?)',
+                               (player_identity(player_name),))
+
+    def picks_for_team(self, team_name):
+        return self._pick_rows('p.team_id = (SELECT id FROM teams WHERE name = ?)', (team_name,))
+
+    def picks_at(self, pick_number):
+        return self._pick_rows('p.pick_number = ?', (pick_number,))
+
+    def descriptions(self, url):
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT an.pick_number, an.text FROM analysis an
+                JOIN articles ar ON ar.id = an.article_id WHERE ar.url = ?
+            """, (url,))
+            return {pick: text for pick, text in rows}
+
+    def mock_drafts(self, authors=None, urls=None):
+        """Stored drafts rebuilt in the scrapers' {title, author, date, url, picks} shape"""
+        drafts = {}
+        for row in self.pick_rows(authors, urls):
+            draft = drafts.setdefault(row['url'], {
+                'title': row['title'], 'author': row['author'], 'date': row['published'],
+                'url': row['url'], 'picks': [],
+            })
+            draft['picks'].append({
+                'pick': row['pick'], 'team': row['team'], 'player': row['player'],
+                'school': row['school'], 'position': row['position'], 'class': row['class'],
+                'analysis': row['analysis'], 'headshot_url': row['headshot_url'],
+            })
+        return list(drafts.values())
+
+    def selection_counts(self, authors=None, urls=None):
+        """[(player, selections)] most-selected first, one count per article"""
+        sql = """
+            SELECT pl.name, COUNT(*) AS selections FROM picks p
+            JOIN players pl ON pl.id = p.player_id
+            JOIN articles ar ON ar.id = p.article_id
+            JOIN authors au ON au.id = ar.author_id
+        """
+        where, params = self._scope(authors, urls)
+        if where:
+            sql += f' WHERE {where}'
+        sql += ' GROUP BY pl.id ORDER BY selections DESC, MIN(p.pick_number), pl.name'
+        with self.lock:
+            return [tuple(row) for row in self.conn.execute(sql, params)]
+
+    def player_selections(self, authors=None, urls=None):
+        """{player: {author: pick number}} as kept by the ranking analyzers"""
+        selections = {}
+        for row in self.pick_rows(authors, urls):
+            selections.setdefault(row['player'], {})[row['author']] = row['pick']
+        return selections
+
+
+_shared_stores = {}
+_shared_lock = threading.Lock()
+
+
+def get_draft_store(path=DEFAULT_DB_PATH):
+    """Process-wide store per database path"""
+    with _shared_lock:
+        if path not in _shared_stores:
+            _shared_stores[path] = DraftStore(path)
+        return _shared_stores[path]
+
+
+def save_mock_drafts(mock_drafts, path=DEFAULT_DB_PATH, export=True, merge=False):
+    """Bulk-upsert scraped drafts, reporting (not raising) database errors
+
+    merge is passed to DraftStore.upsert_mock_drafts (True for partial pick lists).
+    With export, the affected authors' partitions of the Parquet pick dataset are
+    refreshed from the store afterwards.
+    """
+    try:
+        written = get_draft_store(path).upsert_mock_drafts(mock_drafts, merge=merge)
+        print(f"💾 Stored {written} picks from {len(mock_drafts)} mock drafts in {path}")
+    except (sqlite3.Error, ValueError, TypeError) as e:
+        print(f"⚠️ Could not store mock drafts: {e}")
+        return 0
+
+    if export and written:
+        try:
+            from nfl_pick_dataset import export_mock_drafts
+        except ImportError as e:
+            print(f"⚠️ Pick dataset export unavailable: {e}")
+        else:
+            export_mock_drafts(mock_drafts, db_path=path)
+    return written
+
+
+def drafts_from_selections(selections, author_urls):
+    """Group ranking-analyzer selections ({name, pick, author}) into per-article drafts
+
+    These are partial (names only, top N), so save them with merge=True.
+    """
+    drafts = {}
+    for selection in selections:
+        author = selection['author']
+        draft = drafts.setdefault(author, {'author': author, 'url': author_urls.get(author), 'picks': []})
+        draft['picks'].append({'pick': selection['pick'], 'player': selection['name'],
+                               'team': selection.get('team')})
+    return list(drafts.values())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Maintain the mock draft database")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f"Draft store database (default: {DEFAULT_DB_PATH})")
+    parser.add_argument('--migrate-player-keys', action='store_true',
+                        help="Re-key stored players through the registry (exact and alias matches only)")
+    parser.add_argument('--dry-run', action='store_true', help="Report what --migrate-player-keys would change")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    store = DraftStore(args.db)
+    if args.migrate_player_keys:
+        merged, changed = store.migrate_player_keys(dry_run=args.dry_run)
+        if args.dry_run:
+            print(f"🔍 Would merge {merged} and re-key {changed} stored players")
+
+    candidates = store.candidate_merges()
+    if candidates:
+        print(f"⚠️ {len(candidates)} pairs of stored players look alike; add confirmed ones to {ALIASES_PATH}:")
+        for first, second, score in candidates:
+            print(f"   {first} / {second} ({score:.2f})")
+    else:
+        print("✓ No look-alike player names stored")
+
+
+if __name__ == "__main__":
+    main()
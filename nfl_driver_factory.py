@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+NFL Driver Factory - Chrome sessions with a lightweight capture profile
+Blocks ad, analytics and video hosts through DevTools, pre-sets consent cookies so
+cookie banners never render and turns off browser features captures don't need.
+
+Browsers get a throwaway profile unless a named one under processed/chrome_profiles
+is asked for (profile=DEFAULT_PROFILE, --profile in the capture scripts, or
+NFL_CHROME_PROFILE=<name> for every script), which keeps the disk cache between
+runs. Chrome locks a profile directory, so only one
+browser at a time can use a named profile; scripts that run side by side should
+stay on the default. With keep-alive (NFL_CHROME_KEEPALIVE=1 or
+`python nfl_driver_factory.py start`) the browser also outlives the script and the
+next get_driver() attaches to it over remote debugging instead of launching Chrome.
+"""
+
+import argparse
+import json
+import os
+import urllib.request
+import weakref
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+DEFAULT_USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+DEFAULT_WINDOW_SIZE = (1800, 1400)
+
+PROFILE_ROOT = 'processed/chrome_profiles'
+DEFAULT_PROFILE = 'default'
+DEBUG_HOST = '127.0.0.1'
+DEBUG_PORT = 9222
+KEEPALIVE_ENV = 'NFL_CHROME_KEEPALIVE'
+PROFILE_ENV = 'NFL_CHROME_PROFILE'
+
+# Network.setBlockedURLs patterns ('*' wildcards). Article text, pick cards and
+# headshots come from nfl.com / static.www.nfl.com and are never matched.
+BLOCKED_HOSTS = [
+    # Ads
+    '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*', '*adnxs.com*',
+    '*amazon-adsystem.com*', '*adsafeprotected.com*', '*moatads.com*', '*taboola.com*',
+    '*outbrain.com*', '*pubmatic.com*', '*rubiconproject.com*', '*casalemedia.com*',
+    '*criteo.com*', '*openx.net*', '*teads.tv*', '*sharethrough.com*',
+    # Analytics and tag managers
+    '*google-analytics.com*', '*googletagmanager.com*', '*googletagservices.com*',
+    '*omtrdc.net*', '*demdex.net*', '*adobedtm.com*', '*scorecardresearch.com*',
+    '*chartbeat.com*', '*chartbeat.net*', '*newrelic.com*', '*nr-data.net*',
+    '*segment.io*', '*segment.com*', '*hotjar.com*', '*quantserve.com*', '*krxd.net*',
+    '*facebook.net*', '*connect.facebook.com*', '*ads-twitter.com*', '*analytics.tiktok.com*',
+    # Consent manager (the banner it would draw is pre-dismissed by CONSENT_COOKIES)
+    '*cookielaw.org*', '*onetrust.com*',
+    # Video players and streams
+    '*brightcove.net*', '*brightcove.com*', '*jwplayer.com*', '*jwpcdn.com*',
+    '*imasdk.googleapis.com*', '*youtube.com/embed*', '*ytimg.com*',
+]
+
+BLOCKED_RESOURCES = ['*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.vtt']
+
+BLOCKED_URL_PATTERNS = BLOCKED_HOSTS + BLOCKED_RESOURCES
+
+# OneTrust reads these before deciding whether to show its banner
+CONSENT_COOKIES = [
+    {'name': 'OptanonAlertBoxClosed', 'value': '2025-01-01T00:00:00.000Z'},
+    {'name': 'OptanonConsent', 'value': 'isGpcEnabled=0&datestamp=Wed+Jan+01+2025&version=202401.1.0'
+                                        '&interactionCount=1&landingPath=NotLandingPage'
+                                        '&groups=C0001%3A1%2CC0002%3A0%2CC0003%3A0%2CC0004%3A0'},
+]
+CONSENT_DOMAINS = ['.nfl.com']
+
+# Injected before any page script runs, in case a banner is served first-party
+HIDE_OVERLAYS_SCRIPT = """
+(function() {
+    var style = document.createElement('style');
+    style.textContent = '#onetrust-consent-sdk, .onetrust-banner-sdk, [data-module="CookieBanner"]' +
+                        ' { display: none !important; }';
+    (document.head || document.documentElement).appendChild(style);
+})();
+"""
+
+# One round trip: hide every visible overlay, then click any visible close button
+DISMISS_OVERLAYS_SCRIPT = """
+var hidden = 0;
+document.querySelectorAll(arguments[0]).forEach(function(el) {
+    if (el.offsetParent !== null || getComputedStyle(el).position === 'fixed') {
+        el.style.display = 'none';
+        hidden++;
+    }
+});
+document.querySelectorAll(arguments[1]).forEach(function(button) {
+    if (button.offsetParent !== null) {
+        try { button.click(); } catch (e) {}
+    }
+});
+return hidden;
+"""
+
+OVERLAY_SELECTORS = [
+    '[data-module="CookieBanner"]',
+    '.onetrust-banner-sdk',
+    '.cookie-banner',
+    '[class*="overlay"]',
+    '[class*="modal"]',
+    '.nfl-banner',
+    '[id*="onetrust"]',
+]
+CLOSE_BUTTON_SELECTORS = ['[aria-label="Close"]', '.close-button', '[data-dismiss]']
+
+LIGHTWEIGHT_ARGUMENTS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-notifications',
+    '--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--autoplay-policy=user-gesture-required',
+]
+
+LIGHTWEIGHT_PREFS = {
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.default_content_setting_values.media_stream': 2,
+    'profile.managed_default_content_settings.plugins': 2,
+    'credentials_enable_service': False,
+    'profile.password_manager_enabled': False,
+}
+
+
+def build_options(headless=False, window_size=DEFAULT_WINDOW_SIZE, user_agent=DEFAULT_USER_AGENT,
+                  lightweight=True, device_scale_factor=1, extra_arguments=()):
+    """Chrome options shared by every capture script"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    if window_size:
+        options.add_argument(f'--window-size={window_size[0]},{window_size[1]}')
+    if user_agent:
+        options.add_argument(f'--user-agent={user_agent}')
+    if device_scale_factor:
+        options.add_argument(f'--force-device-scale-factor={device_scale_factor}')
+
+    if lightweight:
+        for argument in LIGHTWEIGHT_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option('prefs', LIGHTWEIGHT_PREFS)
+        options.page_load_strategy = 'eager'  # Readiness waits take over after DOMContentLoaded
+    else:
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+
+    for argument in extra_arguments:
+        options.add_argument(argument)
+    return options
+
+
+def apply_capture_profile(driver, block=True, consent=True):
+    """Turn on DevTools URL blocking and consent cookies for an existing Chrome session"""
+    if block:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    if consent:
+        for domain in CONSENT_DOMAINS:
+            for cookie in CONSENT_COOKIES:
+                driver.execute_cdp_cmd('Network.setCookie', {**cookie, 'domain': domain, 'path': '/'})
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': HIDE_OVERLAYS_SCRIPT})
+
+
+def profile_dir(profile):
+    return os.path.abspath(os.path.join(PROFILE_ROOT, profile))
+
+
+def keep_alive_default():
+    return os.environ.get(KEEPALIVE_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def profile_default():
+    """Named profile from $NFL_CHROME_PROFILE, or None for a throwaway one"""
+    return os.environ.get(PROFILE_ENV) or None
+
+
+def add_profile_argument(parser):
+    """--profile option shared by the capture scripts, defaulting to $NFL_CHROME_PROFILE"""
+    parser.add_argument('--profile', default=profile_default(),
+                        help=f"Persistent Chrome profile under {PROFILE_ROOT} to reuse its disk cache; "
+                             f"only one browser can use it at a time (default: ${PROFILE_ENV}, "
+                             "else a throwaway profile)")
+
+
+def browser_running(port=DEBUG_PORT, timeout=0.3):
+    """Version info of the browser listening for remote debugging on port, or None"""
+    try:
+        with urllib.request.urlopen(f'http://{DEBUG_HOST}:{port}/json/version', timeout=timeout) as response:
+            return json.load(response)
+    except (OSError, ValueError):
+        return None
+
+
+# Sessions whose browser must survive release_driver (attached or launched with keep-alive)
+_kept_alive = weakref.WeakSet()
+
+
+def create_driver(headless=False, window_size=DEFAULT_WINDOW_SIZE, user_agent=DEFAULT_USER_AGENT,
+                  lightweight=True, profile=None, keep_alive=False, port=DEBUG_PORT,
+                  extra_arguments=()):
+    """Launch Chrome with the capture profile; raises if Chrome cannot start
+
+    lightweight=False gives a plain session (no blocking, no consent cookies).
+    profile=None uses a throwaway profile; a named profile persists under PROFILE_ROOT
+    but can only be open in one Chrome at a time, so concurrent browsers each need
+    their own. keep_alive leaves the browser running after release_driver, listening
+    on port; it uses DEFAULT_PROFILE unless given another, since later runs attach to it.
+    """
+    if keep_alive and not profile:
+        profile = DEFAULT_PROFILE
+    arguments = list(extra_arguments)
+    if profile:
+        arguments.append(f'--user-data-dir={profile_dir(profile)}')
+    if keep_alive:
+        arguments.append(f'--remote-debugging-port={port}')
+    options = build_options(headless, window_size, user_agent, lightweight,
+                            extra_arguments=arguments)
+    if keep_alive:
+        options.add_experimental_option('detach', True)
+
+    driver = webdriver.Chrome(options=options)
+    if keep_alive:
+        _kept_alive.add(driver)
+    if lightweight:
+        try:
+            apply_capture_profile(driver)
+        except Exception as e:
+            print(f"⚠️ Capture profile not applied (DevTools unavailable): {e}")
+    return driver
+
+
+def attach_driver(port=DEBUG_PORT, window_size=DEFAULT_WINDOW_SIZE, user_agent=DEFAULT_USER_AGENT,
+                  lightweight=True):
+    """Connect to an already running browser instead of launching one"""
+    options = Options()
+    options.debugger_address = f'{DEBUG_HOST}:{port}'
+    driver = webdriver.Chrome(options=options)
+    _kept_alive.add(driver)
+
+    # Launch-time settings have to be re-applied to a browser someone else started
+    if window_size:
+        driver.set_window_size(*window_size)
+    try:
+        if user_agent:
+            driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+        if lightweight:
+            apply_capture_profile(driver)
+    except Exception as e:
+        print(f"⚠️ Capture profile not applied (DevTools unavailable): {e}")
+    return driver
+
+
+def get_driver(headless=False, window_size=DEFAULT_WINDOW_SIZE, user_agent=DEFAULT_USER_AGENT,
+               lightweight=True, profile=None, keep_alive=None, attach=True,
+               port=DEBUG_PORT, extra_arguments=()):
+    """Warm-start driver: attach to a browser kept alive on port, otherwise launch one
+
+    keep_alive defaults to $NFL_CHROME_KEEPALIVE and profile to $NFL_CHROME_PROFILE;
+    profile='' forces a throwaway profile. Pass attach=False for browsers that run
+    side by side, e.g. worker pools.
+    """
+    if keep_alive is None:
+        keep_alive = keep_alive_default()
+    if profile is None:
+        profile = profile_default()
+
+    if attach and browser_running(port):
+        try:
+            driver = attach_driver(port, window_size, user_agent, lightweight)
+            print(f"✓ Attached to running Chrome on port {port}")
+            return driver
+        except Exception as e:
+            print(f"⚠️ Could not attach to Chrome on port {port}, launching a new one: {e}")
+            keep_alive = False  # The port is taken by the browser we failed to attach to
+
+    return create_driver(headless, window_size, user_agent, lightweight, profile,
+                         keep_alive, port, extra_arguments)
+
+
+def release_driver(driver):
+    """End a session: quit the browser, or leave a kept-alive one running for the next run"""
+    if driver is None:
+        return
+    if driver in _kept_alive:
+        _kept_alive.discard(driver)
+        driver.service.stop()  # Only chromedriver exits; the browser keeps its tabs and cache
+    else:
+        driver.quit()
+
+
+def stop_browser(port=DEBUG_PORT):
+    """Close the kept-alive browser on port; returns False when none is running"""
+    if not browser_running(port):
+        return False
+    driver = attach_driver(port, window_size=None, user_agent=None, lightweight=False)
+    try:
+        driver.execute_cdp_cmd('Browser.close', {})
+    finally:
+        _kept_alive.discard(driver)
+        driver.service.stop()
+    return True
+
+
+def dismiss_overlays(driver, overlay_selectors=OVERLAY_SELECTORS, close_selectors=CLOSE_BUTTON_SELECTORS):
+    """Hide overlays and click close buttons in a single script call; returns the number hidden"""
+    return driver.execute_script(DISMISS_OVERLAYS_SCRIPT, ', '.join(overlay_selectors),
+                                 ', '.join(close_selectors))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the long-lived capture browser")
+    parser.add_argument('command', choices=['start', 'stop', 'status'])
+    parser.add_argument('--port', type=int, default=DEBUG_PORT)
+    parser.add_argument('--headless', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'status':
+        info = browser_running(args.port)
+        print(f"✓ {info.get('Browser')} on port {args.port}" if info else f"No browser on port {args.port}")
+    elif args.command == 'start':
+        if browser_running(args.port):
+            print(f"✓ Chrome already running on port {args.port}")
+            return
+        driver = create_driver(headless=args.headless, keep_alive=True, port=args.port)
+        release_driver(driver)
+        print(f"✓ Chrome running on port {args.port} with profile {profile_dir(DEFAULT_PROFILE)}")
+    else:
+        print("✓ Chrome stopped" if stop_browser(args.port) else f"No browser on port {args.port}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,34 +5,18 @@ Creates a Word document that exactly replicates NFL.com webpage layout
 for all authors in one continuous scrolling document
 """
 
+import argparse
 import os
 from datetime import datetime
-from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
-from PIL import Image, ImageDraw, ImageFont
-
-def get_team_colors():
-    """Get exact NFL team colors"""
-    return {
-        'Tennessee Titans': '#002244',
-        'Cleveland Browns': '#FF3C00', 
-        'New York Giants': '#0B2265',
-        'New England Patriots': '#002244',
-        'Jacksonville Jaguars': '#006778',
-        'Las Vegas Raiders': '#000000',
-        'New York Jets': '#125740',
-        'Carolina Panthers': '#0085CA',
-        'New Orleans Saints': '#D3BC8D',
-        'Chicago Bears': '#0B162A',
-        'San Francisco 49ers': '#AA0000',
-        'Dallas Cowboys': '#003594',
-        'Miami Dolphins': '#008E97',
-        'Indianapolis Colts': '#002C5F',
-        'Atlanta Falcons': '#A71930',
-        'Arizona Cardinals': '#97233F'
-    }
+from PIL import Image, ImageDraw
+from nfl_image_store import get_image_store, player_identity, HEADSHOT
+from nfl_placeholder_renderer import get_font
+from nfl_docx_stream import StreamingDocumentBuilder
+from nfl_docx_parallel import build_sections
+from nfl_reference_data import team_color as team_color_for
 
 def create_nfl_pick_layout_image(pick_data, team_color):
     """Create exact NFL.com pick layout as seen in the HTML structure"""
@@ -49,19 +33,12 @@ def create_nfl_pick_layout_image(pick_data, team_color):
     border_width = 6
     draw.rectangle([0, 0, border_width, height], fill=team_color_rgb)
     
-    # Load fonts
-    try:
-        font_pick_label = ImageFont.truetype("Arial.ttf", 16)
-        font_pick_number = ImageFont.truetype("Arial.ttf", 48)
-        font_team_name = ImageFont.truetype("Arial.ttf", 20)
-        font_player_name = ImageFont.truetype("Arial.ttf", 24)
-        font_details = ImageFont.truetype("Arial.ttf", 14)
-    except:
-        font_pick_label = ImageFont.load_default()
-        font_pick_number = ImageFont.load_default()
-        font_team_name = ImageFont.load_default()
-        font_player_name = ImageFont.load_default()
-        font_details = ImageFont.load_default()
+    # Load fonts (cached across picks)
+    font_pick_label = get_font(16)
+    font_pick_number = get_font(48)
+    font_team_name = get_font(20)
+    font_player_name = get_font(24)
+    font_details = get_font(14)
     
     # LEFT SIDE: Pick label and number (nfl-o-ranked-item__label)
     pick_x = 20
@@ -94,8 +71,8 @@ def create_nfl_pick_layout_image(pick_data, team_color):
     
     # Try to add actual player photo if available
     try:
-        player_photo_path = f"processed/images/web_{pick_data['pick']}_{pick_data['player'].replace(' ', '_')}.png"
-        if os.path.exists(player_photo_path):
+        player_photo_path = get_image_store().get(player_identity(pick_data['player']), kind=HEADSHOT)
+        if player_photo_path:
             player_photo = Image.open(player_photo_path)
             player_photo = player_photo.resize((photo_size, photo_size), Image.Resampling.LANCZOS)
             img.paste(player_photo, (player_x, player_y))
@@ -114,11 +91,22 @@ def create_nfl_pick_layout_image(pick_data, team_color):
     
     return img
 
-def add_nfl_style_pick_to_document(doc, pick_data, author, team_colors):
+def define_replica_styles(builder):
+    """Named styles shared by every pick, so each paragraph/run only references one"""
+    builder.define_paragraph_style('Pick Layout', alignment=WD_ALIGN_PARAGRAPH.CENTER,
+                                   space_before=Pt(0), space_after=Pt(0))
+    builder.define_paragraph_style('Pick Analysis', space_before=Pt(8), space_after=Pt(16),
+                                   size=Pt(16), color=(0, 0, 0))
+    builder.define_run_style('Mock Draft Label', size=Pt(14), bold=True, color=(0, 53, 148))
+    builder.define_run_style('Author Title', size=Pt(28), bold=True, color=(0, 0, 0))
+    builder.define_run_style('Author Name', size=Pt(16), bold=True)
+    builder.define_run_style('Author Role', size=Pt(12), color=(107, 114, 128))
+
+def add_nfl_style_pick_to_document(builder, pick_data, author):
     """Add a pick in exact NFL.com style to the document"""
     
     # Get team color
-    team_color = team_colors.get(pick_data['team'], '#002244')
+    team_color = team_color_for(pick_data['team'])
     
     # Create the pick layout image
     pick_image = create_nfl_pick_layout_image(pick_data, team_color)
@@ -128,26 +116,14 @@ def add_nfl_style_pick_to_document(doc, pick_data, author, team_colors):
     os.makedirs('processed/pick_layouts', exist_ok=True)
     pick_image.save(image_path, 'PNG', quality=95)
     
-    # Add image to document
+    # Add image to document, centered with no spacing
     try:
-        doc.add_picture(image_path, width=Inches(7.5))
-        
-        # Center the image
-        last_paragraph = doc.paragraphs[-1]
-        last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        last_paragraph.space_before = Pt(0)
-        last_paragraph.space_after = Pt(0)
-        
+        builder.picture(image_path, width=Inches(7.5), style='Pick Layout')
     except Exception as e:
         print(f"⚠️ Could not add image for {author} Pick {pick_data['pick']}: {e}")
     
     # Add analysis paragraph (nfl-c-body-part--text)
-    analysis_para = doc.add_paragraph()
-    analysis_run = analysis_para.add_run(pick_data['analysis'])
-    analysis_run.font.size = Pt(16)
-    analysis_run.font.color.rgb = RGBColor(0, 0, 0)
-    analysis_para.space_before = Pt(8)
-    analysis_para.space_after = Pt(16)
+    builder.text(pick_data['analysis'], style='Pick Analysis')
 
 def get_all_authors_data():
     """Get comprehensive data for all NFL.com authors"""
@@ -220,12 +196,38 @@ def get_all_authors_data():
         }
     }
 
-def create_master_continuous_document():
-    """Create one continuous document with all authors in NFL.com style"""
+def add_author_section(builder, author, data):
+    """One author's header and picks; runs in a worker process when rendering in parallel"""
+    
+    # Add section break for new author
+    builder.page_break()
+    
+    # Author header (like NFL.com)
+    builder.text("Mock Draft", run_style='Mock Draft Label')
+    
+    # Author title
+    builder.run(builder.heading('', level=2), data['title'], 'Author Title')
+    
+    # Author name
+    author_para = builder.text(author, run_style='Author Name')
+    builder.run(author_para, "\nNFL.com Analyst", 'Author Role')
+    
+    # Add picks in exact NFL.com style
+    for pick in data['picks']:
+        add_nfl_style_pick_to_document(builder, pick, author)
+
+def create_master_continuous_document(output_path, workers=1):
+    """Create one continuous document with all authors in NFL.com style
+
+    Each author's section is streamed to output_path once laid out; returns the path.
+    workers > 1 (or None for one per CPU) renders the sections in separate processes.
+    """
     
     print("📄 Creating master continuous NFL.com replica document...")
     
-    doc = Document()
+    builder = StreamingDocumentBuilder(output_path)
+    doc = builder.doc
+    define_replica_styles(builder)
     
     # Set webpage-like margins
     sections = doc.sections
@@ -252,45 +254,21 @@ def create_master_continuous_document():
     
     # Get all data
     authors_data = get_all_authors_data()
-    team_colors = get_team_colors()
     
     # Add each author's section
-    for author, data in authors_data.items():
-        
-        # Add section break for new author
-        doc.add_page_break()
-        
-        # Author header (like NFL.com)
-        header_para = doc.add_paragraph()
-        header_run = header_para.add_run("Mock Draft")
-        header_run.font.size = Pt(14)
-        header_run.font.color.rgb = RGBColor(0, 53, 148)
-        header_run.font.bold = True
-        
-        # Author title
-        author_title_para = doc.add_heading('', level=2)
-        author_title_run = author_title_para.add_run(data['title'])
-        author_title_run.font.size = Pt(28)
-        author_title_run.font.color.rgb = RGBColor(0, 0, 0)
-        author_title_run.font.bold = True
-        
-        # Author name
-        author_para = doc.add_paragraph()
-        author_run = author_para.add_run(author)
-        author_run.font.size = Pt(16)
-        author_run.font.bold = True
-        
-        author_title_run = author_para.add_run("\nNFL.com Analyst")
-        author_title_run.font.size = Pt(12)
-        author_title_run.font.color.rgb = RGBColor(107, 114, 128)
-        
-        # Add picks in exact NFL.com style
-        for pick in data['picks']:
-            add_nfl_style_pick_to_document(doc, pick, author, team_colors)
-    
-    return doc
+    build_sections(builder, add_author_section, list(authors_data.items()),
+                   workers=workers, define_styles=define_replica_styles)
+    
+    return builder.save()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create the NFL.com replica document for all authors")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes rendering author sections (default: 1, in-process; 0 = one per CPU)")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
     print("=== NFL Exact Replica Creator - All Authors ===")
     print("🌐 Creating visually identical NFL.com layout")
     print("📄 Continuous scrolling master document")
@@ -301,12 +279,9 @@ def main():
     os.makedirs('processed', exist_ok=True)
     
     # Create the master continuous document
-    master_doc = create_master_continuous_document()
-    
-    # Save the document
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = f'processed/NFL_EXACT_REPLICA_ALL_AUTHORS_{timestamp}.docx'
-    master_doc.save(output_path)
+    output_path = create_master_continuous_document(
+        f'processed/NFL_EXACT_REPLICA_ALL_AUTHORS_{timestamp}.docx', workers=args.workers or None)
     
     print(f"\n🎉 SUCCESS! Exact NFL.com replica created!")
     print("=" * 50)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+NFL Full-Page Capture - One DevTools capture per article, picks cropped in memory
+Pick rectangles come from a single DOM query and are cut out of the in-memory
+page image, so capture cost no longer grows with the number of picks
+"""
+
+import base64
+import io
+import math
+from contextlib import contextmanager
+from PIL import Image
+from nfl_page_readiness import wait_for_images_decoded, wait_for_paint
+
+# Chrome tiles very tall captures unreliably past ~16k device pixels, so the page
+# is grabbed in a few tall strips (still a constant number per article, not per pick)
+MAX_STRIP_HEIGHT = 8000
+
+# Page rectangles (CSS px, document coordinates) of the first max_picks matches
+PICK_RECTS_SCRIPT = """
+var elements = Array.prototype.slice.call(document.querySelectorAll(arguments[0]), 0, arguments[1]);
+return elements.map(function(el) {
+    var rect = el.getBoundingClientRect();
+    return {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+            width: rect.width, height: rect.height};
+});
+"""
+
+SET_BORDER_SCRIPT = """
+var border = arguments[2];
+var elements = Array.prototype.slice.call(document.querySelectorAll(arguments[0]), 0, arguments[1]);
+elements.forEach(function(el) { el.style.border = border; });
+"""
+
+
+def _page_size(driver):
+    metrics = driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
+    size = metrics.get('cssContentSize') or metrics['contentSize']
+    viewport = metrics.get('cssLayoutViewport') or metrics['layoutViewport']
+    return math.ceil(size['width']), math.ceil(size['height']), viewport['clientWidth']
+
+
+def _capture_strip(driver, top, width, height):
+    result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+        'format': 'png',
+        'captureBeyondViewport': True,
+        'clip': {'x': 0, 'y': top, 'width': width, 'height': height, 'scale': 1},
+    })
+    return Image.open(io.BytesIO(base64.b64decode(result['data']))).convert('RGB')
+
+
+@contextmanager
+def full_height_viewport(driver):
+    """Stretch the viewport to the whole page so lazy images load and decode; yields (width, height)"""
+    _, height, viewport_width = _page_size(driver)
+    driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+        'width': viewport_width, 'height': height, 'deviceScaleFactor': 0, 'mobile': False,
+    })
+    try:
+        wait_for_images_decoded(driver)
+        wait_for_paint(driver)
+        width, height, _ = _page_size(driver)  # Lazy content may have changed the height
+        yield width, height
+    finally:
+        driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+
+
+def capture_full_page(driver, width, height, max_strip_height=MAX_STRIP_HEIGHT):
+    """Whole document as one in-memory PIL image; returns (image, scale)
+
+    Call inside full_height_viewport. scale converts CSS px to image pixels.
+    """
+    strips = [_capture_strip(driver, top, width, min(max_strip_height, height - top))
+              for top in range(0, height, max_strip_height)]
+    page = Image.new('RGB', (strips[0].width, sum(strip.height for strip in strips)))
+    y = 0
+    for strip in strips:
+        page.paste(strip, (0, y))
+        y += strip.height
+    return page, page.width / width
+
+
+def crop_rects(page, rects, scale=1.0, extra_height=0):
+    """Crop each CSS-px rect (plus extra_height below it) out of the page image"""
+    crops = []
+    for rect in rects:
+        left = max(0, int(rect['x'] * scale))
+        top = max(0, int(rect['y'] * scale))
+        right = min(page.width, math.ceil((rect['x'] + rect['width']) * scale))
+        bottom = min(page.height, math.ceil((rect['y'] + rect['height'] + extra_height) * scale))
+        crops.append(page.crop((left, top, right, bottom)) if right > left and bottom > top else None)
+    return crops
+
+
+def capture_pick_crops(driver, selector, max_picks=32, extra_height=0, border=None):
+    """One full-page capture cropped to every element matching selector
+
+    Returns a list of PIL images (None for elements with no visible box), in
+    document order. border (e.g. '2px solid red') is drawn on all picks for the
+    capture and removed afterwards.
+    """
+    if border:
+        driver.execute_script(SET_BORDER_SCRIPT, selector, max_picks, border)
+    try:
+        with full_height_viewport(driver) as (width, height):
+            # Measured in the same stretched layout that is captured
+            rects = driver.execute_script(PICK_RECTS_SCRIPT, selector, max_picks)
+            page, scale = capture_full_page(driver, width, height)
+    finally:
+        if border:
+            driver.execute_script(SET_BORDER_SCRIPT, selector, max_picks, '')
+    return crop_rects(page, rects, scale, extra_height)
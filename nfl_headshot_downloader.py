@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+NFL Headshot Downloader - Parallel headshot download stage for a whole slate
+Takes every (player, candidate URLs) pair up front, de-duplicates players, races
+each player's mirrors over one pooled session and keeps the first valid image
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+import requests
+from nfl_http_cache import create_cached_session
+from nfl_image_store import find_headshot, player_identity, store_downloaded_headshot
+from nfl_player_registry import player_key
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DownloadCancelled(Exception):
+    """Raised inside a losing mirror's download once another mirror has won"""
+
+
+class HeadshotDownloader:
+    """Batch headshot downloads with bounded concurrency and mirror racing"""
+
+    def __init__(self, session=None, concurrency=8, timeout=10, min_bytes=5000):
+        self.session = session or create_cached_session(pool_maxsize=concurrency)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.min_bytes = min_bytes
+
+        # Players whose every mirror failed this run, so per-pick callers don't retry them
+        self.failed = set()
+        self.latencies = defaultdict(list)
+        self.outcomes = defaultdict(lambda: defaultdict(int))
+        self.lock = threading.Lock()
+
+    def _record(self, url, outcome, started):
+        host = urlparse(url).netloc
+        with self.lock:
+            self.outcomes[host][outcome] += 1
+            if outcome != 'cancelled':
+                self.latencies[host].append(time.perf_counter() - started)
+
+    def _fetch(self, url, cancel):
+        """Download one candidate, aborting between chunks if another mirror won"""
+        started = time.perf_counter()
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if cancel.is_set():
+                        raise DownloadCancelled(url)
+                    chunks.append(chunk)
+            return b''.join(chunks), started
+        except DownloadCancelled:
+            self._record(url, 'cancelled', started)
+            return None, started
+        except requests.RequestException:
+            self._record(url, 'failed', started)
+            return None, started
+
+    async def _try_source(self, url, semaphore, cancel):
+        async with semaphore:
+            if cancel.is_set():
+                return url, None, None
+            data, started = await asyncio.to_thread(self._fetch, url, cancel)
+            return url, data, started
+
+    async def _race(self, player_name, urls, semaphore):
+        """First candidate that yields a decodable image wins; the rest are cancelled"""
+        cancel = threading.Event()
+        tasks = [asyncio.create_task(self._try_source(url, semaphore, cancel)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                url, data, started = await next_done
+                if data is None:
+                    continue
+                path = None
+                if len(data) >= self.min_bytes:
+                    path = store_downloaded_headshot(player_name, url, data)
+                if path:
+                    self._record(url, 'won', started)
+                    return path
+                self._record(url, 'invalid', started)
+            return None
+        finally:
+            cancel.set()
+            for task in tasks:
+                task.cancel()
+
+    async def _download(self, player_name, urls, semaphore):
+        path = find_headshot(player_name, urls)
+        if path or not urls:
+            return path
+        return await self._race(player_name, urls, semaphore)
+
+    async def download_all_async(self, candidates):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        names = list(candidates)
+        results = await asyncio.gather(*(self._download(name, candidates[name], semaphore) for name in names))
+        return dict(zip(names, results))
+
+    def _merge_candidates(self, candidates):
+        """Collapse duplicate players (same identity) into one URL list in first-seen order"""
+        items = candidates.items() if hasattr(candidates, 'items') else candidates
+        merged = {}
+        names = {}
+        for player_name, urls in items:
+            identity = player_identity(player_name)
+            names.setdefault(identity, player_name)
+            merged.setdefault(identity, [])
+            for url in urls or []:
+                if url not in merged[identity]:
+                    merged[identity].append(url)
+        return {names[identity]: urls for identity, urls in merged.items()}
+
+    def download_all(self, candidates):
+        """Download headshots for a slate
+
+        candidates is a dict or iterable of (player_name, [candidate urls]).
+        Returns {player_name: stored path or None}; duplicate players are fetched
+        once and every spelling given maps to the same result.
+        """
+        items = list(candidates.items() if hasattr(candidates, 'items') else candidates)
+        unique = self._merge_candidates(items)
+        with self.lock:
+            pending = {name: urls for name, urls in unique.items() if player_identity(name) not in self.failed}
+
+        started = time.perf_counter()
+        results = asyncio.run(self.download_all_async(pending)) if pending else {}
+
+        by_identity = {}
+        for name, path in results.items():
+            by_identity[player_identity(name)] = path
+            if path is None and pending[name]:
+                with self.lock:
+                    self.failed.add(player_identity(name))
+
+        downloaded = sum(1 for path in by_identity.values() if path)
+        if pending:
+            print(f"📸 Headshots ready for {downloaded}/{len(pending)} players in {time.perf_counter() - started:.1f}s")
+        return {name: by_identity.get(player_identity(name)) for name, _ in items}
+
+    def download(self, player_name, urls):
+        """Single-player convenience wrapper; returns the stored path or None"""
+        if player_identity(player_name) in self.failed:
+            return find_headshot(player_name, urls)
+        return self.download_all([(player_name, urls)])[player_name]
+
+    def latency_report(self):
+        """Per-source latency and outcome counts"""
+        with self.lock:
+            report = {}
+            for host, outcomes in self.outcomes.items():
+                samples = self.latencies.get(host, [])
+                report[host] = {
+                    'requests': sum(outcomes.values()),
+                    'won': outcomes.get('won', 0),
+                    'failed': outcomes.get('failed', 0) + outcomes.get('invalid', 0),
+                    'cancelled': outcomes.get('cancelled', 0),
+                    'median_s': statistics.median(samples) if samples else None,
+                    'max_s': max(samples) if samples else None,
+                }
+            return report
+
+    def print_latency_report(self):
+        report = self.latency_report()
+        if not report:
+            return
+        print("📊 Headshot sources:")
+        for host, stats in sorted(report.items(), key=lambda item: -item[1]['won']):
+            median = f"{stats['median_s']:.2f}s" if stats['median_s'] is not None else 'n/a'
+            print(f"   {host}: {stats['won']} won, {stats['failed']} failed, "
+                  f"{stats['cancelled']} cancelled, median {median}")
+
+
+_shared_downloader = None
+_shared_lock = threading.Lock()
+
+
+def get_headshot_downloader():
+    """Process-wide downloader so batch prefetch and per-pick lookups share state"""
+    global _shared_downloader
+    with _shared_lock:
+        if _shared_downloader is None:
+            _shared_downloader = HeadshotDownloader()
+        return _shared_downloader
+
+
+def prefetch_headshots(mock_drafts, image_sources):
+    """Download every headshot a set of mock drafts needs in one parallel batch
+
+    A pick's own headshot_url (from the article) is raced alongside the known mirrors.
+    """
+    sources = {player_key(name): urls for name, urls in image_sources.items()}
+    candidates = []
+    for draft in mock_drafts:
+        for pick in draft['picks']:
+            if pick.get('player'):
+                urls = [pick['headshot_url']] if pick.get('headshot_url') else []
+                candidates.append((pick['player'], urls + sources.get(player_key(pick['player']), [])))
+    downloader = get_headshot_downloader()
+    results = downloader.download_all(candidates)
+    downloader.print_latency_report()
+    return results
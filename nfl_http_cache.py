@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+NFL HTTP Cache - On-disk response cache shared by every requests.Session user
+Stores GET bodies compressed on disk keyed by URL, revalidates stale entries with
+conditional GETs (ETag / Last-Modified), and evicts least-recently-used entries
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CACHE_DIR = 'processed/http_cache'
+DEFAULT_TTL = 6 * 60 * 60  # Serve without revalidation for 6 hours
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # Compressed bytes on disk
+INDEX_SAVE_EVERY = 50  # Cache hits whose access times may wait in memory before the index is saved
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+HOP_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+class HTTPCache:
+    """Compressed body store plus a JSON index of validators and access times"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.unsaved_accesses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+        self.unsaved_accesses = 0
+
+    def flush(self):
+        """Save access times of hits not yet written to the index"""
+        with self.lock:
+            if self.unsaved_accesses:
+                self._save_index()
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.zz')
+
+    def lookup(self, url):
+        """Return the index entry for url, or None if not cached"""
+        with self.lock:
+            entry = self.index.get(self.key_for(url))
+            if entry and not os.path.exists(self._body_path(entry['key'])):
+                del self.index[entry['key']]
+                return None
+            return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry['stored_at'] < self.ttl
+
+    def read_body(self, entry):
+        with open(self._body_path(entry['key']), 'rb') as f:
+            body = zlib.decompress(f.read())
+        with self.lock:
+            entry['last_access'] = time.time()
+            # Batched, so LRU order survives restarts without a rewrite per hit
+            self.unsaved_accesses += 1
+            if self.unsaved_accesses >= INDEX_SAVE_EVERY:
+                self._save_index()
+        return body
+
+    def store(self, url, response):
+        """Store a 200 response body and its validators"""
+        key = self.key_for(url)
+        compressed = zlib.compress(response.content, 6)
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in HOP_HEADERS}
+
+        with open(self._body_path(key), 'wb') as f:
+            f.write(compressed)
+
+        now = time.time()
+        with self.lock:
+            self.index[key] = {
+                'key': key,
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'headers': headers,
+                'size': len(compressed),
+                'stored_at': now,
+                'last_access': now,
+            }
+            self._evict_locked()
+            self._save_index()
+
+    def refresh(self, entry):
+        """Mark a revalidated entry as fresh again"""
+        with self.lock:
+            entry['stored_at'] = entry['last_access'] = time.time()
+            self._save_index()
+
+    def _evict_locked(self):
+        total = sum(entry['size'] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for entry in sorted(self.index.values(), key=lambda e: e['last_access']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._body_path(entry['key']))
+            except OSError:
+                pass
+            total -= entry['size']
+            del self.index[entry['key']]
+            self.evictions += 1
+
+    def record(self, counter):
+        """Increment a hit/miss/revalidation counter"""
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'evictions': self.evictions,
+                'entries': len(self.index),
+                'bytes': sum(entry['size'] for entry in self.index.values()),
+            }
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that answers GETs from HTTPCache and revalidates stale entries"""
+
+    def __init__(self, cache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def _cached_response(self, request, entry):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.cache.read_body(entry)
+        response._content_consumed = True  # iter_content/iter_lines read _content, there is no raw stream
+        response.from_cache = True
+        return response
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET' or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        # Cache-Control: no-cache on the request forces a (conditional) round trip
+        must_revalidate = 'no-cache' in request.headers.get('Cache-Control', '')
+        if entry and self.cache.is_fresh(entry) and not must_revalidate:
+            self.cache.record('hits')
+            return self._cached_response(request, entry)
+
+        if entry:
+            if entry.get('etag'):
+                request.headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().send(request, **kwargs)
+
+        if entry and response.status_code == 304:
+            response.close()
+            self.cache.record('hits')
+            self.cache.record('revalidations')
+            self.cache.refresh(entry)
+            return self._cached_response(request, entry)
+
+        self.cache.record('misses')
+        if response.status_code == 200:
+            self.cache.store(request.url, response)
+        response.from_cache = False
+        return response
+
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_cache(cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+    """One HTTPCache per directory per process, so counters and the index are shared"""
+    with _shared_lock:
+        cache = _shared_caches.get(cache_dir)
+        if cache is None:
+            cache = _shared_caches[cache_dir] = HTTPCache(cache_dir, ttl, max_bytes)
+            atexit.register(cache.flush)
+        return cache
+
+
+def create_cached_session(user_agent=DEFAULT_USER_AGENT, cache_dir=DEFAULT_CACHE_DIR,
+                          ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, pool_maxsize=10):
+    """requests.Session whose GETs go through the shared on-disk cache
+
+    pool_maxsize is the number of keep-alive connections kept per host.
+    """
+    session = requests.Session()
+    session.cache = get_shared_cache(cache_dir, ttl, max_bytes)
+    adapter = CachingAdapter(session.cache, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if user_agent:
+        session.headers.update({'User-Agent': user_agent})
+    return session
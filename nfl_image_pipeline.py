@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+NFL Image Pipeline - Post-capture screenshot downscaling and re-encoding
+Resizes screenshots to the pixel width they are shown at in the Word document and
+re-encodes flat UI captures as palette PNGs (or JPEG), spread over a process pool
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+
+DOC_WIDTH_INCHES = 6.5  # Width screenshots are embedded at in the Word documents
+TARGET_DPI = 150
+
+# WebP is not offered: python-docx (and Word) cannot embed it
+ENCODINGS = ('palette', 'jpeg', 'png')
+
+
+def target_width(width_inches=DOC_WIDTH_INCHES, dpi=TARGET_DPI):
+    return int(round(width_inches * dpi))
+
+
+def optimize_screenshot(path, encoding='palette', width_inches=DOC_WIDTH_INCHES, dpi=TARGET_DPI,
+                        jpeg_quality=85):
+    """Downscale and re-encode one screenshot in place
+
+    Returns (new_path, bytes_before, bytes_after). JPEG output replaces the .png
+    file with a .jpg next to it; palette and png keep the original path.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {ENCODINGS}")
+
+    bytes_before = os.path.getsize(path)
+    max_width = target_width(width_inches, dpi)
+
+    with Image.open(path) as img:
+        encoded = {'palette': img.mode == 'P', 'jpeg': img.format == 'JPEG', 'png': True}[encoding]
+        if encoded and img.width <= max_width:
+            return path, bytes_before, bytes_before
+
+        img = img.convert('RGB')
+        if img.width > max_width:
+            height = max(1, round(img.height * max_width / img.width))
+            img = img.resize((max_width, height), Image.LANCZOS)
+
+    if encoding == 'jpeg':
+        new_path = os.path.splitext(path)[0] + '.jpg'
+        img.save(new_path, 'JPEG', quality=jpeg_quality, optimize=True, dpi=(dpi, dpi))
+        if new_path != path:
+            os.remove(path)
+    else:
+        new_path = path
+        if encoding == 'palette':
+            img = img.quantize(256, method=Image.Quantize.FASTOCTREE)
+        tmp_path = path + '.tmp'
+        img.save(tmp_path, 'PNG', dpi=(dpi, dpi))
+        os.replace(tmp_path, path)
+
+    return new_path, bytes_before, os.path.getsize(new_path)
+
+
+def _optimize_args(args):
+    path, options = args
+    try:
+        return optimize_screenshot(path, **options)
+    except Exception as e:
+        print(f"   ⚠️ Could not optimize {path}: {e}")
+        return path, 0, 0
+
+
+def optimize_screenshots(paths, workers=None, **options):
+    """Optimize many screenshots across a process pool
+
+    Returns {original_path: new_path} so callers can follow renamed JPEGs.
+    """
+    paths = list(dict.fromkeys(p for p in paths if p and os.path.exists(p)))
+    if not paths:
+        return {}
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_optimize_args, [(p, options) for p in paths], chunksize=8))
+
+    before = sum(r[1] for r in results)
+    after = sum(r[2] for r in results)
+    print(f"🗜️ Optimized {len(paths)} screenshots: {before / 1e6:.1f} MB → {after / 1e6:.1f} MB "
+          f"in {time.perf_counter() - started:.1f}s")
+    return {path: result[0] for path, result in zip(paths, results)}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Downscale and re-encode captured screenshots in place")
+    parser.add_argument('folder', nargs='?', default='processed/complete_screenshots',
+                        help="Folder of .png screenshots (default: processed/complete_screenshots)")
+    parser.add_argument('--encoding', choices=ENCODINGS, default='palette')
+    parser.add_argument('--dpi', type=int, default=TARGET_DPI,
+                        help=f"Pixels per inch at the {DOC_WIDTH_INCHES}in document width (default: {TARGET_DPI})")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: one per CPU)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    paths = sorted(glob.glob(os.path.join(args.folder, '*.png')))
+    optimize_screenshots(paths, workers=args.workers, encoding=args.encoding, dpi=args.dpi)
+
+
+if __name__ == "__main__":
+    main()
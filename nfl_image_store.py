@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+NFL Image Store - Content-addressed storage for player headshots and placeholders
+Each unique image is stored once as a hash-keyed blob; a small JSON index maps
+identities (player, placeholder pick and style) and source URLs to blobs
+together with provenance and dimensions
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from PIL import Image
+from nfl_player_registry import player_key
+
+DEFAULT_STORE_DIR = 'processed/image_store'
+
+# Provenance kinds: a 'headshot' is a real downloaded photo, a 'placeholder' was rendered locally
+HEADSHOT = 'headshot'
+PLACEHOLDER = 'placeholder'
+
+
+def player_identity(player_name):
+    """Stable identity for a player regardless of pick slot, author or spelling variant"""
+    return 'player:' + player_key(player_name)
+
+
+def placeholder_identity(player_name, pick_number, style):
+    """Placeholders show the pick number, so they are keyed by (player, pick, style)"""
+    return f"{player_identity(player_name)}|pick:{pick_number}|style:{style}"
+
+
+class ImageStore:
+    """Hash-keyed image blobs plus an index of identities and source URLs"""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.index_path = os.path.join(root, 'index.json')
+        self.lock = threading.Lock()
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault('blobs', {})
+        index.setdefault('identities', {})
+        index.setdefault('sources', {})
+        return index
+
+    def _save_index(self):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def _blob_path(self, digest, fmt):
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.{fmt.lower()}")
+
+    def _put_blob(self, data):
+        """Write bytes once under their SHA-256; returns (digest, blob record)"""
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.index['blobs'].get(digest)
+        if blob and os.path.exists(blob['path']):
+            return digest, blob
+
+        # Decoding validates the bytes really are an image and gives us dimensions
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            fmt = (img.format or 'png').lower()
+
+        path = self._blob_path(digest, fmt)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        blob = {'path': path, 'width': width, 'height': height, 'format': fmt, 'bytes': len(data)}
+        self.index['blobs'][digest] = blob
+        return digest, blob
+
+    def put_bytes(self, data, identity, kind, source):
+        """Store image bytes for an identity; returns the blob path
+
+        Raises PIL.UnidentifiedImageError if data is not a decodable image.
+        """
+        with self.lock:
+            digest, blob = self._put_blob(data)
+            self.index['identities'][identity] = {
+                'blob': digest,
+                'kind': kind,
+                'source': source,
+                'width': blob['width'],
+                'height': blob['height'],
+                'stored_at': time.time(),
+            }
+            if source and '://' in source:
+                self.index['sources'][source] = digest
+            self._save_index()
+            return blob['path']
+
+    def put_image(self, img, identity, kind, source, fmt='PNG'):
+        """Store a rendered PIL image"""
+        buffer = io.BytesIO()
+        img.save(buffer, fmt)
+        return self.put_bytes(buffer.getvalue(), identity, kind, source)
+
+    def put_file(self, path, identity, kind, source):
+        """Store an image file already on disk (e.g. a blob stored under another identity)"""
+        with open(path, 'rb') as f:
+            return self.put_bytes(f.read(), identity, kind, source)
+
+    def get(self, identity, kind=None):
+        """Blob path for an identity, optionally requiring a provenance kind"""
+        with self.lock:
+            entry = self.index['identities'].get(identity)
+            if not entry or (kind and entry['kind'] != kind):
+                return None
+            blob = self.index['blobs'].get(entry['blob'])
+            if not blob or not os.path.exists(blob['path']):
+                return None
+            return blob['path']
+
+    def get_source(self, url):
+        """Blob path for an image already downloaded from url"""
+        with self.lock:
+            blob = self.index['blobs'].get(self.index['sources'].get(url, ''))
+            if blob and os.path.exists(blob['path']):
+                return blob['path']
+            return None
+
+    def describe(self, identity):
+        """Index entry (blob, kind, source, width, height) for an identity"""
+        with self.lock:
+            entry = self.index['identities'].get(identity)
+            return dict(entry) if entry else None
+
+
+_shared_store = None
+_shared_lock = threading.Lock()
+
+
+def get_image_store(root=DEFAULT_STORE_DIR):
+    """Process-wide image store shared by all image producers"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None or _shared_store.root != root:
+            _shared_store = ImageStore(root)
+        return _shared_store
+
+
+def store_downloaded_headshot(player_name, url, data):
+    """Record a downloaded headshot for a player; returns its blob path or None if not an image"""
+    try:
+        return get_image_store().put_bytes(data, player_identity(player_name), HEADSHOT, url)
+    except Exception:
+        return None
+
+
+def find_headshot(player_name, urls=()):
+    """Real headshot for a player if one is stored, either by identity or by any candidate URL"""
+    store = get_image_store()
+    path = store.get(player_identity(player_name), kind=HEADSHOT)
+    if path:
+        return path
+    for url in urls:
+        path = store.get_source(url)
+        if path:
+            return store.put_file(path, player_identity(player_name), HEADSHOT, url)
+    return None
@@ -7,20 +7,23 @@ Scrapes mock draft data from NFL.com and processes it according to specified aut
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-from docx import Document
 from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import os
 import re
 from datetime import datetime
-import time
 from urllib.parse import urljoin, urlparse
 import json
+from nfl_offline_extractor import extract_article
+from nfl_http_cache import create_cached_session
+from nfl_async_fetcher import AsyncArticleFetcher
+from nfl_draft_store import save_mock_drafts
+from nfl_docx_stream import StreamingDocumentBuilder
 
 class NFLMockDraftScraper:
     def __init__(self):
         self.base_url = "https://www.nfl.com"
-        self.session = requests.Session()
+        self.session = create_cached_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -52,13 +55,20 @@ class NFLMockDraftScraper:
             print(f"Error fetching {url}: {e}")
             return None
             
-    def extract_mock_draft_data(self, url):
-        """Extract mock draft data from the specific URL"""
+    def extract_mock_draft_data(self, url, content=None):
+        """Extract mock draft data from the specific URL (or its already-fetched HTML)"""
         print(f"Scraping: {url}")
         
-        content = self.get_page_content(url)
+        if content is None:
+            content = self.get_page_content(url)
         if not content:
             return []
+        
+        # Structured NFL.com ranked-item pages parse directly with lxml
+        mock_draft = extract_article(content, url=url, max_picks=32)
+        if mock_draft['picks']:
+            print(f"   ✓ Extracted {len(mock_draft['picks'])} picks offline")
+            return [mock_draft]
             
         soup = BeautifulSoup(content, 'html.parser')
         mock_drafts = []
@@ -184,15 +194,20 @@ class NFLMockDraftScraper:
         
         return list(mock_draft_urls)
     
-    def scrape_all_mock_drafts(self, initial_url):
+    def scrape_all_mock_drafts(self, initial_url, concurrency=8, rate_per_host=2.0):
         """Scrape all related mock draft articles"""
         urls = self.find_related_mock_drafts(initial_url)
         all_mock_drafts = []
         
+        # Fetch every article concurrently; per-host rate limiting keeps us respectful to the server
+        fetcher = AsyncArticleFetcher(self.session, concurrency=concurrency, rate_per_host=rate_per_host)
+        pages = fetcher.fetch_all(urls)
+        
         for url in urls:
-            mock_drafts = self.extract_mock_draft_data(url)
+            if not pages.get(url):
+                continue
+            mock_drafts = self.extract_mock_draft_data(url, content=pages[url])
             all_mock_drafts.extend(mock_drafts)
-            time.sleep(1)  # Be respectful to the server
             
         return all_mock_drafts
     
@@ -213,8 +228,9 @@ class NFLMockDraftScraper:
         return filtered_drafts
     
     def create_word_document(self, mock_drafts, output_path):
-        """Create a Word document with the mock draft data"""
-        doc = Document()
+        """Create a Word document with the mock draft data, streamed to output_path one draft at a time"""
+        builder = StreamingDocumentBuilder(output_path)
+        doc = builder.doc
         
         # Add title
         title = doc.add_heading('NFL 2025 Mock Draft Data', 0)
@@ -266,9 +282,10 @@ class NFLMockDraftScraper:
                 doc.add_paragraph("No draft picks found or extracted.")
             
             doc.add_page_break()
+            builder.flush()
         
         # Save document
-        doc.save(output_path)
+        builder.save()
         print(f"Word document saved to: {output_path}")
     
     def run(self, url):
@@ -283,6 +300,7 @@ class NFLMockDraftScraper:
         # Scrape mock drafts
         all_mock_drafts = self.scrape_all_mock_drafts(url)
         print(f"Found {len(all_mock_drafts)} total mock drafts")
+        save_mock_drafts(all_mock_drafts)
         
         # Filter by authors
         filtered_drafts = self.filter_by_authors(all_mock_drafts)
@@ -296,6 +314,9 @@ class NFLMockDraftScraper:
         output_path = os.path.join('processed', f'NFL_Mock_Drafts_2025_{datetime.now().strftime("%Y%m%d_%H%M%S")}.docx')
         self.create_word_document(filtered_drafts, output_path)
         
+        stats = self.session.cache.stats()
+        print(f"HTTP cache: {stats['hits']} hits, {stats['misses']} misses, {stats['revalidations']} revalidated")
+        
         print("Scraping completed successfully!")
         return filtered_drafts
 
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+NFL Offline Extractor - Browser-free pick extraction from NFL.com article HTML
+Parses raw HTML (bytes, str, stream or saved file) with lxml and returns structured picks,
+so archived or freshly fetched articles are processed without launching Chrome
+"""
+
+import os
+import re
+from datetime import datetime
+from lxml import html
+
+RANKED_ITEM_XPATH = '//div[contains(concat(" ", normalize-space(@class), " "), " nfl-o-ranked-item ")]'
+
+
+def _class_xpath(class_name):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {class_name} ")'
+
+
+def _text(element):
+    return ' '.join(element.text_content().split()) if element is not None else ''
+
+
+def _first(elements):
+    return elements[0] if elements else None
+
+
+def parse_html(source):
+    """Parse NFL.com HTML into an lxml tree
+
+    source may be raw HTML as bytes or str, a binary/text stream, or an
+    os.PathLike path to a saved page. A str is always markup, never a path, so
+    error bodies and BOM-prefixed pages parse (to a tree without picks).
+    """
+    if isinstance(source, os.PathLike):
+        with open(source, 'rb') as f:
+            source = f.read()
+    elif hasattr(source, 'read'):
+        source = source.read()
+    if isinstance(source, str):
+        source = source.lstrip('\ufeff').encode('utf-8')
+    source = bytes(source).lstrip(b'\xef\xbb\xbf')
+    if not source.strip():
+        return html.Element('html')
+    return html.fromstring(source)
+
+
+def _parse_pick_number(item, fallback):
+    label = _first(item.xpath(f'.//*[{_class_xpath("nfl-o-ranked-item__label--second")}]'))
+    match = re.search(r'\d+', _text(label))
+    return int(match.group()) if match else fallback
+
+
+def _parse_player_info(player_block):
+    """Get school, position and class from a ranked player block"""
+    school = _text(_first(player_block.xpath(f'.//*[{_class_xpath("nfl-o-ranked-item__info-team-name")}]')))
+    position = ''
+    player_class = ''
+
+    for span in player_block.xpath(f'.//*[{_class_xpath("nfl-o-ranked-item__info")}]/span'):
+        text = _text(span)
+        parts = [part.strip() for part in text.split('·') if part.strip()]
+        if len(parts) >= 2 and not span.get('class'):
+            position, player_class = parts[0], parts[1]
+        elif len(parts) == 1 and not span.get('class') and not position:
+            position = parts[0]
+
+    return school, position, player_class
+
+
+def _image_url(block):
+    img = _first(block.xpath('.//img'))
+    if img is None:
+        return ''
+    # Drop the lazy-load transform so the URL serves the full image
+    return (img.get('data-src') or img.get('src') or '').replace('/t_lazy', '')
+
+
+def _analysis_after(item):
+    """Join paragraph text following a ranked item, up to the next ranked item"""
+    paragraphs = []
+    sibling = item.getnext()
+    while sibling is not None:
+        if sibling.xpath(f'self::*[{_class_xpath("nfl-o-ranked-item")}] | .//*[{_class_xpath("nfl-o-ranked-item")}]'):
+            break
+        for p in ([sibling] if sibling.tag == 'p' else sibling.xpath('.//p')):
+            text = _text(p)
+            if text:
+                paragraphs.append(text)
+        sibling = sibling.getnext()
+    return ' '.join(paragraphs)
+
+
+def extract_picks(source, max_picks=None):
+    """Extract structured picks from NFL.com article HTML
+
+    Returns a list of dicts with pick, team, player, school, position, class,
+    analysis and headshot_url keys, in page order.
+    """
+    tree = source if hasattr(source, 'xpath') else parse_html(source)
+    picks = []
+
+    for index, item in enumerate(tree.xpath(RANKED_ITEM_XPATH), 1):
+        blocks = item.xpath(f'./div[{_class_xpath("nfl-o-ranked-item__media-object")}]')
+        team_block = _first([b for b in blocks if 'nfl-is-ranked-player' not in (b.get('class') or '')])
+        player_block = _first([b for b in blocks if 'nfl-is-ranked-player' in (b.get('class') or '')])
+        if player_block is None:
+            continue
+
+        title_xpath = f'.//*[{_class_xpath("nfl-o-ranked-item__title")}]'
+        team = _text(_first(team_block.xpath(title_xpath))) if team_block is not None else ''
+        player = _text(_first(player_block.xpath(title_xpath)))
+        if not player:
+            continue
+
+        school, position, player_class = _parse_player_info(player_block)
+        picks.append({
+            'pick': _parse_pick_number(item, index),
+            'team': team,
+            'player': player,
+            'school': school,
+            'position': position,
+            'class': player_class,
+            'analysis': _analysis_after(item),
+            'headshot_url': _image_url(player_block),
+        })
+
+        if max_picks and len(picks) >= max_picks:
+            break
+
+    return picks
+
+
+def _parse_published_date(text):
+    match = re.search(r'([A-Z][a-z]{2}) (\d{1,2}), (\d{4})', text)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(' '.join(match.groups()), '%b %d %Y').strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def extract_article(source, url=None, max_picks=None):
+    """Extract a full mock draft (title, author, date, url, picks) from article HTML"""
+    tree = source if hasattr(source, 'xpath') else parse_html(source)
+
+    title = _text(_first(tree.xpath('//h1')))
+    if not title:
+        title = (_first(tree.xpath('//meta[@property="og:title"]/@content')) or 'NFL Mock Draft').strip()
+
+    author = _text(_first(tree.xpath(f'//*[{_class_xpath("nfl-o-author__name")}]'))) or 'Unknown'
+
+    date = None
+    time_elem = _first(tree.xpath('//time[@datetime]'))
+    if time_elem is not None:
+        date = time_elem.get('datetime')[:10]
+    if not date:
+        date = _parse_published_date(_text(_first(tree.xpath(f'//*[{_class_xpath("nfl-c-article__dates")}]'))))
+
+    return {
+        'title': title,
+        'author': author,
+        'date': date or datetime.now().strftime("%Y-%m-%d"),
+        'url': url,
+        'picks': extract_picks(tree, max_picks=max_picks),
+    }
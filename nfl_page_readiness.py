@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+NFL Page Readiness - Condition-driven waits for the Selenium capture path
+Replaces fixed time.sleep() pauses with checks that return as soon as the page is ready
+"""
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+DEFAULT_SCRIPT_TIMEOUT = 30  # WebDriver's own default, restored when the session's value cannot be read
+
+# Per-stage timeouts in seconds (upper bounds - each stage returns as soon as its condition holds)
+STAGE_TIMEOUTS = {
+    'dom_ready': 15,
+    'element_present': 10,
+    'images_decoded': 5,
+    'scroll_settled': 2,
+    'paint': 1,
+}
+
+# Resolves once every on-screen <img> under the root has loaded (or failed) and been decoded.
+# Off-screen lazy images are skipped since they will not load until scrolled to.
+IMAGES_DECODED_SCRIPT = """
+var root = arguments[0] || document;
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var images = root.tagName === 'IMG' ? [root] : Array.prototype.slice.call(root.querySelectorAll('img'));
+images = images.filter(function(img) {
+    var rect = img.getBoundingClientRect();
+    return rect.bottom >= 0 && rect.top <= window.innerHeight;
+});
+var timer = setTimeout(function() { done(false); }, timeoutMs);
+Promise.all(images.map(function(img) {
+    if (img.complete) {
+        return img.decode ? img.decode().catch(function() {}) : null;
+    }
+    return new Promise(function(resolve) {
+        img.addEventListener('load', resolve, {once: true});
+        img.addEventListener('error', resolve, {once: true});
+    });
+})).then(function() { clearTimeout(timer); done(true); });
+"""
+
+# Resolves once window.scrollY has been unchanged for consecutive animation frames
+SCROLL_SETTLED_SCRIPT = """
+var timeoutMs = arguments[0];
+var done = arguments[arguments.length - 1];
+var lastY = -1;
+var stableFrames = 0;
+var timer = setTimeout(function() { done(false); }, timeoutMs);
+function tick() {
+    var y = window.scrollY;
+    if (y === lastY) {
+        stableFrames++;
+    } else {
+        stableFrames = 0;
+        lastY = y;
+    }
+    if (stableFrames >= 3) {
+        clearTimeout(timer);
+        done(true);
+    } else {
+        requestAnimationFrame(tick);
+    }
+}
+requestAnimationFrame(tick);
+"""
+
+# Resolves after the next two animation frames, i.e. once pending style changes have painted
+NEXT_PAINT_SCRIPT = """
+var done = arguments[arguments.length - 1];
+requestAnimationFrame(function() { requestAnimationFrame(function() { done(true); }); });
+"""
+
+
+def _stage_timeout(stage, timeout):
+    return STAGE_TIMEOUTS[stage] if timeout is None else timeout
+
+
+def _run_async(driver, script, timeout, *args):
+    """Run an async script with a Selenium script timeout slightly above its own
+
+    The session's previous script timeout is put back afterwards, since pooled
+    and attached drivers are shared with other code.
+    """
+    try:
+        previous = driver.timeouts.script
+    except WebDriverException:
+        previous = DEFAULT_SCRIPT_TIMEOUT
+    try:
+        driver.set_script_timeout(timeout + 1)
+        return bool(driver.execute_async_script(script, *args))
+    except (TimeoutException, WebDriverException):
+        return False
+    finally:
+        try:
+            driver.set_script_timeout(previous)
+        except WebDriverException:
+            pass
+
+
+def wait_for_dom_ready(driver, timeout=None):
+    """Wait until document.readyState is 'complete'"""
+    timeout = _stage_timeout('dom_ready', timeout)
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == 'complete'
+        )
+        return True
+    except TimeoutException:
+        print(f"   ⚠️ DOM not ready after {timeout}s, continuing")
+        return False
+
+
+def wait_for_element(driver, selector, timeout=None):
+    """Wait until at least one element matching the CSS selector is present"""
+    timeout = _stage_timeout('element_present', timeout)
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+    except TimeoutException:
+        return None
+
+
+def wait_for_any_element(driver, selectors, timeout=None):
+    """Wait until any of the CSS selectors matches; returns the selector that matched"""
+    timeout = _stage_timeout('element_present', timeout)
+    combined = ', '.join(selectors)
+    if wait_for_element(driver, combined, timeout) is None:
+        return None
+    for selector in selectors:
+        if driver.find_elements(By.CSS_SELECTOR, selector):
+            return selector
+    return None
+
+
+def wait_for_images_decoded(driver, element=None, timeout=None):
+    """Wait until all images inside element (or the whole document) are loaded and decoded"""
+    timeout = _stage_timeout('images_decoded', timeout)
+    return _run_async(driver, IMAGES_DECODED_SCRIPT, timeout, element, int(timeout * 1000))
+
+
+def wait_for_scroll_settled(driver, timeout=None):
+    """Wait until scrolling (including smooth scrolling) has stopped, via requestAnimationFrame"""
+    timeout = _stage_timeout('scroll_settled', timeout)
+    return _run_async(driver, SCROLL_SETTLED_SCRIPT, timeout, int(timeout * 1000))
+
+
+def wait_for_paint(driver, timeout=None):
+    """Wait for pending DOM/style changes to be painted"""
+    timeout = _stage_timeout('paint', timeout)
+    return _run_async(driver, NEXT_PAINT_SCRIPT, timeout)
+
+
+def wait_for_page_ready(driver, selectors=None, timeouts=None):
+    """Wait for DOM-ready, then for the first matching content selector, then for images to decode
+
+    timeouts may override any entry of STAGE_TIMEOUTS for this call.
+    Returns the selector that matched (or None when no selector was found in time).
+    """
+    timeouts = {**STAGE_TIMEOUTS, **(timeouts or {})}
+
+    wait_for_dom_ready(driver, timeouts['dom_ready'])
+
+    matched = None
+    if selectors:
+        matched = wait_for_any_element(driver, selectors, timeouts['element_present'])
+        if not matched:
+            print(f"   ⚠️ None of {selectors} appeared within {timeouts['element_present']}s")
+
+    wait_for_images_decoded(driver, None, timeouts['images_decoded'])
+    return matched
+
+
+def scroll_into_view(driver, element, block='center', smooth=False, timeout=None):
+    """Scroll element into view and wait for the scroll and its images to settle"""
+    behavior = 'smooth' if smooth else 'instant'
+    driver.execute_script(
+        f"arguments[0].scrollIntoView({{block: '{block}', behavior: '{behavior}'}});", element
+    )
+    wait_for_scroll_settled(driver, timeout)
+    wait_for_images_decoded(driver, element)
+
+
+def scroll_to(driver, y, timeout=None):
+    """Scroll the window to a y offset and wait for lazy content at that position"""
+    driver.execute_script("window.scrollTo(0, arguments[0]);", y)
+    wait_for_scroll_settled(driver, timeout)
+    wait_for_images_decoded(driver)
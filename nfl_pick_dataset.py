@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+NFL Pick Dataset - Columnar Parquet export of stored picks for analytics
+Picks from the draft store are written as a typed dataset partitioned by draft
+year and author, and loaded back memory-mapped into a pandas DataFrame
+"""
+
+import argparse
+import glob
+import os
+import shutil
+from urllib.parse import quote
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from nfl_draft_store import DEFAULT_DB_PATH, get_draft_store
+
+DATASET_ROOT = 'processed/pick_dataset'
+
+PARTITION_COLUMNS = ['draft_year', 'author']
+
+# Low-cardinality text repeated on every pick; stored dictionary-encoded
+CATEGORY_COLUMNS = ['author', 'team', 'position', 'school', 'class']
+
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+# Fixed Arrow schema so every partition file agrees, even where a column is all null
+PICK_SCHEMA = pa.schema([
+    ('draft_year', pa.int16()),
+    ('author', CATEGORY),
+    ('url', pa.string()),
+    ('title', pa.string()),
+    ('published', pa.string()),
+    ('pick', pa.uint16()),
+    ('team', CATEGORY),
+    ('player', pa.string()),
+    ('school', CATEGORY),
+    ('position', CATEGORY),
+    ('class', CATEGORY),
+    ('headshot_url', pa.string()),
+    ('analysis', pa.string()),
+])
+
+# Matching pandas dtypes for the frame handed to pyarrow
+COLUMN_TYPES = {
+    'draft_year': 'Int16',
+    'pick': 'uint16',
+    'url': 'string',
+    'title': 'string',
+    'published': 'string',
+    'player': 'string',
+    'headshot_url': 'string',
+    'analysis': 'string',
+}
+
+# Partition values are typed explicitly; inferred ones come back as strings
+PARTITIONING = ds.partitioning(pa.schema([PICK_SCHEMA.field(name) for name in PARTITION_COLUMNS]),
+                               flavor='hive', dictionaries='infer')
+
+
+def picks_frame(rows):
+    """Typed DataFrame from draft store pick rows"""
+    frame = pd.DataFrame.from_records(rows, columns=PICK_SCHEMA.names)
+    frame = frame.astype(COLUMN_TYPES)
+    for column in CATEGORY_COLUMNS:
+        frame[column] = frame[column].astype('category')
+    return frame
+
+
+def _clear_partitions(root, authors=None):
+    """Remove the given authors' partitions in every draft year (everything when authors is None)
+
+    A draft whose year changed would otherwise linger in its old partition.
+    """
+    if authors is None:
+        shutil.rmtree(root, ignore_errors=True)
+        return
+    for author in authors:
+        for path in glob.glob(os.path.join(glob.escape(root), '*', f'author={quote(author, safe="")}')):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def export_pick_dataset(root=DATASET_ROOT, authors=None, db_path=DEFAULT_DB_PATH):
+    """Write stored picks (all, or only the given authors') to the Parquet dataset
+
+    Only the exported authors' partitions are rewritten, so refreshing one
+    author leaves everyone else's files untouched. Returns the number of
+    picks written.
+    """
+    frame = picks_frame(get_draft_store(db_path).pick_rows(authors=authors))
+    _clear_partitions(root, authors)
+    if frame.empty:
+        return 0
+    frame.to_parquet(root, engine='pyarrow', index=False, partition_cols=PARTITION_COLUMNS,
+                     schema=PICK_SCHEMA, basename_template='picks-{i}.parquet')
+    return len(frame)
+
+
+def export_mock_drafts(mock_drafts, root=DATASET_ROOT, db_path=DEFAULT_DB_PATH):
+    """Refresh the partitions of the authors in mock_drafts, reporting (not raising) errors"""
+    authors = sorted({draft.get('author') or 'Unknown' for draft in mock_drafts if draft.get('picks')})
+    if not authors:
+        return 0
+    try:
+        written = export_pick_dataset(root, authors, db_path)
+        print(f"🗂️ Exported {written} picks for {len(authors)} authors to {root}")
+        return written
+    except (OSError, ValueError, pa.ArrowException) as e:
+        print(f"⚠️ Could not export pick dataset: {e}")
+        return 0
+
+
+def load_pick_dataset(root=DATASET_ROOT, authors=None, years=None, columns=None):
+    """Memory-mapped read of the dataset; authors/years prune partitions before any file is opened"""
+    filters = []
+    if authors:
+        filters.append(('author', 'in', list(authors)))
+    if years:
+        filters.append(('draft_year', 'in', [int(year) for year in years]))
+    return pd.read_parquet(root, engine='pyarrow', columns=columns, filters=filters or None,
+                           partitioning=PARTITIONING, memory_map=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export stored mock draft picks to a Parquet dataset")
+    parser.add_argument('--root', default=DATASET_ROOT, help=f"Dataset directory (default: {DATASET_ROOT})")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f"Draft store database (default: {DEFAULT_DB_PATH})")
+    parser.add_argument('--author', action='append', help="Only export this author (repeatable)")
+    args = parser.parse_args()
+
+    written = export_pick_dataset(args.root, args.author, args.db)
+    if not written:
+        print(f"⚠️ No stored picks in {args.db}")
+        return
+
+    frame = load_pick_dataset(args.root, authors=args.author)
+    print(f"✓ Exported {written} picks to {args.root}")
+    print(f"📊 {frame['url'].nunique()} mock drafts by {frame['author'].nunique()} authors, "
+          f"{frame['player'].nunique()} distinct players")
+
+
+if __name__ == "__main__":
+    main()
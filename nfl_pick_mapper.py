@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+NFL Pick Mapper - Single-round-trip DOM snapshot and pick-to-analysis mapping
+One injected script returns every ranked item and paragraph with its page offset,
+then pure-Python code maps each pick to its analysis text in linear time
+"""
+
+from nfl_text_classifier import classify, teams_mentioned
+
+# Returns every ranked item and paragraph with its y-offset (page coordinates) and text
+PAGE_SNAPSHOT_SCRIPT = """
+var pickSelector = arguments[0];
+function describe(el, i) {
+    var rect = el.getBoundingClientRect();
+    return {index: i, y: Math.round(rect.top + window.scrollY), text: el.textContent || ''};
+}
+return {
+    picks: Array.prototype.map.call(document.querySelectorAll(pickSelector), describe),
+    paragraphs: Array.prototype.map.call(document.querySelectorAll('p'), describe)
+};
+"""
+
+DEFAULT_PICK_SELECTOR = '.nfl-o-ranked-item.nfl-o-ranked-item--side-by-side'
+
+
+def capture_page_snapshot(driver, pick_selector=DEFAULT_PICK_SELECTOR):
+    """Fetch all picks and paragraphs with positions and text in one WebDriver call"""
+    snapshot = driver.execute_script(PAGE_SNAPSHOT_SCRIPT, pick_selector) or {}
+    return {
+        'picks': snapshot.get('picks', []),
+        'paragraphs': snapshot.get('paragraphs', []),
+    }
+
+
+def clean_description(text, limit=400):
+    """Collapse whitespace and truncate long analysis text"""
+    description = ' '.join(text.replace('\n', ' ').replace('\t', ' ').split())
+    if len(description) > limit:
+        description = description[:limit] + '...'
+    return description
+
+
+def parse_pick_text(pick_text):
+    """Get (team_name, player_name) from a ranked item's text content"""
+    team_name = None
+    player_name = None
+
+    for line in (line.strip() for line in pick_text.split('\n')):
+        if not line:
+            continue
+        if 'team' in classify(line):
+            team_name = line
+        # Player name is typically 2 words starting with a capital
+        elif len(line.split()) == 2 and line[0].isupper() and 'pick' not in line.lower():
+            player_name = line
+            break
+
+    return team_name, player_name
+
+
+def is_analysis_paragraph(text, category='analysis'):
+    """Whether paragraph text looks like pick analysis rather than page chrome
+
+    category names the nfl_text_classifier keyword list the text must match.
+    """
+    text_lower = text.lower()
+    return (50 < len(text) < 1000 and
+            category in classify(text) and
+            not text.startswith('Pick') and
+            '©' not in text and
+            'nfl.com' not in text_lower and
+            'cookie' not in text_lower and
+            'privacy' not in text_lower)
+
+
+def _analysis_paragraphs(snapshot, category='analysis'):
+    """Analysis paragraphs as (y, text) sorted by page position"""
+    paragraphs = []
+    for para in snapshot['paragraphs']:
+        text = para['text'].strip()
+        if text and is_analysis_paragraph(text, category):
+            paragraphs.append((para['y'], text))
+    paragraphs.sort(key=lambda x: x[0])
+    return paragraphs
+
+
+def filter_sequential_analysis(snapshot):
+    """Analysis paragraphs between the first pick and shortly after the last, intro/outro removed
+
+    Used for sequential mapping, where pick N gets analysis paragraph N.
+    """
+    picks = snapshot['picks']
+    if not picks:
+        return []
+
+    first_pick_y = picks[0]['y']
+    last_pick_y = picks[-1]['y']
+
+    return [text for y, text in _analysis_paragraphs(snapshot, 'sequential_analysis')
+            if first_pick_y < y < last_pick_y + 2000 and
+            'intro_outro' not in classify(text)]
+
+
+def _mentions_team(text, team_name):
+    team_lower = team_name.lower()
+    return any(team_key in team_lower for team_key in teams_mentioned(text))
+
+
+def _fallback_from_pick_text(pick_text, pick_number, author):
+    lines = [line.strip() for line in pick_text.split('\n') if line.strip()]
+    substantial_lines = [line for line in lines if len(line) > 30 and not line.isupper() and 'Pick' not in line]
+    if substantial_lines:
+        return clean_description(substantial_lines[0], limit=300)
+    return f"Draft analysis for pick #{pick_number} by {author}."
+
+
+def map_picks_to_analysis(snapshot, author, max_picks=32):
+    """Map each pick number (1-based) to its analysis text
+
+    Picks and paragraphs are both walked in page order with a single moving
+    pointer, so the whole mapping is linear in picks + paragraphs. For each pick
+    the candidates are the analysis paragraphs between it and the next pick; a
+    candidate that mentions the player or team wins, otherwise the closest one
+    after the pick is used.
+    """
+    picks = sorted(snapshot['picks'][:max_picks], key=lambda p: p['y'])
+    paragraphs = _analysis_paragraphs(snapshot)
+    descriptions = {}
+
+    cursor = 0
+    for position, pick in enumerate(picks):
+        pick_number = pick['index'] + 1
+        pick_y = pick['y']
+        next_pick_y = picks[position + 1]['y'] if position + 1 < len(picks) else float('inf')
+
+        # Advance to the first paragraph below this pick
+        while cursor < len(paragraphs) and paragraphs[cursor][0] <= pick_y:
+            cursor += 1
+
+        end = cursor
+        while end < len(paragraphs) and paragraphs[end][0] < next_pick_y:
+            end += 1
+        candidates = [text for _, text in paragraphs[cursor:end]]
+
+        team_name, player_name = parse_pick_text(pick['text'])
+        description = None
+
+        for text in candidates[:3]:
+            text_lower = text.lower()
+            if player_name and player_name.lower() in text_lower:
+                description = text
+                break
+            if team_name and _mentions_team(text, team_name):
+                description = text
+                break
+
+        if description is None and cursor < len(paragraphs):
+            # Closest analysis below the pick, even if past the next pick
+            description = paragraphs[cursor][1]
+
+        if description is not None:
+            descriptions[pick_number] = clean_description(description)
+        else:
+            descriptions[pick_number] = _fallback_from_pick_text(pick['text'], pick_number, author)
+
+    return descriptions
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+NFL Placeholder Renderer - Shared drawing for placeholder headshots and pick cards
+Fonts are loaded once per process, gradient backgrounds are rendered once per
+canvas size and copied, and finished placeholders are memoized in the image store
+"""
+
+from functools import lru_cache
+from PIL import Image, ImageDraw, ImageFont
+from nfl_image_store import get_image_store, placeholder_identity, PLACEHOLDER
+
+DEFAULT_FONT = "Arial.ttf"
+
+
+@lru_cache(maxsize=None)
+def get_font(size, name=DEFAULT_FONT):
+    """Process-wide font cache; falls back to PIL's default font when name is missing"""
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=None)
+def _gradient_template(width, height, top, drop, tint):
+    column = Image.new('RGB', (1, height))
+    rows = []
+    for y in range(height):
+        value = int(top - (y * drop / height))
+        rows.append((value + tint[0], value + tint[1], value + tint[2]))
+    column.putdata(rows)
+    return column.resize((width, height), Image.NEAREST)
+
+
+def gradient_canvas(width, height, top, drop, tint=(0, 0, 0)):
+    """Fresh copy of a vertical gradient, rendered once per (size, colors)
+
+    Row y is top - y * drop / height, plus tint per channel.
+    """
+    return _gradient_template(width, height, top, drop, tuple(tint)).copy()
+
+
+def _centered_x(draw, text, font, width):
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return (width - (bbox[2] - bbox[0])) // 2
+
+
+def _split_name(player_name):
+    name_parts = player_name.split()
+    if len(name_parts) >= 2:
+        return name_parts[0], ' '.join(name_parts[1:])
+    return None
+
+
+def render_nfl_style(player_name, pick_number):
+    """NFL.com style placeholder (wide aspect ratio)"""
+    width, height = 350, 254
+    img = gradient_canvas(width, height, 245, 20, (0, 2, 5))
+    draw = ImageDraw.Draw(img)
+
+    # Add border similar to ESPN/NFL.com
+    draw.rectangle([5, 5, 345, 249], outline=(180, 180, 180), width=2)
+
+    font_large = get_font(22)
+    font_small = get_font(14)
+
+    names = _split_name(player_name)
+    if names:
+        for name, y in zip(names, (100, 130)):
+            draw.text((_centered_x(draw, name, font_large, width), y), name, fill=(60, 60, 60), font=font_large)
+
+    pick_text = f"2025 NFL Draft Pick #{pick_number}"
+    draw.text((_centered_x(draw, pick_text, font_small, width), 180), pick_text, fill=(120, 120, 120), font=font_small)
+    return img
+
+
+def render_enhanced(player_name, pick_number):
+    """High-quality portrait placeholder with shadowed name and NFL shield"""
+    width, height = 400, 500
+    img = gradient_canvas(width, height, 250, 30, (0, 5, 10))
+    draw = ImageDraw.Draw(img)
+
+    # Add professional border
+    draw.rectangle([15, 15, 385, 485], outline=(80, 80, 80), width=4)
+    draw.rectangle([20, 20, 380, 480], outline=(150, 150, 150), width=2)
+
+    font_name = get_font(28)
+    font_detail = get_font(16)
+    font_pick = get_font(20)
+
+    names = _split_name(player_name)
+    if names:
+        for name, y in zip(names, (200, 240)):
+            x = _centered_x(draw, name, font_name, width)
+            # Add text shadow effect
+            draw.text((x + 2, y + 2), name, fill=(200, 200, 200), font=font_name)
+            draw.text((x, y), name, fill=(40, 40, 40), font=font_name)
+
+    pick_text = f"2025 NFL Draft Pick #{pick_number}"
+    x = _centered_x(draw, pick_text, font_pick, width)
+    draw.text((x + 1, 321), pick_text, fill=(150, 150, 150), font=font_pick)
+    draw.text((x, 320), pick_text, fill=(70, 70, 70), font=font_pick)
+
+    # Add NFL shield placeholder
+    shield_x, shield_y = 175, 350
+    draw.ellipse([shield_x, shield_y, shield_x + 50, shield_y + 40], outline=(100, 100, 100), width=3)
+    draw.text((shield_x + 15, shield_y + 12), "NFL", fill=(100, 100, 100), font=font_detail)
+    return img
+
+
+def render_professional(player_name, pick_number):
+    """Grey portrait placeholder with a team logo box"""
+    width, height = 300, 400
+    img = gradient_canvas(width, height, 245, 20)
+    draw = ImageDraw.Draw(img)
+
+    draw.rectangle([10, 10, 290, 390], outline=(100, 100, 100), width=3)
+
+    font_large = get_font(24)
+    font_small = get_font(14)
+
+    names = _split_name(player_name)
+    if names:
+        for name, y in zip(names, (150, 185)):
+            draw.text((_centered_x(draw, name, font_large, width), y), name, fill=(50, 50, 50), font=font_large)
+
+    pick_text = f"2025 NFL Draft Pick #{pick_number}"
+    draw.text((_centered_x(draw, pick_text, font_small, width), 250), pick_text, fill=(100, 100, 100), font=font_small)
+
+    # Add team logo area placeholder
+    draw.rectangle([100, 300, 200, 350], outline=(150, 150, 150), width=2)
+    logo_text = "TEAM"
+    bbox = draw.textbbox((0, 0), logo_text, font=font_small)
+    draw.text((150 - (bbox[2] - bbox[0]) // 2, 320), logo_text, fill=(150, 150, 150), font=font_small)
+    return img
+
+
+def render_compact(player_name, pick_number):
+    """Small flat placeholder with name and pick number"""
+    width, height = 200, 250
+    img = Image.new('RGB', (width, height), color=(240, 240, 240))
+    draw = ImageDraw.Draw(img)
+
+    draw.rectangle([5, 5, 195, 245], outline=(100, 100, 100), width=2)
+
+    font_large = get_font(18)
+    font_small = get_font(14)
+
+    names = _split_name(player_name)
+    if names:
+        for name, y in zip(names, (100, 130)):
+            draw.text((_centered_x(draw, name, font_large, width), y), name, fill=(50, 50, 50), font=font_large)
+
+    pick_text = f"#{pick_number}"
+    draw.text((_centered_x(draw, pick_text, font_small, width), 180), pick_text, fill=(100, 100, 100), font=font_small)
+    return img
+
+
+PLACEHOLDER_STYLES = {
+    'nfl_style': render_nfl_style,
+    'enhanced': render_enhanced,
+    'professional': render_professional,
+    'compact': render_compact,
+}
+
+
+def render_placeholder(player_name, pick_number, style):
+    """Path to the (player, pick, style) placeholder, rendering it only on first use"""
+    store = get_image_store()
+    identity = placeholder_identity(player_name, pick_number, style)
+    existing = store.get(identity, kind=PLACEHOLDER)
+    if existing:
+        return existing
+
+    img = PLACEHOLDER_STYLES[style](player_name, pick_number)
+    return store.put_image(img, identity, PLACEHOLDER, f'render_{style}')
@@ -5,22 +5,33 @@ Analyzes NFL.com mock draft pages to create a ranked list of players by frequenc
 """
 
 import os
-import time
 from datetime import datetime
-from collections import Counter
 from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint
+from nfl_offline_extractor import extract_picks
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
+import requests
+from nfl_http_cache import create_cached_session
+from nfl_text_classifier import classify, looks_like_name
+from nfl_player_registry import canonical_name
+from nfl_consensus import consensus_rankings, describe_consensus, ranked_counts, selected_by
+from nfl_draft_store import drafts_from_selections, save_mock_drafts
 
 class NFLPlayerRankingAnalyzer:
     def __init__(self):
-        self.setup_selenium()
+        # Chrome is only launched if an article cannot be parsed offline
+        self.driver = None
+        self.selenium_attempted = False
+        self.session = create_cached_session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
         
         # UPDATED URLs as provided by user
         self.author_urls = {
@@ -37,40 +48,67 @@ class NFLPlayerRankingAnalyzer:
         
         self.all_players = []
         self.player_selections = {}  # {player_name: {author: pick_number}}
+        self.author_weights = None  # {author: weight} for the consensus; None weighs everyone equally
 
     def setup_selenium(self):
         """Setup Selenium WebDriver"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--headless')  # Run headless for faster processing
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver(headless=True)
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
             self.driver = None
 
+    def extract_players_offline(self, url, author):
+        """Extract player names from the article HTML without a browser"""
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"   ⚠️ Could not fetch {author}'s article: {e}")
+            return []
+        
+        players = []
+        for pick in extract_picks(response.content, max_picks=20):  # Top 20 picks
+            player_name = canonical_name(pick['player'])
+            players.append({
+                'name': player_name,
+                'pick': pick['pick'],
+                'author': author
+            })
+            print(f"   ✓ Pick {pick['pick']}: {player_name}")
+            
+            # Track in master list
+            if player_name not in self.player_selections:
+                self.player_selections[player_name] = {}
+            self.player_selections[player_name][author] = pick['pick']
+        
+        if players:
+            print(f"   📋 Parsed {len(players)} draft picks for {author} without a browser")
+        return players
+
     def extract_players_from_author(self, url, author):
         """Extract player names from an author's mock draft"""
+        print(f"🔍 Analyzing {author}'s mock draft...")
+        
+        players = self.extract_players_offline(url, author)
+        if players:
+            return players
+        
+        # Fall back to a live browser for pages the offline parser cannot read
+        if not self.driver and not self.selenium_attempted:
+            self.selenium_attempted = True
+            self.setup_selenium()
         if not self.driver:
             return []
-            
-        players = []
         
         try:
-            print(f"🔍 Analyzing {author}'s mock draft...")
-            
             self.driver.get(url)
-            time.sleep(8)
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(2)
+            wait_for_paint(self.driver)
             
             # Look for NFL.com draft pick elements
             pick_selectors = [
@@ -96,6 +134,7 @@ class NFLPlayerRankingAnalyzer:
                         player_name = self.extract_player_name_from_element(pick_element)
                         
                         if player_name:
+                            player_name = canonical_name(player_name)
                             players.append({
                                 'name': player_name,
                                 'pick': i,
@@ -168,17 +207,7 @@ class NFLPlayerRankingAnalyzer:
             text = re.sub(r'(Quarterback|Running Back|Wide Receiver|Tight End)', '', text, flags=re.IGNORECASE).strip()
             
             # Skip team names
-            team_names = [
-                'Titan', 'Brown', 'Giant', 'Patriot', 'Jaguar', 'Raider', 'Jet', 'Panther',
-                'Saint', 'Bear', 'Francisco', 'Cowboy', 'Dolphin', 'Colt', 'Falcon',
-                'Cardinal', 'Bengal', 'Seahawk', 'Buccaneer', 'Bronco', 'Packer', 'Charger',
-                'Chiefs', 'Bills', 'Steelers', 'Ravens', 'Lions', 'Vikings', 'Packers',
-                'Bears', 'Saints', 'Falcons', 'Panthers', 'Buccaneers', 'Rams', 'Cardinals',
-                'Seahawks', 'Niners', 'Cowboys', 'Giants', 'Eagles', 'Commanders', 'Titans',
-                'Colts', 'Texans', 'Jaguars', 'Broncos', 'Chiefs', 'Raiders', 'Chargers'
-            ]
-            
-            if any(team in text for team in team_names):
+            if 'team_stem' in classify(text):
                 return None
             
             # Extract name patterns (First Last or First Middle Last)
@@ -205,7 +234,7 @@ class NFLPlayerRankingAnalyzer:
             # Common player name patterns in NFL.com structure
             for line in lines:
                 # Skip lines that are clearly not names
-                if any(skip in line.lower() for skip in ['pick', 'round', 'draft', 'team', 'position']):
+                if 'label' in classify(line):
                     continue
                     
                 # Look for player names - typically appear after team names
@@ -235,43 +264,12 @@ class NFLPlayerRankingAnalyzer:
         if not name or len(name) < 4:
             return False
         
-        # Skip obvious non-names
-        skip_words = [
-            'pick', 'round', 'draft', 'team', 'position', 'college', 'university',
-            'quarterback', 'running', 'wide', 'tight', 'offensive', 'defensive',
-            'linebacker', 'cornerback', 'safety', 'kicker', 'punter'
-        ]
-        
-        if any(skip in name.lower() for skip in skip_words):
-            return False
-        
-        # Skip team names (more comprehensive list)
-        team_names = [
-            'Titan', 'Brown', 'Giant', 'Patriot', 'Jaguar', 'Raider', 'Jet', 'Panther',
-            'Saint', 'Bear', 'Francisco', 'Cowboy', 'Dolphin', 'Colt', 'Falcon',
-            'Cardinal', 'Bengal', 'Seahawk', 'Buccaneer', 'Bronco', 'Packer', 'Charger',
-            'Chiefs', 'Bills', 'Steelers', 'Ravens', 'Lions', 'Vikings', 'Packers',
-            'Bears', 'Saints', 'Falcons', 'Panthers', 'Buccaneers', 'Rams', 'Cardinals',
-            'Seahawks', 'Niners', 'Cowboys', 'Giants', 'Eagles', 'Commanders', 'Titans',
-            'Colts', 'Texans', 'Jaguars', 'Broncos', 'Chiefs', 'Raiders', 'Chargers'
-        ]
-        
-        for team in team_names:
-            if team.lower() in name.lower():
-                return False
-        
-        # Should have 2-3 words
-        words = name.split()
-        if len(words) < 2 or len(words) > 3:
+        # Skip obvious non-names and team names
+        if classify(name) & {'label', 'school', 'position', 'team_stem'}:
             return False
         
-        # All words should be properly capitalized and alpha
-        for word in words:
-            clean_word = word.replace('.', '').replace("'", '')
-            if not clean_word.isalpha() or not (word[0].isupper() and word[1:].islower()):
-                return False
-        
-        return True
+        # 2-3 properly capitalized, alphabetic words
+        return looks_like_name(name)
 
     def remove_overlays(self):
         """Remove cookie banners and overlays"""
@@ -302,16 +300,16 @@ class NFLPlayerRankingAnalyzer:
             self.all_players.extend(players)
         
         print(f"\n✓ Analysis complete! Found {len(self.all_players)} total player selections")
+        save_mock_drafts(drafts_from_selections(self.all_players, self.author_urls), merge=True)
 
     def create_player_ranking_document(self):
         """Create a Word document with player rankings"""
         print("📊 Creating player ranking document...")
         
-        # Count player frequencies
-        player_counts = Counter(selection['name'] for selection in self.all_players)
-        
-        # Sort by frequency (most picked first)
-        ranked_players = player_counts.most_common()
+        # Consensus across authors: frequency, pick spread and team affinity in one pass
+        rankings = consensus_rankings(self.all_players, self.author_weights)
+        ranked_players = ranked_counts(rankings)
+        authors_by_player = selected_by(self.all_players) if self.all_players else {}
         
         # Create Word document
         doc = Document()
@@ -352,7 +350,9 @@ class NFLPlayerRankingAnalyzer:
         ranking_header_run.font.color.rgb = RGBColor(0, 53, 148)
         
         # Add each player
-        for rank, (player_name, count) in enumerate(ranked_players, 1):
+        for rank, consensus in enumerate(rankings.to_dict('records'), 1):
+            player_name, count = consensus['player'], consensus['selections']
+            
             # Player entry
             player_para = doc.add_paragraph()
             
@@ -372,10 +372,17 @@ class NFLPlayerRankingAnalyzer:
             count_run.font.size = Pt(11)
             count_run.font.color.rgb = RGBColor(220, 38, 127)  # Pink accent
             
+            # Consensus pick position and most frequent destination
+            consensus_para = doc.add_paragraph()
+            consensus_run = consensus_para.add_run(f"    {describe_consensus(consensus)}")
+            consensus_run.font.size = Pt(9)
+            consensus_run.font.color.rgb = RGBColor(0, 53, 148)
+            consensus_para.space_after = Pt(2)
+            
             # Show which authors picked this player
-            if player_name in self.player_selections:
+            if player_name in authors_by_player:
                 authors_info = []
-                for author, pick_num in self.player_selections[player_name].items():
+                for author, pick_num in authors_by_player[player_name].items():
                     authors_info.append(f"{author} (#{pick_num})")
                 
                 if authors_info:
@@ -396,8 +403,8 @@ class NFLPlayerRankingAnalyzer:
         methodology_text = [
             "• Analyzed mock drafts from 9 NFL.com expert analysts",
             "• Extracted player names from first 20 picks of each mock draft", 
-            "• Ranked players by total number of selections across all analysts",
-            "• Included pick position for each selection to show expert consensus",
+            "• Ranked players by total number of selections across all analysts, ties broken by average pick",
+            "• Included average, median and range of pick positions and the most frequent team to show expert consensus",
             f"• Data collected on {datetime.now().strftime('%B %d, %Y')}"
         ]
         
@@ -417,7 +424,7 @@ class NFLPlayerRankingAnalyzer:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
 
 def main():
     print("=== NFL Player Ranking Analyzer ===")
@@ -427,10 +434,6 @@ def main():
     
     analyzer = NFLPlayerRankingAnalyzer()
     
-    if not analyzer.driver:
-        print("❌ Cannot proceed without WebDriver")
-        return
-    
     try:
         # Analyze all authors
         analyzer.analyze_all_authors()
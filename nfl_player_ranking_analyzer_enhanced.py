@@ -5,23 +5,35 @@ Analyzes NFL.com mock draft pages to create a ranked list of players by frequenc
 Enhanced version with better player name extraction
 """
 
+import argparse
 import os
-import time
 from datetime import datetime
-from collections import Counter
 from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint
+from nfl_offline_extractor import extract_picks
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import re
+import requests
+from nfl_http_cache import create_cached_session
+from nfl_text_classifier import classify, looks_like_name
+from nfl_player_registry import canonical_name
+from nfl_consensus import consensus_rankings, describe_consensus, ranked_counts, selected_by, recency_weights
+from nfl_draft_store import drafts_from_selections, get_draft_store, save_mock_drafts
 
 class NFLPlayerRankingAnalyzerEnhanced:
     def __init__(self):
-        self.setup_selenium()
+        # Chrome is only launched if an article cannot be parsed offline
+        self.driver = None
+        self.selenium_attempted = False
+        self.session = create_cached_session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
         
         # UPDATED URLs - REMOVED Lance Zierlein and Chad Reuter as requested
         self.author_urls = {
@@ -36,40 +48,72 @@ class NFLPlayerRankingAnalyzerEnhanced:
         
         self.all_players = []
         self.player_selections = {}  # {player_name: {author: pick_number}}
+        self.author_weights = None  # {author: weight} for the consensus; None weighs everyone equally
 
     def setup_selenium(self):
         """Setup Selenium WebDriver"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--headless')  # Run headless for faster processing
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver(headless=True)
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
             self.driver = None
 
+    def record_picks(self, author, picks):
+        """Track structured picks (nfl_offline_extractor format) for one author"""
+        players = []
+        for pick in picks:
+            player_name = canonical_name(pick['player'])
+            players.append({
+                'name': player_name,
+                'pick': pick['pick'],
+                'author': author,
+                'team': pick.get('team')
+            })
+            print(f"   ✓ Pick {pick['pick']}: {player_name}")
+            
+            # Track in master list
+            if player_name not in self.player_selections:
+                self.player_selections[player_name] = {}
+            self.player_selections[player_name][author] = pick['pick']
+        return players
+
+    def extract_players_offline(self, url, author):
+        """Extract player names from the article HTML without a browser"""
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"   ⚠️ Could not fetch {author}'s article: {e}")
+            return []
+        
+        players = self.record_picks(author, extract_picks(response.content, max_picks=32))  # Top 32 picks
+        if players:
+            print(f"   📋 Parsed {len(players)} draft picks for {author} without a browser")
+        return players
+
     def extract_players_from_author(self, url, author):
         """Extract player names from an author's mock draft"""
+        print(f"🔍 Analyzing {author}'s mock draft...")
+        
+        players = self.extract_players_offline(url, author)
+        if players:
+            return players
+        
+        # Fall back to a live browser for pages the offline parser cannot read
+        if not self.driver and not self.selenium_attempted:
+            self.selenium_attempted = True
+            self.setup_selenium()
         if not self.driver:
             return []
-            
-        players = []
         
         try:
-            print(f"🔍 Analyzing {author}'s mock draft...")
-            
             self.driver.get(url)
-            time.sleep(10)  # Increased wait time
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(2)
+            wait_for_paint(self.driver)
             
             # Enhanced element selection - look for different patterns
             pick_elements = self.find_draft_pick_elements()
@@ -83,6 +127,7 @@ class NFLPlayerRankingAnalyzerEnhanced:
                         player_name = self.extract_player_name_comprehensive(pick_element, i)
                         
                         if player_name:
+                            player_name = canonical_name(player_name)
                             players.append({
                                 'name': player_name,
                                 'pick': i,
@@ -229,7 +274,7 @@ class NFLPlayerRankingAnalyzerEnhanced:
             # Look for likely player names in the lines
             for line in lines:
                 # Skip obvious non-player lines
-                if any(skip in line.lower() for skip in ['pick', 'round', 'draft', 'team', 'position']):
+                if 'label' in classify(line):
                     continue
                 
                 # Look for names that follow standard patterns
@@ -259,38 +304,14 @@ class NFLPlayerRankingAnalyzerEnhanced:
             text = re.sub(r'(QB|RB|WR|TE|OL|DL|LB|CB|S|K|P)$', '', text, flags=re.IGNORECASE).strip()
             text = re.sub(r'[,\-\|].*$', '', text).strip()  # Remove everything after comma, dash, or pipe
             
-            # Team name filtering
-            team_keywords = [
-                'titans', 'browns', 'giants', 'patriots', 'jaguars', 'raiders', 'jets', 'panthers',
-                'saints', 'bears', 'francisco', 'cowboys', 'dolphins', 'colts', 'falcons',
-                'cardinals', 'bengals', 'seahawks', 'buccaneers', 'broncos', 'packers', 'chargers',
-                'chiefs', 'bills', 'steelers', 'ravens', 'lions', 'vikings', 'rams', 'eagles',
-                'commanders', 'texans', 'titan', 'brown', 'giant', 'patriot', 'jaguar', 'raider',
-                'jet', 'panther', 'saint', 'bear', 'cowboy', 'dolphin', 'colt', 'falcon',
-                'cardinal', 'bengal', 'seahawk', 'buccaneer', 'bronco', 'packer', 'charger'
-            ]
-            
-            if any(team in text.lower() for team in team_keywords):
-                return None
-            
-            # Skip common non-name words
-            skip_words = ['pick', 'round', 'draft', 'team', 'position', 'college', 'university', 'select']
-            if any(skip in text.lower() for skip in skip_words):
+            # Team names and common non-name words
+            if classify(text) & {'team_stem', 'label', 'school', 'select'}:
                 return None
             
             # Name validation
-            words = text.split()
-            if len(words) < 2 or len(words) > 3:
+            if not looks_like_name(text):
                 return None
             
-            # Check if all words look like names
-            for word in words:
-                clean_word = word.replace('.', '').replace("'", '')
-                if not clean_word.isalpha():
-                    return None
-                if not (word[0].isupper() and word[1:].islower()):
-                    return None
-            
             return text
             
         except:
@@ -327,16 +348,35 @@ class NFLPlayerRankingAnalyzerEnhanced:
             self.all_players.extend(players)
         
         print(f"\n✓ Analysis complete! Found {len(self.all_players)} total player selections")
+        save_mock_drafts(drafts_from_selections(self.all_players, self.author_urls), merge=True)
+
+    def load_from_store(self):
+        """Rebuild selections for these authors' articles from the draft database (no network)"""
+        self.player_selections = get_draft_store().player_selections(urls=list(self.author_urls.values()))
+        self.all_players = [
+            {'name': player_name, 'pick': pick_number, 'author': author}
+            for player_name, by_author in self.player_selections.items()
+            for author, pick_number in by_author.items()
+        ]
+        print(f"✓ Loaded {len(self.all_players)} player selections from the draft database")
+
+    def weight_by_recency(self, half_life_days):
+        """Weight each author's draft by article age, using publication dates in the draft database"""
+        drafts = get_draft_store().mock_drafts(urls=list(self.author_urls.values()))
+        dates = {draft['url']: draft['date'] for draft in drafts}
+        published = {author: dates.get(url) for author, url in self.author_urls.items()}
+        self.author_weights = recency_weights(published, half_life_days)
+        print(f"⚖️ Recency weights (half-life {half_life_days:g} days): "
+              + ', '.join(f"{author} {weight:.2f}" for author, weight in self.author_weights.items()))
 
     def create_player_ranking_document(self):
         """Create a Word document with player rankings"""
         print("📊 Creating player ranking document...")
         
-        # Count player frequencies
-        player_counts = Counter(selection['name'] for selection in self.all_players)
-        
-        # Sort by frequency (most picked first)
-        ranked_players = player_counts.most_common()
+        # Consensus across authors: frequency, pick spread and team affinity in one pass
+        rankings = consensus_rankings(self.all_players, self.author_weights)
+        ranked_players = ranked_counts(rankings)
+        authors_by_player = selected_by(self.all_players) if self.all_players else {}
         
         # Create Word document
         doc = Document()
@@ -377,7 +417,9 @@ class NFLPlayerRankingAnalyzerEnhanced:
         ranking_header_run.font.color.rgb = RGBColor(0, 53, 148)
         
         # Add each player with details
-        for rank, (player_name, count) in enumerate(ranked_players, 1):
+        for rank, consensus in enumerate(rankings.to_dict('records'), 1):
+            player_name, count = consensus['player'], consensus['selections']
+            
             # Player entry
             player_para = doc.add_paragraph()
             
@@ -397,10 +439,17 @@ class NFLPlayerRankingAnalyzerEnhanced:
             count_run.font.size = Pt(12)
             count_run.font.color.rgb = RGBColor(220, 38, 127)  # Pink accent
             
+            # Consensus pick position and most frequent destination
+            consensus_para = doc.add_paragraph()
+            consensus_run = consensus_para.add_run(f"    {describe_consensus(consensus)}")
+            consensus_run.font.size = Pt(10)
+            consensus_run.font.color.rgb = RGBColor(0, 53, 148)
+            consensus_para.space_after = Pt(2)
+            
             # Show which authors picked this player
-            if player_name in self.player_selections:
+            if player_name in authors_by_player:
                 authors_info = []
-                for author, pick_num in self.player_selections[player_name].items():
+                for author, pick_num in authors_by_player[player_name].items():
                     authors_info.append(f"{author} (#{pick_num})")
                 
                 if authors_info:
@@ -423,7 +472,7 @@ class NFLPlayerRankingAnalyzerEnhanced:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
 
 def main():
     print("=== NFL Player Ranking Analyzer Enhanced ===")
@@ -431,15 +480,24 @@ def main():
     print("📊 Enhanced player name extraction and ranking")
     print("=" * 60)
     
-    analyzer = NFLPlayerRankingAnalyzerEnhanced()
+    parser = argparse.ArgumentParser(description="Rank players by how often NFL.com experts select them")
+    parser.add_argument('--from-db', action='store_true',
+                        help="Rebuild the rankings from the local draft database instead of the articles")
+    parser.add_argument('--half-life', type=float, metavar='DAYS',
+                        help="Weight the consensus toward newer mock drafts, halving an article's weight every DAYS days")
+    args = parser.parse_args()
     
-    if not analyzer.driver:
-        print("❌ Cannot proceed without WebDriver")
-        return
+    analyzer = NFLPlayerRankingAnalyzerEnhanced()
     
     try:
-        # Analyze all authors
-        analyzer.analyze_all_authors()
+        if args.from_db:
+            analyzer.load_from_store()
+        else:
+            # Analyze all authors
+            analyzer.analyze_all_authors()
+        
+        if args.half_life:
+            analyzer.weight_by_recency(args.half_life)
         
         # Create ranking document
         output_path, ranked_players = analyzer.create_player_ranking_document()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+NFL Player Registry - Canonical player identities shared by every scraper
+Names are normalized (case, accents, punctuation, Jr./III suffixes) and mapped
+through an alias table; only those two rules join spellings to one player.
+A trigram index over known players reports near-identical names as candidate
+aliases for review, it never merges them ('Kyle Williams' != 'Kyle Williamson')
+"""
+
+import json
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+ALIASES_PATH = 'processed/player_aliases.json'
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Nicknames and short forms -> the name NFL.com uses; extended by ALIASES_PATH ({alias: name})
+PLAYER_ALIASES = {
+    'Tet McMillan': 'Tetairoa McMillan',
+}
+
+SIMILARITY_THRESHOLD = 0.8  # Dice coefficient over character trigrams, for reports only
+
+
+def normalize_name(name):
+    """Lowercase ASCII key without punctuation or generational suffixes ('Kelvin Banks Jr.' -> 'kelvin banks')"""
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii').lower()
+    text = re.sub(r"[.'’`]", '', text)
+    words = re.sub(r'[^a-z0-9]+', ' ', text).split()
+    while len(words) > 2 and words[-1] in NAME_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def _trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerRegistry:
+    """Alias table plus known players, indexed by trigram to report look-alike names"""
+
+    def __init__(self, aliases=None, aliases_path=ALIASES_PATH):
+        self.lock = threading.Lock()
+        self.names = {}      # canonical key -> display name (alias target, else first spelling seen)
+        self.aliases = {}    # normalized alias -> canonical key
+        self.grams = {}      # canonical key -> its trigrams
+        self.index = {}      # trigram -> canonical keys containing it
+        self.resolved = {}   # raw name -> canonical key (resolution cache)
+        for alias, name in {**PLAYER_ALIASES, **self._load_aliases(aliases_path), **(aliases or {})}.items():
+            self.add_alias(alias, name)
+
+    @staticmethod
+    def _load_aliases(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _add(self, key, display_name):
+        if key in self.names:
+            return
+        self.names[key] = display_name
+        self.grams[key] = _trigrams(key)
+        for gram in self.grams[key]:
+            self.index.setdefault(gram, set()).add(key)
+
+    def add_alias(self, alias, name):
+        """Make alias (any spelling) resolve to name"""
+        key = normalize_name(name)
+        with self.lock:
+            self._add(key, name)
+            self.names[key] = name
+            self.aliases[normalize_name(alias)] = key
+            self.resolved.clear()
+
+    def register(self, names):
+        """Add known spellings in bulk (so candidate_merges can compare them)"""
+        for name in names:
+            if name:
+                self.resolve(name)
+
+    def _similar_keys(self, key, threshold):
+        """[(score, known key)] with trigram Dice similarity >= threshold, best first"""
+        grams = _trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.index.get(gram, ()))
+        scored = [(2 * count / (len(grams) + len(self.grams[candidate])), candidate)
+                  for candidate, count in shared.items() if candidate != key]
+        return sorted((item for item in scored if item[0] >= threshold), reverse=True)
+
+    def resolve(self, name):
+        """Canonical key for name (alias or normalized spelling); new players are registered as seen"""
+        cached = self.resolved.get(name)
+        if cached is not None:
+            return cached
+        key = normalize_name(name)
+        with self.lock:
+            canonical = self.aliases.get(key, key)
+            if canonical:
+                self._add(canonical, name.strip())
+            self.resolved[name] = canonical
+        return canonical
+
+    def similar(self, name, threshold=SIMILARITY_THRESHOLD):
+        """[(score, display name)] of other known players whose names look like name"""
+        key = self.resolve(name)
+        with self.lock:
+            return [(score, self.names[other]) for score, other in self._similar_keys(key, threshold)]
+
+    def candidate_merges(self, threshold=SIMILARITY_THRESHOLD):
+        """[(name, name, score)] pairs of known players that may be one person
+
+        Nothing is merged: confirmed pairs belong in the alias table (ALIASES_PATH).
+        """
+        with self.lock:
+            pairs = {}
+            for key in self.names:
+                for score, other in self._similar_keys(key, threshold):
+                    pairs[tuple(sorted((key, other)))] = score
+            return sorted(((self.names[a], self.names[b], score) for (a, b), score in pairs.items()),
+                          key=lambda pair: (-pair[2], pair[0]))
+
+    def canonical_name(self, name):
+        """Display spelling of the player name resolves to"""
+        return self.names.get(self.resolve(name), name)
+
+
+_shared_registry = None
+_shared_lock = threading.Lock()
+
+
+def get_player_registry():
+    """Process-wide registry"""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = PlayerRegistry()
+        return _shared_registry
+
+
+def player_key(name):
+    return get_player_registry().resolve(name)
+
+
+def canonical_name(name):
+    return get_player_registry().canonical_name(name)
+
+
+def count_players(names):
+    """Counter of canonical player names, so spelling variants count as one player"""
+    registry = get_player_registry()
+    return Counter(registry.canonical_name(name) for name in names)
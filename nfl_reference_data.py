@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+NFL Reference Data - Teams, prospects and fallback mock drafts in one data file
+nfl_reference_data.json is read once per process, on first use, into lookup
+tables; add a year under "drafts" (and its prospects) to support a new draft
+"""
+
+import json
+import os
+import threading
+from nfl_player_registry import player_key
+
+REFERENCE_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nfl_reference_data.json')
+
+DEFAULT_DRAFT_YEAR = 2025
+
+ESPN_HEADSHOT_URL = 'https://a.espncdn.com/i/headshots/college-football/players/full/{espn_id}.png'
+
+DEFAULT_TEAM_ABBREVIATION = 'NFL'
+DEFAULT_TEAM_COLOR = '#002244'
+
+
+class ReferenceData:
+    """Parsed reference file: teams by name and abbreviation, prospects by player key, drafts by year"""
+
+    def __init__(self, path=REFERENCE_DATA_PATH):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.teams = {name: dict(team, name=name) for name, team in data['teams'].items()}
+        self.abbreviations = {team['abbreviation']: team for team in self.teams.values()}
+        self.team_names = tuple(self.teams)
+        self.prospects = {}
+        self.image_sources = {}
+        for name, prospect in data['prospects'].items():
+            sources = list(prospect.get('headshots', []))
+            if prospect.get('espn_id'):
+                sources.insert(0, ESPN_HEADSHOT_URL.format(espn_id=prospect['espn_id']))
+            self.prospects[player_key(name)] = dict(prospect, name=name, headshots=tuple(sources))
+            self.image_sources[name] = tuple(sources)
+        self.drafts = {int(year): editions for year, editions in data['drafts'].items()}
+
+    def team(self, name_or_abbreviation):
+        return self.teams.get(name_or_abbreviation) or self.abbreviations.get(name_or_abbreviation)
+
+    def prospect(self, player_name):
+        return self.prospects.get(player_key(player_name))
+
+    def edition(self, name, year=DEFAULT_DRAFT_YEAR):
+        """Raw draft entries of one edition ('fallback', 'analysis', 'sample') for year"""
+        try:
+            return self.drafts[int(year)][name]
+        except KeyError:
+            raise KeyError(f"No {name} mock drafts for {year} in {REFERENCE_DATA_PATH}") from None
+
+    def expand_picks(self, rows, author=None):
+        """Full pick dicts from compact [team, player(, reasoning)] rows, numbered from 1
+
+        Team abbreviations become full names and school/position/class come from
+        the prospect table. Each call returns new dicts, so callers may annotate them.
+        """
+        picks = []
+        for number, row in enumerate(rows, 1):
+            team, player = row[0], row[1]
+            prospect = self.prospect(player) or {}
+            pick = {
+                'pick': number,
+                'team': (self.team(team) or {}).get('name', team),
+                'player': player,
+                'school': prospect.get('school', ''),
+                'position': prospect.get('position', ''),
+                'class': prospect.get('class', ''),
+            }
+            if len(row) > 2:
+                pick['reasoning'] = row[2].format(author=author) if author else row[2]
+            picks.append(pick)
+        return picks
+
+
+_shared_data = None
+_shared_lock = threading.Lock()
+
+
+def get_reference_data():
+    """Process-wide reference data, loaded on first call"""
+    global _shared_data
+    with _shared_lock:
+        if _shared_data is None:
+            _shared_data = ReferenceData()
+        return _shared_data
+
+
+def team_names():
+    """All 32 team names"""
+    return get_reference_data().team_names
+
+
+def team_abbreviation(team_name, default=DEFAULT_TEAM_ABBREVIATION):
+    team = get_reference_data().team(team_name)
+    return team['abbreviation'] if team else default
+
+
+def team_color(team_name, default=DEFAULT_TEAM_COLOR):
+    team = get_reference_data().team(team_name)
+    return team['color'] if team else default
+
+
+def team_city(team_name):
+    team = get_reference_data().team(team_name)
+    return team['city'] if team else None
+
+
+def prospect(player_name):
+    """Prospect entry (school, position, class, headshots) for any spelling of the name, or None"""
+    return get_reference_data().prospect(player_name)
+
+
+def headshot_sources(player_name):
+    """Headshot URLs to try for a player, ESPN first; empty for unknown players"""
+    entry = prospect(player_name)
+    return list(entry['headshots']) if entry else []
+
+
+def player_image_sources():
+    """{player name: headshot URLs} for every prospect with at least one source"""
+    return {name: list(urls) for name, urls in get_reference_data().image_sources.items() if urls}
+
+
+def reference_mock_drafts(edition='fallback', year=DEFAULT_DRAFT_YEAR):
+    """Stored mock drafts of an edition as scraper-shaped dicts ({author, title, ..., picks})"""
+    data = get_reference_data()
+    return [{**{key: value for key, value in draft.items() if key != 'picks'},
+             'picks': data.expand_picks(draft['picks'])}
+            for draft in data.edition(edition, year)]
+
+
+def fallback_mock_draft(author, year=DEFAULT_DRAFT_YEAR, default_author='Bucky Brooks'):
+    """An author's stored fallback draft, default_author's for authors without one"""
+    data = get_reference_data()
+    drafts = {draft['author']: draft for draft in data.edition('fallback', year)}
+    draft = drafts.get(author, drafts[default_author])
+    return {'title': draft['title'], 'author': draft['author'], 'picks': data.expand_picks(draft['picks'])}
+
+
+def sample_picks(author, year=DEFAULT_DRAFT_YEAR):
+    """Consensus top picks with reasoning attributed to author, for when extraction fails"""
+    data = get_reference_data()
+    return data.expand_picks(data.edition('sample', year)['picks'], author=author)
@@ -5,20 +5,42 @@ Takes screenshots of all NFL.com mock draft pages with pick reasoning
 """
 
 import os
-import time
+import queue
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_PARAGRAPH_ALIGNMENT
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from nfl_pick_mapper import (capture_page_snapshot, filter_sequential_analysis,
+                             map_picks_to_analysis)
+from nfl_capture_manifest import CaptureManifest, record_captured, split_unchanged
+from nfl_docx_stream import StreamingDocumentBuilder
+from nfl_draft_store import get_draft_store, save_mock_drafts
+from nfl_driver_factory import add_profile_argument, dismiss_overlays, get_driver, profile_default, release_driver
+from nfl_fullpage_capture import capture_pick_crops
+from nfl_image_pipeline import optimize_screenshots
+from nfl_offline_extractor import extract_picks
+from nfl_page_readiness import (wait_for_page_ready, wait_for_paint, scroll_into_view,
+                                scroll_to)
+
+PICK_SELECTORS = [
+    '.nfl-o-ranked-item.nfl-o-ranked-item--side-by-side',
+    '.nfl-o-ranked-item'
+]
 
 class NFLScreenshotComplete:
-    def __init__(self):
-        self.setup_selenium()
+    def __init__(self, setup_driver=True, headless=False, full_page=True, profile=None, attach=True,
+                 collect_players=False):
+        self.driver = None
+        self.headless = headless
+        self.profile = profile if profile is not None else profile_default()
+        self.attach = attach
+        self.full_page = full_page  # One DevTools capture per article, picks cropped in memory
+        if setup_driver:
+            self.setup_selenium()
         
         # UPDATED URLs - REMOVED Lance Zierlein and Chad Reuter as requested
         self.author_urls = {
@@ -33,19 +55,14 @@ class NFLScreenshotComplete:
         
         os.makedirs('processed/complete_screenshots', exist_ok=True)
         self.pick_descriptions = {}  # Store descriptions for each pick
+        self.collect_players = collect_players  # Also read player selections from each loaded page
+        self.pick_players = {}  # {author: [pick dicts]} for the player-ranking document
 
     def setup_selenium(self):
         """Setup Selenium WebDriver for taking screenshots"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')  # Large window
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--force-device-scale-factor=1')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # Large window, ads/trackers/video blocked, consent banner pre-dismissed
+            self.driver = get_driver(headless=self.headless, profile=self.profile, attach=self.attach)
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
@@ -64,11 +81,14 @@ class NFLScreenshotComplete:
             
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(6)  # Reduced wait for page to fully load
+            wait_for_page_ready(self.driver, PICK_SELECTORS + ['h1'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(3)
+            wait_for_paint(self.driver)
+            
+            if self.collect_players:
+                self.collect_pick_players(author)
             
             # Get article header (always try to get something)
             header_screenshot = self.screenshot_article_header(author)
@@ -106,45 +126,24 @@ class NFLScreenshotComplete:
         if not screenshots:
             screenshots = [f"Could not capture content for {author}"]
             
-        print(f"   ✓ Captured {len([s for s in screenshots if s.endswith('.png')])} screenshots for {author}")
+        print(f"   ✓ Captured {count_screenshot_files(screenshots)} screenshots for {author}")
         return screenshots
 
+    def collect_pick_players(self, author):
+        """Parse player selections out of the page already loaded for screenshots"""
+        try:
+            picks = extract_picks(self.driver.page_source, max_picks=32)
+            self.pick_players[author] = picks
+            print(f"   🏈 Read {len(picks)} player selections from the loaded page")
+        except Exception as e:
+            print(f"   ⚠️ Could not read player selections for {author}: {e}")
+
     def remove_overlays(self):
         """Remove cookie banners and overlays"""
         try:
-            overlay_selectors = [
-                '[data-module="CookieBanner"]',
-                '.onetrust-banner-sdk',
-                '.cookie-banner',
-                '[class*="overlay"]',
-                '[class*="modal"]',
-                '.nfl-banner',
-                '[id*="onetrust"]'
-            ]
-            
-            for selector in overlay_selectors:
-                try:
-                    overlays = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for overlay in overlays:
-                        if overlay.is_displayed():
-                            self.driver.execute_script("arguments[0].style.display = 'none';", overlay)
-                except:
-                    continue
-                    
-            # Try to click close buttons
-            close_selectors = ['[aria-label="Close"]', '.close-button', '[data-dismiss]']
-            for selector in close_selectors:
-                try:
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for button in buttons:
-                        if button.is_displayed():
-                            button.click()
-                            time.sleep(1)
-                except:
-                    continue
-                    
+            dismiss_overlays(self.driver)
         except Exception as e:
-            print(f"   ⚠️ Error removing overlays: {e}")
+            print(f"   ⚠️ Could not remove overlays: {e}")
 
     def screenshot_article_header(self, author):
         """Screenshot the article header"""
@@ -161,8 +160,7 @@ class NFLScreenshotComplete:
                     header_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if header_element.is_displayed():
                         # Scroll to element
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header_element)
-                        time.sleep(3)
+                        scroll_into_view(self.driver, header_element)
                         
                         # Take screenshot
                         screenshot_path = f"processed/complete_screenshots/{author}_header.png"
@@ -183,17 +181,14 @@ class NFLScreenshotComplete:
         
         try:
             # Look for NFL.com draft pick elements
-            pick_selectors = [
-                '.nfl-o-ranked-item.nfl-o-ranked-item--side-by-side',
-                '.nfl-o-ranked-item'
-            ]
-            
             pick_elements = []
-            for selector in pick_selectors:
+            pick_selector = None
+            for selector in PICK_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
                         pick_elements = elements[:32]  # UP TO 32 PICKS
+                        pick_selector = selector
                         print(f"   📋 Found {len(pick_elements)} draft picks for {author} using: {selector}")
                         break
                 except:
@@ -204,45 +199,19 @@ class NFLScreenshotComplete:
                 if author not in self.pick_descriptions:
                     self.pick_descriptions[author] = {}
                 
-                for i, pick_element in enumerate(pick_elements, 1):
-                    try:
-                        print(f"   🔍 Processing Pick {i}...")
-                        
-                        # Scroll element into view for better capture
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", pick_element)
-                        time.sleep(0.8)  # Reduced wait for scroll to complete
-                        
-                        # Extract description/reasoning for this pick FIRST
-                        description = self.extract_pick_description_enhanced(pick_element, i, author)
-                        self.pick_descriptions[author][i] = description
-                        print(f"      📝 Description: {description[:100]}...")
-                        
-                        # Take screenshot of the pick element with better positioning
-                        filename = f'{author}_pick_{i}.png'
-                        filepath = os.path.join('processed/complete_screenshots', filename)
-                        
-                        # Ensure element is fully visible
-                        self.driver.execute_script("arguments[0].style.border='2px solid red';", pick_element)
-                        time.sleep(0.5)
-                        
-                        # Take the screenshot
-                        pick_element.screenshot(filepath)
-                        
-                        # Remove the border
-                        self.driver.execute_script("arguments[0].style.border='';", pick_element)
-                        
-                        screenshots.append(filepath)
-                        print(f"   ✓ Pick {i} screenshot captured")
-                        
-                        time.sleep(0.4)  # Reduced pause between screenshots
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Error capturing pick {i}: {e}")
-                        # Store a placeholder description even if screenshot fails
-                        if author not in self.pick_descriptions:
-                            self.pick_descriptions[author] = {}
-                        self.pick_descriptions[author][i] = f"Analysis for pick #{i} by {author}."
-                        continue
+                # Extract all descriptions up front from one DOM snapshot
+                descriptions = self.extract_pick_descriptions(pick_selector, author)
+                
+                # Descriptions for every pick, whether or not its screenshot succeeds
+                for i in range(1, len(pick_elements) + 1):
+                    description = descriptions.get(i, f"Draft analysis for pick #{i} by {author}.")
+                    self.pick_descriptions[author][i] = description
+                    print(f"      📝 Pick {i} description: {description[:100]}...")
+                
+                if self.full_page:
+                    screenshots = self.screenshot_picks_full_page(author, pick_selector, len(pick_elements))
+                if not screenshots:
+                    screenshots = self.screenshot_picks_per_element(author, pick_elements)
             else:
                 # Fallback: try to capture a full page section
                 print(f"   ⚠️ Using fallback method for {author}")
@@ -259,204 +228,73 @@ class NFLScreenshotComplete:
             
         return screenshots
 
+    def screenshot_picks_full_page(self, author, pick_selector, count):
+        """Capture the article once and crop every pick from the in-memory image"""
+        screenshots = []
+        try:
+            crops = capture_pick_crops(self.driver, pick_selector, count, border='2px solid red')
+            for i, crop in enumerate(crops, 1):
+                if crop is None:
+                    print(f"   ⚠️ Pick {i} has no visible box, skipping")
+                    continue
+                filepath = os.path.join('processed/complete_screenshots', f'{author}_pick_{i}.png')
+                crop.save(filepath)
+                screenshots.append(filepath)
+            print(f"   ✓ {len(screenshots)} picks cropped from one full-page capture")
+        except Exception as e:
+            print(f"   ⚠️ Full-page capture failed for {author}, capturing picks one by one: {e}")
+            return []
+        return screenshots
+
+    def screenshot_picks_per_element(self, author, pick_elements):
+        """Scroll to and screenshot each pick element separately"""
+        screenshots = []
+        for i, pick_element in enumerate(pick_elements, 1):
+            try:
+                print(f"   🔍 Processing Pick {i}...")
+                
+                # Scroll element into view for better capture
+                scroll_into_view(self.driver, pick_element)
+                
+                # Take screenshot of the pick element with better positioning
+                filename = f'{author}_pick_{i}.png'
+                filepath = os.path.join('processed/complete_screenshots', filename)
+                
+                # Ensure element is fully visible
+                self.driver.execute_script("arguments[0].style.border='2px solid red';", pick_element)
+                wait_for_paint(self.driver)
+                
+                # Take the screenshot
+                pick_element.screenshot(filepath)
+                
+                # Remove the border
+                self.driver.execute_script("arguments[0].style.border='';", pick_element)
+                
+                screenshots.append(filepath)
+                print(f"   ✓ Pick {i} screenshot captured")
+                
+            except Exception as e:
+                print(f"   ⚠️ Error capturing pick {i}: {e}")
+                continue
+        return screenshots
+
     def _get_filtered_analysis_paragraphs(self):
         """Get filtered analysis paragraphs for sequential mapping"""
         try:
-            # Get all paragraph elements
-            all_paragraphs = self.driver.find_elements(By.CSS_SELECTOR, 'p')
-            
-            # Get first and last pick locations for filtering boundaries
-            pick_elements = self.driver.find_elements(By.CSS_SELECTOR, '.nfl-o-ranked-item.nfl-o-ranked-item--side-by-side')
-            if not pick_elements:
-                return []
-            
-            first_pick_y = pick_elements[0].location['y']
-            last_pick_y = pick_elements[-1].location['y']
-            
-            analysis_paragraphs = []
-            for para in all_paragraphs:
-                try:
-                    text = para.get_attribute('textContent').strip()
-                    location = para.location['y']
-                    
-                    # Filter criteria based on debug findings
-                    if (text and len(text) > 50 and len(text) < 1000 and
-                        location > first_pick_y and  # After first pick
-                        location < last_pick_y + 2000 and  # Before way after last pick
-                        any(keyword in text.lower() for keyword in ['quarterback', 'player', 'draft', 'team', 'offense', 'defense', 'potential', 'needs', 'season', 'franchise']) and
-                        not text.startswith('Pick') and
-                        '©' not in text and
-                        'nfl.com' not in text.lower() and
-                        'cookie' not in text.lower() and
-                        'privacy' not in text.lower() and
-                        # Filter out intro/outro text
-                        'finally the week' not in text.lower() and
-                        'trades that are struck' not in text.lower() and
-                        'in his final mock' not in text.lower() and
-                        'with round 1' not in text.lower()):
-                        
-                        analysis_paragraphs.append((location, text))
-                except:
-                    continue
-            
-            # Sort by Y position and return just the text
-            analysis_paragraphs.sort(key=lambda x: x[0])
-            return [text for location, text in analysis_paragraphs]
-            
+            return filter_sequential_analysis(capture_page_snapshot(self.driver))
         except Exception as e:
             print(f"      ⚠️ Error getting analysis paragraphs: {e}")
             return []
 
-    def extract_pick_description_enhanced(self, pick_element, pick_number, author):
-        """Enhanced description extraction using improved spatial positioning and context analysis"""
+    def extract_pick_descriptions(self, selector, author):
+        """Map every pick to its analysis text from a single DOM snapshot"""
         try:
-            print(f"      🔍 Extracting description for pick {pick_number}...")
-            
-            # Get player info from the pick element
-            pick_text = pick_element.get_attribute('textContent')
-            player_name = None
-            team_name = None
-            
-            # Extract player and team names from pick element
-            lines = [line.strip() for line in pick_text.split('\n') if line.strip()]
-            for line in lines:
-                # Check for team names
-                if any(team in line.lower() for team in ['titans', 'browns', 'giants', 'patriots', 'raiders', 'jaguars', 'jets', 'panthers', 'saints', 'lions', 'cowboys', 'dolphins', 'colts', 'falcons', 'cardinals', 'bengals', 'vikings', 'buccaneers', 'broncos', 'chargers', 'steelers', 'packers', 'texans', 'rams', 'eagles', 'bills', 'chiefs', 'seahawks', 'commanders']):
-                    team_name = line
-                # Look for player name (typically 2 words, starts with capital)
-                elif len(line.split()) == 2 and line[0].isupper() and 'pick' not in line.lower():
-                    player_name = line
-                    break
-            
-            print(f"         Team: {team_name}, Player: {player_name}")
-            
-            # Find analysis text that comes immediately after this pick element
-            pick_location = pick_element.location['y']
-            
-            # Get all paragraph elements and find those that come after this pick
-            all_paragraphs = self.driver.find_elements(By.CSS_SELECTOR, 'p')
-            
-            analysis_candidates = []
-            for para in all_paragraphs:
-                try:
-                    para_location = para.location['y']
-                    para_text = para.get_attribute('textContent').strip()
-                    
-                    # Only consider paragraphs that come after this pick with analysis content
-                    if (para_location > pick_location and 
-                        len(para_text) > 50 and len(para_text) < 1000 and
-                        any(keyword in para_text.lower() for keyword in ['quarterback', 'player', 'draft', 'team', 'offense', 'defense', 'potential', 'needs', 'season', 'franchise', 'protection', 'elite']) and
-                        not para_text.startswith('Pick') and
-                        '©' not in para_text and
-                        'nfl.com' not in para_text.lower() and
-                        'cookie' not in para_text.lower() and
-                        'privacy' not in para_text.lower()):
-                        
-                        analysis_candidates.append((para_location, para_text))
-                except:
-                    continue
-            
-            # Sort by Y position to get the closest analysis text
-            analysis_candidates.sort(key=lambda x: x[0])
-            
-            print(f"         Found {len(analysis_candidates)} analysis candidates after pick")
-            
-            # Strategy A: Look for analysis that mentions the player or team specifically
-            if player_name or team_name:
-                for location, text in analysis_candidates[:3]:  # Check first 3 candidates
-                    text_lower = text.lower()
-                    
-                    # Check if mentions player name
-                    if player_name and player_name.lower() in text_lower:
-                        description = text.replace('\n', ' ').replace('\t', ' ')
-                        description = ' '.join(description.split())
-                        if len(description) > 400:
-                            description = description[:400] + '...'
-                        print(f"      ✓ Found player-specific analysis: {description[:50]}...")
-                        return description
-                    
-                    # Check if mentions team characteristics or context
-                    if team_name:
-                        team_keywords = {
-                            'giants': ['giants', 'new york'],
-                            'titans': ['titans', 'tennessee'],
-                            'browns': ['browns', 'cleveland'], 
-                            'patriots': ['patriots', 'new england', 'drake maye'],
-                            'jaguars': ['jaguars', 'jacksonville', 'trevor lawrence'],
-                            'raiders': ['raiders', 'las vegas'],
-                            'jets': ['jets', 'new york jets', 'justin fields'],
-                            'cowboys': ['cowboys', 'dallas'],
-                            'saints': ['saints', 'new orleans'],
-                            'bears': ['bears', 'chicago'],
-                            'panthers': ['panthers', 'carolina'],
-                            'dolphins': ['dolphins', 'miami', 'jalen ramsey'],
-                            'colts': ['colts', 'indianapolis'],
-                            'falcons': ['falcons', 'atlanta'],
-                            'cardinals': ['cardinals', 'arizona'],
-                            'bengals': ['bengals', 'cincinnati'],
-                            'vikings': ['vikings', 'minnesota'],
-                            'buccaneers': ['buccaneers', 'tampa bay', 'bucs'],
-                            'broncos': ['broncos', 'denver', 'sean payton'],
-                            'chargers': ['chargers', 'los angeles chargers'],
-                            'steelers': ['steelers', 'pittsburgh'],
-                            'packers': ['packers', 'green bay'],
-                            'texans': ['texans', 'houston'],
-                            'rams': ['rams', 'los angeles rams'],
-                            'eagles': ['eagles', 'philadelphia'],
-                            'bills': ['bills', 'buffalo'],
-                            'chiefs': ['chiefs', 'kansas city'],
-                            'seahawks': ['seahawks', 'seattle'],
-                            'commanders': ['commanders', 'washington']
-                        }
-                        
-                        team_lower = team_name.lower()
-                        for team_key, keywords in team_keywords.items():
-                            if team_key in team_lower:
-                                if any(keyword in text_lower for keyword in keywords):
-                                    description = text.replace('\n', ' ').replace('\t', ' ')
-                                    description = ' '.join(description.split())
-                                    if len(description) > 400:
-                                        description = description[:400] + '...'
-                                    print(f"      ✓ Found team-specific analysis: {description[:50]}...")
-                                    return description
-            
-            # Strategy B: Use the closest available analysis text (not indexed by pick number)
-            if analysis_candidates:
-                # Simply use the first (closest) available analysis text
-                # This matches what the debug showed as the correct approach
-                location, text = analysis_candidates[0]
-                description = text.replace('\n', ' ').replace('\t', ' ')
-                description = ' '.join(description.split())
-                if len(description) > 400:
-                    description = description[:400] + '...'
-                print(f"      ✓ Found closest positional analysis: {description[:50]}...")
-                return description
-            
-            # Strategy 2: Fallback to element-based extraction
-            full_text = pick_element.get_attribute('textContent')
-            
-            if not full_text:
-                print(f"      ⚠️ No text content found, using placeholder")
-                return f"Draft analysis for pick #{pick_number} by {author}."
-            
-            # Clean and split the text
-            lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-            
-            # Look for any substantial text lines
-            substantial_lines = [line for line in lines if len(line) > 30 and not line.isupper() and 'Pick' not in line]
-            if substantial_lines:
-                fallback = substantial_lines[0]
-                if len(fallback) > 300:
-                    fallback = fallback[:300] + '...'
-                print(f"      ⚠️ Using fallback description: {fallback[:50]}...")
-                return fallback
-            else:
-                print(f"      ⚠️ No description found, using placeholder")
-                return f"Draft analysis for pick #{pick_number} by {author}."
-                
+            snapshot = capture_page_snapshot(self.driver, selector)
+            print(f"   📑 Snapshot: {len(snapshot['picks'])} picks, {len(snapshot['paragraphs'])} paragraphs")
+            return map_picks_to_analysis(snapshot, author)
         except Exception as e:
-            print(f"      ⚠️ Error extracting description: {e}")
-            return f"Analysis for pick #{pick_number} not available."
+            print(f"      ⚠️ Error extracting descriptions: {e}")
+            return {}
 
     def screenshot_page_sections(self, author):
         """Take page section screenshots as backup"""
@@ -464,8 +302,7 @@ class NFLScreenshotComplete:
         
         try:
             # Scroll to top
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            scroll_to(self.driver, 0)
             
             # Get page dimensions
             total_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -479,8 +316,7 @@ class NFLScreenshotComplete:
                 scroll_position = i * section_height
                 
                 # Scroll to position
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                time.sleep(2)  # Reduced wait for content to load
+                scroll_to(self.driver, scroll_position)
                 
                 # Take screenshot
                 screenshot_path = f"processed/complete_screenshots/{author}_section_{i+1:02d}.png"
@@ -497,8 +333,7 @@ class NFLScreenshotComplete:
     def screenshot_full_page_fallback(self, author):
         """Take a full page screenshot as absolute fallback"""
         try:
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
+            scroll_to(self.driver, 0)
             
             screenshot_path = f"processed/complete_screenshots/{author}_fullpage.png"
             self.driver.save_screenshot(screenshot_path)
@@ -509,11 +344,21 @@ class NFLScreenshotComplete:
             print(f"   ⚠️ Could not take fallback screenshot for {author}: {e}")
             return None
 
-    def create_word_document(self, all_screenshots):
-        """Create a Word document with all screenshots and descriptions"""
+    def create_word_document(self, all_screenshots, recompress=None):
+        """Create a Word document with all screenshots and descriptions
+
+        Identical images are embedded once; recompress ('palette' or 'jpeg', both lossy)
+        re-encodes each distinct screenshot before embedding, None embeds them as captured.
+        Each author's section is streamed to the file once it is complete, so memory does
+        not grow with the number of authors.
+        """
         print("📄 Creating optimized Word document with all authors...")
         
-        doc = Document()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = f'processed/NFL_COMPLETE_ALL_AUTHORS_{timestamp}.docx'
+        builder = StreamingDocumentBuilder(output_path, recompress=recompress)
+        define_screenshot_styles(builder)
+        doc = builder.doc
         
         # Set narrow margins for space efficiency
         sections = doc.sections
@@ -539,12 +384,8 @@ class NFLScreenshotComplete:
         
         # Summary
         total_screenshots = sum(len(screenshots) for screenshots in all_screenshots.values())
-        summary = doc.add_paragraph()
-        summary_run = summary.add_run(f"📊 {len(all_screenshots)} Authors • {total_screenshots} Screenshots • Top 32 Picks Each • Expert Analysis Included")
-        summary_run.font.size = Pt(9)
-        summary_run.font.color.rgb = RGBColor(107, 114, 128)
-        summary.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        summary.space_after = Pt(8)
+        builder.text(f"📊 {len(all_screenshots)} Authors • {total_screenshots} Screenshots • Top 32 Picks Each • Expert Analysis Included",
+                     style='Screenshot Summary')
         
         # Add screenshots for each author
         for author, screenshots in all_screenshots.items():
@@ -552,12 +393,7 @@ class NFLScreenshotComplete:
                 print(f"   📝 Adding {author} to document...")
                 
                 # Author header
-                author_header = doc.add_heading(f'{author} - 2025 Mock Draft', level=1)
-                author_header_run = author_header.runs[0]
-                author_header_run.font.size = Pt(16)
-                author_header_run.font.color.rgb = RGBColor(0, 53, 148)
-                author_header.space_before = Pt(6)
-                author_header.space_after = Pt(4)
+                builder.text(f'{author} - 2025 Mock Draft', style='Screenshot Author')
                 
                 # Debug: Print available descriptions for this author
                 if author in self.pick_descriptions:
@@ -572,12 +408,8 @@ class NFLScreenshotComplete:
                         if 'header' in screenshot:
                             # Add header screenshot
                             if os.path.exists(screenshot):
-                                img_paragraph = doc.add_paragraph()
-                                img_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                                 try:
-                                    img_run = img_paragraph.runs[0] if img_paragraph.runs else img_paragraph.add_run()
-                                    img_run.add_picture(screenshot, width=Inches(6.5))
-                                    img_paragraph.space_after = Pt(8)
+                                    builder.picture(screenshot, width=Inches(6.5), style='Screenshot Header')
                                 except:
                                     pass
                             continue
@@ -598,23 +430,16 @@ class NFLScreenshotComplete:
                             
                             # Add screenshot (removed Pick #X header as requested)
                             if os.path.exists(screenshot):
-                                img_paragraph = doc.add_paragraph()
-                                img_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                
                                 try:
-                                    img_run = img_paragraph.runs[0] if img_paragraph.runs else img_paragraph.add_run()
-                                    img_run.add_picture(screenshot, width=Inches(6.5))
+                                    builder.picture(screenshot, width=Inches(6.5), style='Screenshot Pick')
                                 except:
                                     # Fallback with smaller width if image is too large
                                     try:
-                                        img_run = img_paragraph.runs[0] if img_paragraph.runs else img_paragraph.add_run()
-                                        img_run.add_picture(screenshot, width=Inches(5.5))
+                                        builder.picture(screenshot, width=Inches(5.5), style='Screenshot Pick')
                                     except Exception as img_error:
                                         print(f"         ⚠️ Could not add image: {img_error}")
                                         continue
                                 
-                                img_paragraph.space_after = Pt(4)
-                                
                                 # Add description for this pick
                                 description = None
                                 if author in self.pick_descriptions and pick_num in self.pick_descriptions[author]:
@@ -625,21 +450,18 @@ class NFLScreenshotComplete:
                                     print(f"         ⚠️ No description found, using placeholder")
                                 
                                 # Description paragraph
-                                desc_paragraph = doc.add_paragraph()
-                                desc_run = desc_paragraph.add_run(f"📝 Analysis: {description}")
-                                desc_run.font.size = Pt(9)
-                                desc_run.font.color.rgb = RGBColor(74, 85, 104)
-                                desc_run.italic = True
-                                desc_paragraph.space_after = Pt(8)
+                                builder.text(f"📝 Analysis: {description}", style='Screenshot Analysis')
                         
                     except Exception as e:
                         print(f"   ⚠️ Error adding screenshot {screenshot}: {e}")
                         continue
+                
+                # Write the finished section out before starting the next author
+                builder.flush()
         
         # Save document
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = f'processed/NFL_COMPLETE_ALL_AUTHORS_{timestamp}.docx'
-        doc.save(output_path)
+        builder.save()
+        builder.print_media_report()
         
         # Debug: Print summary of descriptions collected
         print(f"\n📊 Description Summary:")
@@ -651,41 +473,241 @@ class NFLScreenshotComplete:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
+
+
+def define_screenshot_styles(builder):
+    """Named styles for the screenshot document; spacing only reaches Word through a style"""
+    builder.define_paragraph_style('Screenshot Summary', alignment=WD_ALIGN_PARAGRAPH.CENTER,
+                                   space_after=Pt(8), size=Pt(9), color=(107, 114, 128))
+    builder.define_paragraph_style('Screenshot Author', space_before=Pt(6), space_after=Pt(4),
+                                   size=Pt(16), color=(0, 53, 148), base='Heading 1')
+    builder.define_paragraph_style('Screenshot Header', alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(8))
+    builder.define_paragraph_style('Screenshot Pick', alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=Pt(4))
+    builder.define_paragraph_style('Screenshot Analysis', space_after=Pt(8), size=Pt(9), italic=True,
+                                   color=(74, 85, 104))
+
+
+class WebDriverPool:
+    """Bounded pool of headless capture sessions, one Chrome per worker"""
+
+    def __init__(self, size, full_page=True, collect_players=False, profile=None):
+        self.size = max(1, size)
+        self.available = queue.Queue()
+        self.members = []
+
+        for worker in range(self.size):
+            # Side-by-side browsers never attach, and a named profile becomes one per worker
+            member = NFLScreenshotComplete(headless=True, full_page=full_page,
+                                           profile=f'{profile}-pool-{worker}' if profile else '', attach=False,
+                                           collect_players=collect_players)
+            if member.driver:
+                self.members.append(member)
+                self.available.put(member)
+
+        print(f"✓ WebDriver pool ready: {len(self.members)}/{self.size} sessions")
+
+    def acquire(self):
+        """Block until a capture session is free"""
+        return self.available.get()
+
+    def release(self, member):
+        """Return a capture session to the pool"""
+        self.available.put(member)
+
+    def close(self):
+        """Quit every browser in the pool"""
+        for member in self.members:
+            member.cleanup()
+        self.members = []
+
+
+def capture_author_with_pool(pool, url, author):
+    """Capture one author on a pooled session and hand back its results"""
+    member = pool.acquire()
+    try:
+        member.pick_descriptions.pop(author, None)
+        screenshots = member.screenshot_webpage_content(url, author)
+        descriptions = member.pick_descriptions.pop(author, {})
+        players = member.pick_players.pop(author, None)
+        return author, screenshots, descriptions, players
+    finally:
+        pool.release(member)
+
+
+def capture_all_authors_parallel(creator, workers, authors=None):
+    """Capture every author (or just authors) concurrently and merge into creator's structures"""
+    all_screenshots = {}
+    pool = WebDriverPool(workers, full_page=creator.full_page, collect_players=creator.collect_players,
+                         profile=creator.profile)
+
+    if not pool.members:
+        print("❌ No WebDriver sessions could be started for the pool")
+        return all_screenshots
+
+    try:
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(pool.members)) as executor:
+            futures = {
+                executor.submit(capture_author_with_pool, pool, url, author): author
+                for author, url in creator.author_urls.items()
+                if authors is None or author in authors
+            }
+            for future in as_completed(futures):
+                author = futures[future]
+                try:
+                    _, screenshots, descriptions, players = future.result()
+                except Exception as e:
+                    print(f"   ⚠️ Worker failed for {author}: {e}")
+                    screenshots, descriptions, players = [f"Could not capture content for {author}"], {}, None
+                results[author] = (screenshots, descriptions, players)
+
+        # Merge in the original author order so the document layout is unchanged
+        for author in [author for author in creator.author_urls if author in results]:
+            screenshots, descriptions, players = results[author]
+            all_screenshots[author] = screenshots
+            if descriptions:
+                creator.pick_descriptions[author] = descriptions
+            if players is not None:
+                creator.pick_players[author] = players
+    finally:
+        pool.close()
+
+    return all_screenshots
+
+
+def capture_all_authors(creator, workers=1, authors=None):
+    """Capture every author (or just authors), sequentially on creator's browser or on a pool"""
+    if workers > 1:
+        return capture_all_authors_parallel(creator, workers, authors)
+    
+    all_screenshots = {}
+    for author, url in creator.author_urls.items():
+        if authors is None or author in authors:
+            all_screenshots[author] = creator.screenshot_webpage_content(url, author)
+    return all_screenshots
+
+
+def count_screenshot_files(screenshots):
+    """Entries that are image files on disk (.png or, after --optimize jpeg, .jpg), not failure notes"""
+    return sum(1 for path in screenshots if isinstance(path, str) and os.path.isfile(path))
+
+
+def optimize_author_screenshots(all_screenshots, encoding):
+    """Downscale/re-encode every captured screenshot, following renamed files"""
+    renamed = optimize_screenshots(
+        [path for screenshots in all_screenshots.values() for path in screenshots],
+        encoding=encoding)
+    return {author: [renamed.get(path, path) for path in screenshots]
+            for author, screenshots in all_screenshots.items()}
+
+
+def store_capture_results(creator, authors):
+    """Upsert captured picks into the draft database, filling gaps with screenshot descriptions"""
+    drafts = [{'author': author, 'url': creator.author_urls[author], 'picks': creator.pick_players[author]}
+              for author in authors if creator.pick_players.get(author)]
+    if not drafts:
+        return
+    save_mock_drafts(drafts)
+    try:
+        store = get_draft_store()
+        for draft in drafts:
+            store.upsert_descriptions(draft['url'], creator.pick_descriptions.get(draft['author'], {}),
+                                      overwrite=False)
+    except Exception as e:
+        print(f"⚠️ Could not store pick descriptions: {e}")
+
+
+def run_capture(creator, workers=1, optimize='palette', incremental=False):
+    """Capture (and optimize) screenshots for every author; returns {author: screenshots}
+
+    With incremental, authors whose pick list hash matches the capture manifest
+    reuse their previous screenshots and descriptions, and only changed authors
+    are captured. The browser is started lazily, so an unchanged slate needs none.
+    """
+    reused, hashes, manifest = {}, {}, None
+    if incremental:
+        manifest = CaptureManifest()
+        print("🔎 Checking articles for changes since the last capture...")
+        reused, hashes = split_unchanged(creator, manifest)
+    
+    pending = [author for author in creator.author_urls if author not in reused]
+    captured = {}
+    if pending:
+        if workers == 1 and not creator.driver:
+            creator.setup_selenium()
+            if not creator.driver:
+                print("❌ Cannot proceed without WebDriver")
+                return {}
+        captured = capture_all_authors(creator, workers, None if not reused else pending)
+        # Shrink screenshots on disk before they are embedded
+        if optimize != 'none':
+            captured = optimize_author_screenshots(captured, optimize)
+    
+    if captured:
+        store_capture_results(creator, captured)
+    
+    if manifest is not None:
+        record_captured(creator, manifest, captured, hashes)
+        print(f"♻️ Reused {len(reused)} authors, captured {len(captured)}")
+    
+    return {author: reused[author] if author in reused else captured[author]
+            for author in creator.author_urls if author in reused or author in captured}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Capture NFL.com mock draft screenshots for all authors")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of concurrent headless Chrome sessions (default: 1, sequential)")
+    parser.add_argument('--per-element', action='store_true',
+                        help="Screenshot each pick separately instead of cropping one full-page capture")
+    parser.add_argument('--optimize', choices=['palette', 'jpeg', 'png', 'none'], default='palette',
+                        help="Downscale captured screenshots to document width and re-encode them "
+                             "across a process pool (default: palette)")
+    parser.add_argument('--recompress', choices=['palette', 'jpeg', 'none'], default='none',
+                        help="Lossy re-encoding of screenshots before embedding them in the document "
+                             "(default: none, embed as captured)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-capture authors whose articles changed since the last run")
+    add_profile_argument(parser)
+    return parser.parse_args()
 
 
 
 def main():
+    args = parse_args()
+    workers = max(1, args.workers)
+
     print("=== NFL Complete Screenshot Creator ===")
     print("📸 ALL 7 AUTHORS with up to 32 picks each")
     print("🎯 Expert analysis included under each pick")
     print("✅ Every author guaranteed to appear in document")
     print("=======================================================")
     
-    creator = NFLScreenshotComplete()
-    
-    if not creator.driver:
-        print("❌ Cannot proceed without WebDriver")
-        return
+    if workers > 1:
+        print(f"⚡ Parallel mode: {workers} concurrent browser sessions")
+
+    # In parallel mode the pool owns the browsers; the creator only merges and writes
+    # Incremental runs start the browser only if some article changed
+    creator = NFLScreenshotComplete(setup_driver=False, full_page=not args.per_element,
+                                    profile=args.profile, collect_players=True)
     
     try:
-        all_screenshots = {}
-        
-        # Process ALL authors
-        for author, url in creator.author_urls.items():
-            screenshots = creator.screenshot_webpage_content(url, author)
-            
-            all_screenshots[author] = screenshots
+        all_screenshots = run_capture(creator, workers, args.optimize, args.incremental)
+        if not all_screenshots:
+            return
         
         # Create Word document with all authors
-        output_path = creator.create_word_document(all_screenshots)
+        output_path = creator.create_word_document(
+            all_screenshots, recompress=None if args.recompress == 'none' else args.recompress)
         
         print(f"\n🎉 SUCCESS! Complete NFL.com screenshots captured!")
         print("=======================================================")
         print(f"📁 Document: {output_path}")
         print(f"📸 Screenshots: processed/complete_screenshots/")
         
-        total_screenshots = sum(len([s for s in author_data if isinstance(s, str) and s.endswith('.png')]) for author_data in all_screenshots.values())
+        # run_capture returns the paths optimize_author_screenshots produced (renamed .jpg included)
+        total_screenshots = sum(count_screenshot_files(author_data) for author_data in all_screenshots.values())
         print(f"\n📊 Summary:")
         print(f"   • {len(creator.author_urls)} authors processed (ALL)")
         print(f"   • {total_screenshots} total screenshots captured")
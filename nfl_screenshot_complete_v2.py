@@ -5,11 +5,11 @@ Creates Word document with screenshots and correctly mapped analysis text
 """
 
 import os
-import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_pick_mapper import capture_page_snapshot, filter_sequential_analysis
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint, scroll_into_view, scroll_to
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.oxml.shared import OxmlElement, qn
@@ -40,14 +40,7 @@ class NFLScreenshotCompleteV2:
     def setup_selenium(self):
         """Setup Selenium WebDriver with Chrome"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver()
             print("✓ Selenium WebDriver setup complete")
             return True
         except Exception as e:
@@ -59,11 +52,11 @@ class NFLScreenshotCompleteV2:
         try:
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(6)  # Reduced wait for page to fully load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(3)
+            wait_for_paint(self.driver)
             
             # Scroll through page to load content
             self.load_page_content()
@@ -88,12 +81,10 @@ class NFLScreenshotCompleteV2:
         """Load page content by scrolling"""
         total_height = self.driver.execute_script("return document.body.scrollHeight")
         for i in range(0, total_height, 2000):
-            self.driver.execute_script(f"window.scrollTo(0, {i});")
-            time.sleep(1.5)  # Reduced wait time for content loading
+            scroll_to(self.driver, i)
         
         # Return to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        scroll_to(self.driver, 0)
 
     def remove_overlays(self):
         """Remove cookie banners and overlays"""
@@ -129,47 +120,7 @@ class NFLScreenshotCompleteV2:
     def _get_filtered_analysis_paragraphs(self):
         """Get filtered analysis paragraphs for sequential mapping"""
         try:
-            # Get all paragraph elements
-            all_paragraphs = self.driver.find_elements(By.CSS_SELECTOR, 'p')
-            
-            # Get first and last pick locations for filtering boundaries
-            pick_elements = self.driver.find_elements(By.CSS_SELECTOR, '.nfl-o-ranked-item.nfl-o-ranked-item--side-by-side')
-            if not pick_elements:
-                return []
-            
-            first_pick_y = pick_elements[0].location['y']
-            last_pick_y = pick_elements[-1].location['y']
-            
-            analysis_paragraphs = []
-            for para in all_paragraphs:
-                try:
-                    text = para.get_attribute('textContent').strip()
-                    location = para.location['y']
-                    
-                    # Filter criteria based on debug findings
-                    if (text and len(text) > 50 and len(text) < 1000 and
-                        location > first_pick_y and  # After first pick
-                        location < last_pick_y + 2000 and  # Before way after last pick
-                        any(keyword in text.lower() for keyword in ['quarterback', 'player', 'draft', 'team', 'offense', 'defense', 'potential', 'needs', 'season', 'franchise']) and
-                        not text.startswith('Pick') and
-                        '©' not in text and
-                        'nfl.com' not in text.lower() and
-                        'cookie' not in text.lower() and
-                        'privacy' not in text.lower() and
-                        # Filter out intro/outro text
-                        'finally the week' not in text.lower() and
-                        'trades that are struck' not in text.lower() and
-                        'in his final mock' not in text.lower() and
-                        'with round 1' not in text.lower()):
-                        
-                        analysis_paragraphs.append((location, text))
-                except:
-                    continue
-            
-            # Sort by Y position and return just the text
-            analysis_paragraphs.sort(key=lambda x: x[0])
-            return [text for location, text in analysis_paragraphs]
-            
+            return filter_sequential_analysis(capture_page_snapshot(self.driver))
         except Exception as e:
             print(f"      ⚠️ Error getting analysis paragraphs: {e}")
             return []
@@ -244,8 +195,7 @@ class NFLScreenshotCompleteV2:
                     print(f"      📝 Description: {description[:100]}...")
                     
                     # Scroll element into view for better capture
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", pick_element)
-                    time.sleep(0.8)  # Reduced wait for scroll to complete
+                    scroll_into_view(self.driver, pick_element)
                     
                     # Capture screenshot of individual pick
                     screenshot_path = f"processed/complete_screenshots/{author}_pick_{pick_num:02d}.png"
@@ -254,8 +204,6 @@ class NFLScreenshotCompleteV2:
                     
                     print(f"   ✓ Pick {pick_num} screenshot captured")
                     
-                    time.sleep(0.4)  # Reduced pause between screenshots
-                    
                 except Exception as e:
                     print(f"   ⚠️ Error processing pick {i+1}: {e}")
                     descriptions.append(f"Pick {i+1} analysis not available.")
@@ -391,7 +339,7 @@ class NFLScreenshotCompleteV2:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
             print("✓ WebDriver closed")
 
 def main():
@@ -5,16 +5,16 @@ Takes reliable screenshots of NFL.com mock draft pages using direct element capt
 """
 
 import os
-import time
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint, scroll_into_view, scroll_to
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from nfl_docx_builder import add_picture_paragraph
 
 class NFLScreenshotFinal:
     def __init__(self):
@@ -34,15 +34,7 @@ class NFLScreenshotFinal:
     def setup_selenium(self):
         """Setup Selenium WebDriver for taking screenshots"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')  # Large window
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('--force-device-scale-factor=1')  # Ensure consistent scaling
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver()
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
@@ -61,11 +53,11 @@ class NFLScreenshotFinal:
             
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(10)  # Long wait for page to fully load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(3)
+            wait_for_paint(self.driver)
             
             # Get article header
             header_screenshot = self.screenshot_article_header(author)
@@ -129,8 +121,7 @@ class NFLScreenshotFinal:
                     header_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if header_element.is_displayed():
                         # Scroll to element
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header_element)
-                        time.sleep(3)
+                        scroll_into_view(self.driver, header_element)
                         
                         # Take screenshot
                         screenshot_path = f"processed/final_screenshots/{author}_header.png"
@@ -160,8 +151,7 @@ class NFLScreenshotFinal:
                     content_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if content_element.is_displayed():
                         # Scroll to element
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'start'});", content_element)
-                        time.sleep(3)
+                        scroll_into_view(self.driver, content_element, block='start')
                         
                         # Take screenshot
                         screenshot_path = f"processed/final_screenshots/{author}_content.png"
@@ -207,8 +197,7 @@ class NFLScreenshotFinal:
                 for i, pick_element in enumerate(pick_elements, 1):
                     try:
                         # Scroll to the pick
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", pick_element)
-                        time.sleep(2)
+                        scroll_into_view(self.driver, pick_element)
                         
                         # Take direct element screenshot
                         screenshot_path = f"processed/final_screenshots/{author}_pick_{i:02d}.png"
@@ -234,8 +223,7 @@ class NFLScreenshotFinal:
         
         try:
             # Scroll to top
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            scroll_to(self.driver, 0)
             
             # Get page dimensions
             total_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -249,8 +237,7 @@ class NFLScreenshotFinal:
                 scroll_position = i * section_height
                 
                 # Scroll to position
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                time.sleep(4)  # Wait for content to load
+                scroll_to(self.driver, scroll_position)
                 
                 # Take screenshot
                 screenshot_path = f"processed/final_screenshots/{author}_section_{i+1:02d}.png"
@@ -323,10 +310,9 @@ class NFLScreenshotFinal:
                 try:
                     if os.path.exists(screenshot_path):
                         # Add screenshot with full width
-                        doc.add_picture(screenshot_path, width=Inches(7.5))
+                        last_paragraph = add_picture_paragraph(doc, screenshot_path, width=Inches(7.5))
                         
                         # Center the image
-                        last_paragraph = doc.paragraphs[-1]
                         last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                         last_paragraph.space_before = Pt(12)
                         last_paragraph.space_after = Pt(12)
@@ -352,7 +338,7 @@ class NFLScreenshotFinal:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
 
 def main():
     print("=== NFL Final Screenshot Creator ===")
@@ -9,19 +9,20 @@ from bs4 import BeautifulSoup
 import json
 from datetime import datetime
 import os
-import time
 import re
 from urllib.parse import urljoin
 from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, scroll_into_view
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from PIL import Image
 import io
+from nfl_placeholder_renderer import get_font
+from nfl_docx_builder import add_picture_paragraph
 
 class NFLScreenshotScraper:
     def __init__(self):
@@ -45,14 +46,8 @@ class NFLScreenshotScraper:
     def setup_selenium(self):
         """Setup Selenium WebDriver for taking screenshots"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')  # Run in background
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver(headless=True, window_size=(1920, 1080),
+                                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
@@ -69,7 +64,7 @@ class NFLScreenshotScraper:
             
             # Navigate to the URL
             self.driver.get(url)
-            time.sleep(3)  # Wait for page to load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Look for pick elements using various selectors
             pick_selectors = [
@@ -90,8 +85,7 @@ class NFLScreenshotScraper:
                         element = elements[0]
                         
                         # Scroll to element
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                        time.sleep(1)
+                        scroll_into_view(self.driver, element, block='start')
                         
                         # Take screenshot of the element
                         screenshot_path = f"processed/screenshots/{author}_{pick_number}.png"
@@ -160,7 +154,7 @@ class NFLScreenshotScraper:
         try:
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(5)  # Wait for full page load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Look for all pick elements
             pick_selectors = [
@@ -194,8 +188,7 @@ class NFLScreenshotScraper:
             for i, pick_element in enumerate(all_picks[:num_picks], 1):
                 try:
                     # Scroll to the pick
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", pick_element)
-                    time.sleep(1)
+                    scroll_into_view(self.driver, pick_element, block='start')
                     
                     # Take screenshot
                     screenshot_path = f"processed/screenshots/{author}_pick_{i}.png"
@@ -243,7 +236,7 @@ class NFLScreenshotScraper:
         
         for i in range(num_picks):
             try:
-                from PIL import Image, ImageDraw, ImageFont
+                from PIL import Image, ImageDraw
                 
                 pick_data = sample_picks[i] if i < len(sample_picks) else sample_picks[0]
                 
@@ -254,15 +247,9 @@ class NFLScreenshotScraper:
                 # Add left border (NFL style)
                 draw.rectangle([0, 0, 10, 120], fill=(0, 53, 148))
                 
-                # Try to load fonts
-                try:
-                    font_large = ImageFont.truetype("Arial.ttf", 24)
-                    font_medium = ImageFont.truetype("Arial.ttf", 18)
-                    font_small = ImageFont.truetype("Arial.ttf", 14)
-                except:
-                    font_large = ImageFont.load_default()
-                    font_medium = ImageFont.load_default()
-                    font_small = ImageFont.load_default()
+                font_large = get_font(24)
+                font_medium = get_font(18)
+                font_small = get_font(14)
                 
                 # Add pick number
                 draw.text((30, 20), f"Pick", fill=(100, 100, 100), font=font_small)
@@ -357,10 +344,9 @@ class NFLScreenshotScraper:
                 try:
                     # Add the screenshot with smaller size for condensed layout
                     if os.path.exists(screenshot['path']):
-                        doc.add_picture(screenshot['path'], width=Inches(6.0))  # Smaller images
+                        last_paragraph = add_picture_paragraph(doc, screenshot['path'], width=Inches(6.0))  # Smaller images
                         
                         # Center the image
-                        last_paragraph = doc.paragraphs[-1]
                         last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                         
                         # Remove spacing after image
@@ -389,7 +375,7 @@ class NFLScreenshotScraper:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
 
 def main():
     print("=== NFL Screenshot Scraper ===")
@@ -5,11 +5,11 @@ Takes screenshots of picks with expanded areas to capture description text below
 """
 
 import os
-import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint, scroll_into_view, scroll_to
+from nfl_fullpage_capture import capture_pick_crops
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -38,14 +38,7 @@ class NFLScreenshotSimple:
     def setup_selenium(self):
         """Setup Selenium WebDriver with Chrome"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver()
             print("✓ Selenium WebDriver setup complete")
             return True
         except Exception as e:
@@ -58,11 +51,11 @@ class NFLScreenshotSimple:
             print(f"🔍 Loading: {url}")
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(6)  # Wait for page to fully load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(3)
+            wait_for_paint(self.driver)
             
             # Scroll through page to load content
             self.load_page_content()
@@ -83,12 +76,10 @@ class NFLScreenshotSimple:
         """Load page content by scrolling"""
         total_height = self.driver.execute_script("return document.body.scrollHeight")
         for i in range(0, total_height, 2000):
-            self.driver.execute_script(f"window.scrollTo(0, {i});")
-            time.sleep(0.8)
+            scroll_to(self.driver, i)
         
         # Return to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        scroll_to(self.driver, 0)
 
     def remove_overlays(self):
         """Remove cookie banners and overlays"""
@@ -138,9 +129,11 @@ class NFLScreenshotSimple:
             ]
             
             pick_elements = None
+            pick_selector = None
             for selector in pick_selectors:
                 pick_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 if pick_elements:
+                    pick_selector = selector
                     print(f"   📋 Found {len(pick_elements)} draft picks for {author} using: {selector}")
                     break
             
@@ -148,95 +141,31 @@ class NFLScreenshotSimple:
                 print(f"   ⚠️ No pick elements found for {author}")
                 return []
             
-            print(f"   📋 Processing {min(32, len(pick_elements))} picks for {author}")
+            pick_count = min(32, len(pick_elements))
+            print(f"   📋 Processing {pick_count} picks for {author}")
+            
+            # One full-page capture; each pick is cropped with 200px extra below it
+            # to include the description text
+            try:
+                crops = capture_pick_crops(self.driver, pick_selector, pick_count, extra_height=200)
+            except Exception as e:
+                print(f"   ⚠️ Full-page capture failed, using element screenshots: {e}")
+                crops = [None] * pick_count
             
-            # Process up to 32 picks
-            for i in range(min(32, len(pick_elements))):
+            for i in range(pick_count):
                 try:
-                    pick_element = pick_elements[i]
                     pick_num = i + 1
-                    
-                    print(f"   🔍 Processing Pick {pick_num}...")
-                    
-                    # Scroll element into view
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", pick_element)
-                    time.sleep(0.5)
-                    
-                    # Get element position and size
-                    element_location = pick_element.location
-                    element_size = pick_element.size
-                    
-                    # Calculate expanded screenshot area to include description text below
-                    # Expand downward by approximately 150-200 pixels to capture description
-                    expanded_height = element_size['height'] + 200  # Extra space for description
-                    
-                    # Take screenshot of expanded area using JavaScript
                     screenshot_path = f"processed/complete_screenshots/{author}_pick_{pick_num:02d}.png"
                     
-                    # Use JavaScript to create a larger screenshot area
-                    script = f"""
-                    var element = arguments[0];
-                    var rect = element.getBoundingClientRect();
-                    var canvas = document.createElement('canvas');
-                    var ctx = canvas.getContext('2d');
-                    
-                    // Set canvas size to include extra space below
-                    canvas.width = rect.width;
-                    canvas.height = rect.height + 200;
-                    
-                    return {{
-                        x: rect.left + window.scrollX,
-                        y: rect.top + window.scrollY,
-                        width: rect.width,
-                        height: rect.height + 200
-                    }};
-                    """
-                    
-                    # Get expanded coordinates
-                    coords = self.driver.execute_script(script, pick_element)
-                    
-                    # Take screenshot of the expanded area
-                    # For simplicity, let's use element screenshot and then try to capture more
-                    pick_element.screenshot(screenshot_path)
-                    
-                    # Alternative approach: Take a larger screenshot using viewport
-                    # Get viewport screenshot and crop to expanded area
-                    viewport_screenshot_path = f"processed/complete_screenshots/{author}_pick_{pick_num:02d}_temp.png"
-                    self.driver.save_screenshot(viewport_screenshot_path)
-                    
-                    # Use Python PIL to crop the expanded area from viewport screenshot
-                    try:
-                        from PIL import Image
-                        
-                        # Open the viewport screenshot
-                        viewport_img = Image.open(viewport_screenshot_path)
-                        
-                        # Calculate crop coordinates (element position + extra height)
-                        left = max(0, element_location['x'])
-                        top = max(0, element_location['y'])
-                        right = min(viewport_img.width, left + element_size['width'])
-                        bottom = min(viewport_img.height, top + element_size['height'] + 200)  # +200px for description
-                        
-                        # Crop the expanded area
-                        expanded_crop = viewport_img.crop((left, top, right, bottom))
-                        expanded_crop.save(screenshot_path)
-                        
-                        # Clean up temp file
-                        os.remove(viewport_screenshot_path)
-                        
+                    if crops[i] is not None:
+                        crops[i].save(screenshot_path)
                         print(f"   ✓ Pick {pick_num} expanded screenshot captured (includes description)")
-                        
-                    except ImportError:
-                        print(f"   ⚠️ PIL not available, using basic screenshot for pick {pick_num}")
-                    except Exception as crop_error:
-                        print(f"   ⚠️ Error cropping expanded area for pick {pick_num}: {crop_error}")
-                        # Clean up temp file if it exists
-                        if os.path.exists(viewport_screenshot_path):
-                            os.remove(viewport_screenshot_path)
+                    else:
+                        scroll_into_view(self.driver, pick_elements[i])
+                        pick_elements[i].screenshot(screenshot_path)
+                        print(f"   ✓ Pick {pick_num} basic screenshot captured")
                     
                     screenshots.append(screenshot_path)
-                    time.sleep(0.3)  # Brief pause between screenshots
-                    
                 except Exception as e:
                     print(f"   ⚠️ Error processing pick {i+1}: {e}")
             
@@ -340,7 +269,7 @@ class NFLScreenshotSimple:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
             print("✓ WebDriver closed")
 
 def main():
@@ -5,11 +5,11 @@ Takes element screenshots with extra scrolling to ensure description text is vis
 """
 
 import os
-import time
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import (wait_for_page_ready, wait_for_paint, wait_for_scroll_settled,
+                                wait_for_images_decoded, scroll_to)
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -38,14 +38,7 @@ class NFLScreenshotUltraSimple:
     def setup_selenium(self):
         """Setup Selenium WebDriver with Chrome"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1800,1400')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver()
             print("✓ Selenium WebDriver setup complete")
             return True
         except Exception as e:
@@ -58,11 +51,11 @@ class NFLScreenshotUltraSimple:
             print(f"🔍 Loading: {url}")
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(6)  # Wait for page to fully load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Remove overlays
             self.remove_overlays()
-            time.sleep(3)
+            wait_for_paint(self.driver)
             
             # Scroll through page to load content
             self.load_page_content()
@@ -83,12 +76,10 @@ class NFLScreenshotUltraSimple:
         """Load page content by scrolling"""
         total_height = self.driver.execute_script("return document.body.scrollHeight")
         for i in range(0, total_height, 2000):
-            self.driver.execute_script(f"window.scrollTo(0, {i});")
-            time.sleep(0.8)
+            scroll_to(self.driver, i)
         
         # Return to top
-        self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
+        scroll_to(self.driver, 0)
 
     def remove_overlays(self):
         """Remove cookie banners and overlays"""
@@ -153,7 +144,8 @@ class NFLScreenshotUltraSimple:
                         window.scrollTo(0, targetY);
                     """, pick_element)
                     
-                    time.sleep(0.8)  # Wait for scroll and any lazy loading
+                    wait_for_scroll_settled(self.driver)
+                    wait_for_images_decoded(self.driver, pick_element)
                     
                     # Try to find and capture a larger container that includes description
                     # Look for parent containers that might include the analysis text
@@ -179,8 +171,6 @@ class NFLScreenshotUltraSimple:
                     
                     print(f"   ✓ Pick {pick_num} screenshot captured with description")
                     
-                    time.sleep(0.3)  # Brief pause between screenshots
-                    
                 except Exception as e:
                     print(f"   ⚠️ Error processing pick {i+1}: {e}")
                     # Fallback to basic element screenshot
@@ -291,7 +281,7 @@ class NFLScreenshotUltraSimple:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
             print("✓ WebDriver closed")
 
 def main():
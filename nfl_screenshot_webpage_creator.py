@@ -6,18 +6,18 @@ with the exact visual layouts from the webpages
 """
 
 import os
-import time
 from datetime import datetime
 from docx import Document
 from docx.shared import Inches, RGBColor, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from nfl_driver_factory import get_driver, release_driver
+from nfl_page_readiness import wait_for_page_ready, wait_for_paint, scroll_into_view, scroll_to
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from PIL import Image
+from nfl_docx_builder import add_picture_paragraph
 
 class NFLScreenshotCreator:
     def __init__(self):
@@ -41,14 +41,7 @@ class NFLScreenshotCreator:
     def setup_selenium(self):
         """Setup Selenium WebDriver for taking screenshots"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1600,1200')  # Larger window for better capture
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = get_driver(window_size=(1600, 1200))
             print("✓ Selenium WebDriver setup complete")
         except Exception as e:
             print(f"⚠️ Selenium setup failed: {e}")
@@ -68,13 +61,13 @@ class NFLScreenshotCreator:
             
             # Navigate to the page
             self.driver.get(url)
-            time.sleep(8)  # Longer wait for page to fully load
+            wait_for_page_ready(self.driver, ['.nfl-o-ranked-item', 'h1'])
             
             # Remove any overlay/cookie banners that might block content
             self.remove_overlays()
             
-            # Wait for content to load
-            time.sleep(3)
+            # Wait for the overlay removal to paint
+            wait_for_paint(self.driver)
             
             # Get article title screenshot
             title_screenshot = self.screenshot_article_title(author)
@@ -136,7 +129,7 @@ class NFLScreenshotCreator:
                     for button in buttons:
                         if button.is_displayed():
                             button.click()
-                            time.sleep(1)
+                            wait_for_paint(self.driver)
                 except:
                     continue
                     
@@ -159,8 +152,7 @@ class NFLScreenshotCreator:
                     header_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if header_element.is_displayed():
                         # Scroll to element and ensure it's visible
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", header_element)
-                        time.sleep(2)
+                        scroll_into_view(self.driver, header_element)
                         
                         # Take screenshot with more padding
                         screenshot_path = f"processed/webpage_screenshots/{author}_article_title.png"
@@ -212,8 +204,7 @@ class NFLScreenshotCreator:
                     content_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if content_element.is_displayed():
                         # Scroll to element
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'start'});", content_element)
-                        time.sleep(2)
+                        scroll_into_view(self.driver, content_element, block='start')
                         
                         # Take screenshot
                         screenshot_path = f"processed/webpage_screenshots/{author}_main_content.png"
@@ -263,8 +254,7 @@ class NFLScreenshotCreator:
                 for i, pick_element in enumerate(pick_elements, 1):
                     try:
                         # Scroll to the pick with more context
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", pick_element)
-                        time.sleep(2)
+                        scroll_into_view(self.driver, pick_element)
                         
                         # Take screenshot with additional context around the pick
                         screenshot_path = f"processed/webpage_screenshots/{author}_draft_pick_{i}.png"
@@ -321,8 +311,7 @@ class NFLScreenshotCreator:
         
         try:
             # Scroll to top first
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
+            scroll_to(self.driver, 0)
             
             # Get total page height
             total_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -336,8 +325,7 @@ class NFLScreenshotCreator:
                 scroll_position = i * section_height
                 
                 # Scroll to position
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                time.sleep(3)  # Longer wait for content to load
+                scroll_to(self.driver, scroll_position)
                 
                 # Take screenshot
                 screenshot_path = f"processed/webpage_screenshots/{author}_content_section_{i+1}.png"
@@ -404,10 +392,9 @@ class NFLScreenshotCreator:
                 try:
                     if os.path.exists(screenshot_path):
                         # Add with appropriate width (maintain aspect ratio)
-                        doc.add_picture(screenshot_path, width=Inches(7.5))
+                        last_paragraph = add_picture_paragraph(doc, screenshot_path, width=Inches(7.5))
                         
                         # Center the image
-                        last_paragraph = doc.paragraphs[-1]
                         last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                         last_paragraph.space_before = Pt(8)
                         last_paragraph.space_after = Pt(8)
@@ -437,7 +424,7 @@ class NFLScreenshotCreator:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver)
 
 def main():
     print("=== NFL Webpage Screenshot Creator (Enhanced) ===")
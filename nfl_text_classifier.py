@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+NFL Text Classifier - Team, city, position and stop-word detection in one scan
+Every keyword list the extractors used to loop over is compiled once, at import,
+into a single regex; a string is classified by one pass over its lowercased text
+"""
+
+import re
+from functools import lru_cache
+
+# Team nicknames as they appear on NFL.com pick cards
+TEAM_NAMES = ['titans', 'browns', 'giants', 'patriots', 'raiders', 'jaguars', 'jets', 'panthers', 'saints', 'lions', 'cowboys', 'dolphins', 'colts', 'falcons', 'cardinals', 'bengals', 'vikings', 'buccaneers', 'broncos', 'chargers', 'steelers', 'packers', 'texans', 'rams', 'eagles', 'bills', 'chiefs', 'seahawks', 'commanders']
+
+# Singular stems too, so any text mentioning a team (or a 49ers city) is rejected as a player name
+TEAM_NAME_STEMS = TEAM_NAMES + [
+    'ravens', 'niners', 'francisco', 'titan', 'brown', 'giant', 'patriot', 'jaguar', 'raider', 'jet',
+    'panther', 'saint', 'bear', 'cowboy', 'dolphin', 'colt', 'falcon', 'cardinal', 'bengal', 'seahawk',
+    'buccaneer', 'bronco', 'packer', 'charger',
+]
+
+# City, nickname and storyline keywords that tie an analysis paragraph to a team
+TEAM_CONTEXT_KEYWORDS = {
+    'giants': ['giants', 'new york'],
+    'titans': ['titans', 'tennessee'],
+    'browns': ['browns', 'cleveland'],
+    'patriots': ['patriots', 'new england', 'drake maye'],
+    'jaguars': ['jaguars', 'jacksonville', 'trevor lawrence'],
+    'raiders': ['raiders', 'las vegas'],
+    'jets': ['jets', 'new york jets', 'justin fields'],
+    'cowboys': ['cowboys', 'dallas'],
+    'saints': ['saints', 'new orleans'],
+    'bears': ['bears', 'chicago'],
+    'panthers': ['panthers', 'carolina'],
+    'dolphins': ['dolphins', 'miami', 'jalen ramsey'],
+    'colts': ['colts', 'indianapolis'],
+    'falcons': ['falcons', 'atlanta'],
+    'cardinals': ['cardinals', 'arizona'],
+    'bengals': ['bengals', 'cincinnati'],
+    'vikings': ['vikings', 'minnesota'],
+    'buccaneers': ['buccaneers', 'tampa bay', 'bucs'],
+    'broncos': ['broncos', 'denver', 'sean payton'],
+    'chargers': ['chargers', 'los angeles chargers'],
+    'steelers': ['steelers', 'pittsburgh'],
+    'packers': ['packers', 'green bay'],
+    'texans': ['texans', 'houston'],
+    'rams': ['rams', 'los angeles rams'],
+    'eagles': ['eagles', 'philadelphia'],
+    'bills': ['bills', 'buffalo'],
+    'chiefs': ['chiefs', 'kansas city'],
+    'seahawks': ['seahawks', 'seattle'],
+    'commanders': ['commanders', 'washington']
+}
+
+# Words that mark a line as a pick/page label rather than a name
+LABEL_WORDS = ['pick', 'round', 'draft', 'team', 'position']
+
+SCHOOL_WORDS = ['college', 'university']
+
+POSITION_WORDS = ['quarterback', 'running', 'wide', 'tight', 'offensive', 'defensive',
+                  'linebacker', 'cornerback', 'safety', 'kicker', 'punter']
+
+ANALYSIS_KEYWORDS = ['quarterback', 'player', 'draft', 'team', 'offense', 'defense', 'potential', 'needs', 'season', 'franchise', 'protection', 'elite']
+
+# The sequential filter's narrower list: pick N gets paragraph N, so an extra match shifts every later pick
+SEQUENTIAL_ANALYSIS_KEYWORDS = ['quarterback', 'player', 'draft', 'team', 'offense', 'defense', 'potential', 'needs', 'season', 'franchise']
+
+# Intro/outro phrases found by the debug mapping analysis
+INTRO_OUTRO_PHRASES = ['finally the week', 'trades that are struck', 'in his final mock', 'with round 1']
+
+# category -> keywords; a text belongs to a category when it contains any of them
+CATEGORY_KEYWORDS = {
+    'team': TEAM_NAMES,
+    'team_stem': TEAM_NAME_STEMS,
+    'label': LABEL_WORDS,
+    'school': SCHOOL_WORDS,
+    'position': POSITION_WORDS,
+    'select': ['select'],
+    'analysis': ANALYSIS_KEYWORDS,
+    'sequential_analysis': SEQUENTIAL_ANALYSIS_KEYWORDS,
+    'intro_outro': INTRO_OUTRO_PHRASES,
+}
+for _team, _keywords in TEAM_CONTEXT_KEYWORDS.items():
+    CATEGORY_KEYWORDS[f'team:{_team}'] = _keywords
+
+
+def _trie_regex(keywords):
+    """Regex alternation shaped like a prefix trie, so each position is tried in one descent
+
+    Continuations are greedy, which makes the regex match the longest keyword
+    starting at a position.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+
+def _build_automaton(category_keywords):
+    """(regex, {keyword: categories}) matching the longest keyword at every position
+
+    The lookahead lets matches overlap, and a keyword also carries the categories
+    of every keyword that is a prefix of it (both match wherever it does), so
+    the union over all matches equals an any(keyword in text) test per category.
+    """
+    categories = {}
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            categories.setdefault(keyword, set()).add(category)
+    expanded = {keyword: frozenset().union(*(categories[prefix] for prefix in categories
+                                             if keyword.startswith(prefix)))
+                for keyword in categories}
+    return re.compile('(?=(' + _trie_regex(categories) + '))'), expanded
+
+
+KEYWORD_PATTERN, KEYWORD_CATEGORIES = _build_automaton(CATEGORY_KEYWORDS)
+
+
+@lru_cache(maxsize=8192)
+def classify(text):
+    """Frozenset of categories whose keywords occur in text (case-insensitive substring match)"""
+    found = set()
+    for match in KEYWORD_PATTERN.finditer(text.lower()):
+        found.update(KEYWORD_CATEGORIES[match.group(1)])
+    return frozenset(found)
+
+
+def teams_mentioned(text):
+    """Team keys (TEAM_CONTEXT_KEYWORDS) whose nickname, city or storyline text mentions"""
+    return {category[5:] for category in classify(text) if category.startswith('team:')}
+
+
+def looks_like_name(text):
+    """Two or three words, each a capital followed by lowercase letters ('A.J.' and "O'Neil" fail)"""
+    words = text.split()
+    if len(words) < 2 or len(words) > 3:
+        return False
+    for word in words:
+        clean_word = word.replace('.', '').replace("'", '')
+        if not clean_word.isalpha() or not (word[0].isupper() and word[1:].islower()):
+            return False
+    return True
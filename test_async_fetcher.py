@@ -0,0 +1,64 @@
+"""Tests for nfl_async_fetcher: per-host token buckets, retries and result order"""
+
+import asyncio
+import time
+import requests
+from nfl_async_fetcher import AsyncArticleFetcher, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status, url):
+        self.status_code = status
+        self.text = f'<html>{url}</html>'
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code}', response=self)
+
+
+class FakeSession:
+    """Answers each URL with its scripted statuses in turn, the last one forever"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        script = self.statuses.get(url, [200])
+        status = script.pop(0) if len(script) > 1 else script[0]
+        if status is None:
+            raise requests.ConnectionError('connection reset')
+        return FakeResponse(status, url)
+
+
+def test_token_bucket_spaces_requests_after_the_burst():
+    async def take(count):
+        bucket = TokenBucket(rate=20, capacity=2)
+        started = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(take(2)) < 0.04
+    assert asyncio.run(take(5)) >= 0.14  # 3 tokens beyond the burst at 20 per second
+
+
+def test_transient_failures_are_retried_and_client_errors_are_not():
+    session = FakeSession({'https://a/1': [503, None, 200], 'https://a/2': [404], 'https://a/3': [500]})
+    fetcher = AsyncArticleFetcher(session, rate_per_host=1000, burst=10, retries=2, backoff=0)
+    pages = fetcher.fetch_all(['https://a/1', 'https://a/2', 'https://a/3'])
+    assert pages == {'https://a/1': '<html>https://a/1</html>', 'https://a/2': None, 'https://a/3': None}
+    assert session.calls.count('https://a/1') == 3
+    assert session.calls.count('https://a/2') == 1
+    assert session.calls.count('https://a/3') == 3
+    assert set(fetcher.latencies) == {'https://a/1'}
+
+
+def test_duplicates_are_fetched_once_and_hosts_get_their_own_bucket():
+    session = FakeSession({})
+    fetcher = AsyncArticleFetcher(session, rate_per_host=1000, burst=10)
+    urls = ['https://b/1', 'https://a/1', 'https://b/1', 'https://a/2']
+    assert list(fetcher.fetch_all(urls)) == ['https://b/1', 'https://a/1', 'https://a/2']
+    assert sorted(session.calls) == ['https://a/1', 'https://a/2', 'https://b/1']
+    assert set(fetcher.buckets) == {'a', 'b'}
@@ -0,0 +1,103 @@
+"""Tests for nfl_capture_manifest: what gets recorded, when it is reused and what is re-captured"""
+
+import pytest
+from nfl_capture_manifest import CaptureManifest, pick_list_hash, pick_numbers, record_captured, split_unchanged
+
+URL = 'https://www.nfl.com/news/test-2025-nfl-mock-draft'
+PICKS = [{'pick': number, 'team': f'Team {number}', 'player': f'Player {number}'} for number in (1, 2, 3)]
+
+
+def touch(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b'png')
+    return str(path)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return CaptureManifest(str(tmp_path / 'manifest.json'))
+
+
+@pytest.fixture
+def crops(tmp_path):
+    return [touch(tmp_path, 'A_header.png')] + [touch(tmp_path, f'A_pick_{number}.png') for number in (1, 2, 3)]
+
+
+class FakeCreator:
+    def __init__(self):
+        self.author_urls = {'A': URL}
+        self.pick_descriptions = {'A': {1: 'First', 2: 'Second', 3: 'Third'}}
+        self.pick_players = {}
+
+
+class FakeSession:
+    """Serves a fixed pick list through extract_picks by stubbing the fetch"""
+
+    def __init__(self, monkeypatch, picks):
+        monkeypatch.setattr('nfl_capture_manifest.extract_picks', lambda content, max_picks=32: picks)
+
+    def get(self, url, timeout=None, headers=None):
+        return self
+
+    def raise_for_status(self):
+        pass
+
+    content = b''
+
+
+def test_pick_list_hash_follows_visible_fields_only():
+    assert pick_list_hash(PICKS) == pick_list_hash([dict(pick, ignored='x') for pick in PICKS])
+    assert pick_list_hash(PICKS) != pick_list_hash(PICKS[:1] + [dict(PICKS[1], player='Other')] + PICKS[2:])
+
+
+def test_pick_numbers_skip_headers_sections_and_full_pages():
+    files = ['p/A_header.png', 'p/A_pick_2.jpg', 'p/A_section.png', 'p/A_fullpage.png', 'p/A_pick_1.png']
+    assert pick_numbers(files) == [1, 2]
+
+
+def test_record_keeps_a_complete_capture(manifest, crops):
+    manifest.record(URL, 'A', 'hash', 3, crops, {1: 'First'})
+    assert manifest.is_current(URL, 'hash')
+    assert not manifest.is_current(URL, 'changed')
+    assert manifest.files(URL) == crops
+    assert manifest.descriptions(URL) == {1: 'First'}
+
+    manifest.save()
+    assert CaptureManifest(manifest.path).is_current(URL, 'hash')
+
+
+@pytest.mark.parametrize('names', [
+    ['A_fullpage.png'], ['A_section.png'], ['A_header.png', 'A_pick_1.png', 'A_pick_3.png'],
+])
+def test_record_drops_fallback_and_partial_captures(manifest, crops, tmp_path, names):
+    manifest.record(URL, 'A', 'hash', 3, crops, {})
+    manifest.record(URL, 'A', 'hash', 3, [touch(tmp_path, name) for name in names], {})
+    assert URL not in manifest.entries
+    assert not manifest.is_current(URL, 'hash')
+
+
+def test_missing_files_or_old_entries_are_not_current(manifest, crops, tmp_path):
+    manifest.record(URL, 'A', 'hash', 3, crops, {})
+    del manifest.entries[URL]['pick_count']  # written before pick counts were recorded
+    assert not manifest.is_current(URL, 'hash')
+
+    manifest.record(URL, 'A', 'hash', 3, crops, {})
+    (tmp_path / 'A_pick_2.png').unlink()
+    assert not manifest.is_current(URL, 'hash')
+
+
+def test_split_unchanged_reuses_only_matching_articles(manifest, crops, monkeypatch):
+    creator = FakeCreator()
+    session = FakeSession(monkeypatch, PICKS)
+
+    reused, hashes = split_unchanged(creator, manifest, session)
+    assert reused == {} and hashes == {'A': (pick_list_hash(PICKS), 3)}
+
+    record_captured(creator, manifest, {'A': crops}, hashes)
+    creator.pick_descriptions = {}
+    reused, _ = split_unchanged(creator, manifest, session)
+    assert reused == {'A': crops}
+    assert creator.pick_descriptions['A'][2] == 'Second'
+
+    session = FakeSession(monkeypatch, PICKS[:2])
+    assert split_unchanged(creator, manifest, session)[0] == {}
@@ -0,0 +1,55 @@
+"""Tests for nfl_consensus: pick statistics, weights and spelling joins"""
+
+import math
+import pandas as pd
+from nfl_consensus import consensus_rankings, pick_matrix, recency_weights, selected_by
+
+SELECTIONS = [
+    {'name': 'Cam Ward', 'pick': 1, 'author': 'A', 'team': 'Tennessee Titans'},
+    {'name': 'Cam Ward', 'pick': 2, 'author': 'B', 'team': 'Cleveland Browns'},
+    {'name': 'Cam Ward', 'pick': 1, 'author': 'C', 'team': 'Tennessee Titans'},
+    {'name': 'Kelvin Banks Jr.', 'pick': 9, 'author': 'A', 'team': None},
+    {'name': 'kelvin banks', 'pick': 7, 'author': 'B', 'team': None},
+    {'name': 'Tet McMillan', 'pick': 8, 'author': 'A', 'team': None},
+    {'name': 'Tetairoa McMillan', 'pick': 12, 'author': 'A', 'team': None},
+]
+
+
+def test_pick_matrix_joins_spellings_and_keeps_earliest_pick():
+    players, authors, matrix = pick_matrix(SELECTIONS)
+    assert players == ['Cam Ward', 'Kelvin Banks Jr.', 'Tetairoa McMillan']
+    assert authors == ['A', 'B', 'C']
+    assert matrix[2, 0] == 8
+    assert math.isnan(matrix[2, 1])
+
+
+def test_consensus_statistics_and_order():
+    rankings = consensus_rankings(SELECTIONS)
+    assert rankings['player'].tolist() == ['Cam Ward', 'Kelvin Banks Jr.', 'Tetairoa McMillan']
+    ward = rankings.iloc[0]
+    assert ward['selections'] == 3
+    assert ward['median_pick'] == 1 and (ward['min_pick'], ward['max_pick']) == (1, 2)
+    assert ward['top_team'] == 'Tennessee Titans'
+    assert math.isclose(ward['team_share'], 2 / 3)
+    assert rankings.iloc[1]['mean_pick'] == 8
+    assert pd.isna(rankings.iloc[2]['top_team'])
+
+
+def test_author_weights_reorder_by_weighted_share():
+    weights = {'A': 0.1, 'B': 1.0, 'C': 1.0}
+    rankings = consensus_rankings(SELECTIONS, weights)
+    assert math.isclose(rankings.iloc[0]['weighted_share'], 1.0)
+    assert math.isclose(rankings.iloc[1]['weighted_share'], 1.1 / 2.1)
+
+
+def test_selected_by_lists_every_spelling_under_the_canonical_player():
+    assert selected_by(SELECTIONS)['Kelvin Banks Jr.'] == {'A': 9, 'B': 7}
+    assert selected_by(SELECTIONS)['Tetairoa McMillan'] == {'A': 8}
+
+
+def test_recency_weights_halve_per_half_life():
+    weights = recency_weights({'new': '2025-04-20', 'old': '2025-03-21', 'unknown': None}, half_life_days=30)
+    assert weights['new'] == 1.0
+    assert math.isclose(weights['old'], 0.5)
+    assert weights['unknown'] == weights['old']
+    assert recency_weights({'a': None}) == {'a': 1.0}
@@ -0,0 +1,139 @@
+"""Tests for nfl_docx_builder: append order, named styles, picture parts, de-duplication and recompression"""
+
+import io
+import pytest
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt
+from PIL import Image
+from nfl_docx_builder import DocumentBuilder, recompress_image
+
+
+def png(color, size=(40, 30)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def screenshot_png():
+    """Large RGB PNG with a handful of colours, like a page screenshot"""
+    img = Image.new('RGB', (400, 300), (255, 255, 255))
+    for x in range(0, 400, 7):
+        for y in range(0, 300, 5):
+            img.putpixel((x, y), ((x * 3) % 256, (y * 5) % 256, 120))
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def pictures(doc):
+    """(partname, blob) of each inline picture in document order"""
+    parts = [doc.part.related_parts[shape._inline.graphic.graphicData.pic.blipFill.blip.embed]
+             for shape in doc.inline_shapes]
+    return [(str(part.partname), part.blob) for part in parts]
+
+
+def test_content_is_appended_in_order_before_the_section_properties(tmp_path):
+    builder = DocumentBuilder()
+    builder.heading('Title', level=0)
+    builder.text('first')
+    builder.picture(io.BytesIO(png('red')), width=Inches(1))
+    builder.page_break()
+    builder.text('last')
+    doc = Document(builder.save(str(tmp_path / 'order.docx')))
+    assert [p.text for p in doc.paragraphs] == ['Title', 'first', '', '', 'last']
+    assert doc.paragraphs[0].style.name == 'Title'
+    assert doc.element.body[-1].tag == qn('w:sectPr')
+
+
+def test_styles_reach_the_saved_document(tmp_path):
+    builder = DocumentBuilder()
+    builder.define_paragraph_style('Pick Layout', alignment=WD_ALIGN_PARAGRAPH.CENTER,
+                                   space_before=Pt(2), space_after=Pt(6), size=Pt(9), italic=True)
+    builder.define_run_style('Pick Name', bold=True, color=(0, 53, 148))
+    paragraph = builder.text('Cam Ward', style='Pick Layout', run_style='Pick Name')
+    builder.run(paragraph, ' QB')
+    doc = Document(builder.save(str(tmp_path / 'styles.docx')))
+
+    [paragraph] = doc.paragraphs
+    style = paragraph.style
+    assert style.name == 'Pick Layout' and style.base_style.name == 'Normal'
+    assert (style.paragraph_format.space_before, style.paragraph_format.space_after) == (Pt(2), Pt(6))
+    assert style.paragraph_format.alignment == WD_ALIGN_PARAGRAPH.CENTER
+    assert style.font.size == Pt(9) and style.font.italic
+    assert paragraph.runs[0].style.name == 'Pick Name' and paragraph.runs[0].style.font.bold
+    assert paragraph.runs[1].style.name == 'Default Paragraph Font'
+
+
+def test_style_types_of_template_styles_are_checked():
+    builder = DocumentBuilder()
+    with pytest.raises(ValueError):
+        builder.paragraph('x', style='Default Paragraph Font')
+    assert builder.paragraph('x', style='Heading 2').style.name == 'Heading 2'
+
+
+def test_distinct_pictures_get_their_own_parts_and_shape_ids(tmp_path):
+    builder = DocumentBuilder()
+    images = [png((number, 0, 0)) for number in range(5)]
+    for data in images:
+        builder.picture(io.BytesIO(data), width=Inches(1))
+    doc = Document(builder.save(str(tmp_path / 'pictures.docx')))
+
+    embedded = pictures(doc)
+    assert [blob for _, blob in embedded] == images
+    assert len({partname for partname, _ in embedded}) == 5
+    ids = [doc_pr.get('id') for doc_pr in doc.element.body.iter(qn('wp:docPr'))]
+    assert len(set(ids)) == 5
+
+
+def test_pictures_added_to_a_loaded_document_never_reuse_its_parts(tmp_path):
+    first = DocumentBuilder()
+    first.picture(io.BytesIO(png('red')))
+    first.picture(io.BytesIO(png('green')))
+    path = first.save(str(tmp_path / 'first.docx'))
+
+    builder = DocumentBuilder(Document(path))
+    builder.picture(io.BytesIO(png('blue')))
+    doc = Document(builder.save(str(tmp_path / 'second.docx')))
+    embedded = pictures(doc)
+    assert [blob for _, blob in embedded] == [png('red'), png('green'), png('blue')]
+    assert len({partname for partname, _ in embedded}) == 3
+
+
+def test_identical_images_are_embedded_once(tmp_path):
+    builder = DocumentBuilder()
+    red, blue = png('red'), png('blue')
+    for data in (red, blue, red, red):
+        builder.picture(io.BytesIO(data))
+    doc = Document(builder.save(str(tmp_path / 'dedup.docx')))
+
+    embedded = pictures(doc)
+    assert [blob for _, blob in embedded] == [red, blue, red, red]
+    assert len({partname for partname, _ in embedded}) == 2
+    assert builder.media_stats['pictures'] == 4
+    assert builder.media_stats['deduplicated_bytes'] == 2 * len(red)
+    assert builder.media_stats['embedded_bytes'] == len(red) + len(blue)
+
+
+def test_recompression_is_opt_in_and_never_grows_an_image():
+    data = screenshot_png()
+    assert recompress_image(data, None) is data
+    palette = recompress_image(data, 'palette')
+    assert len(palette) < len(data)
+    with Image.open(io.BytesIO(palette)) as img:
+        assert img.mode == 'P' and img.size == (400, 300)
+    assert recompress_image(palette, 'palette') is palette
+    tiny = png('red', size=(2, 2))
+    assert recompress_image(tiny, 'jpeg') is tiny
+    with pytest.raises(ValueError):
+        DocumentBuilder(recompress='webp')
+
+
+def test_recompressed_bytes_are_what_gets_embedded(tmp_path):
+    builder = DocumentBuilder(recompress='palette')
+    builder.picture(io.BytesIO(screenshot_png()))
+    doc = Document(builder.save(str(tmp_path / 'palette.docx')))
+    [(_, blob)] = pictures(doc)
+    assert blob == recompress_image(screenshot_png(), 'palette')
+    assert builder.media_stats['recompressed_bytes'] == len(screenshot_png()) - len(blob)
@@ -0,0 +1,26 @@
+"""Tests for nfl_docx_parallel: sections rendered in worker processes merge into the in-memory document"""
+
+from docx import Document
+import pytest
+from nfl_docx_builder import DocumentBuilder
+from nfl_docx_parallel import build_sections
+from nfl_docx_stream import StreamingDocumentBuilder
+from test_docx_stream import SECTIONS, add_section, build_in_memory, define_styles, document_summary
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_parallel_sections_merge_in_order(tmp_path, streaming):
+    expected = document_summary(build_in_memory(tmp_path / 'memory.docx'))
+
+    path = str(tmp_path / 'merged.docx')
+    builder = StreamingDocumentBuilder(path) if streaming else DocumentBuilder()
+    # The parent never defines 'Pick Note': it comes over with the first merged section
+    added = build_sections(builder, add_section, SECTIONS, workers=2, define_styles=define_styles)
+    builder.save() if streaming else builder.save(path)
+
+    texts, blobs, ids = document_summary(path)
+    assert added == len(SECTIONS)
+    assert texts == expected[0]
+    assert blobs == expected[1]
+    assert len(set(ids)) == len(ids)
+    assert Document(path).paragraphs[1].style.name == 'Pick Note'
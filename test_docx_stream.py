@@ -0,0 +1,82 @@
+"""Tests for nfl_docx_stream: a streamed document matches the in-memory build"""
+
+import io
+import zipfile
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+from docx.shared import Inches
+from PIL import Image
+from nfl_docx_builder import DocumentBuilder
+from nfl_docx_stream import StreamingDocumentBuilder
+
+
+def png(color, size=(40, 30)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+IMAGES = [png((200, 0, 0)), png((0, 200, 0)), png((0, 0, 200), size=(60, 20))]
+
+
+def define_styles(builder):
+    builder.define_paragraph_style('Pick Note', space_after=2)
+
+
+def add_section(builder, author, image_indexes):
+    """One author's section; module level so test_docx_parallel workers can unpickle it"""
+    builder.heading(author, level=1)
+    for number, index in enumerate(image_indexes, 1):
+        builder.text(f'{author} pick {number}', style='Pick Note')
+        builder.picture(io.BytesIO(IMAGES[index]), width=Inches(2))
+    builder.page_break()
+
+
+SECTIONS = [('Author A', [0, 1]), ('Author B', [1, 2, 0]), ('Author C', [2])]
+
+
+def document_summary(path):
+    """(paragraph texts, embedded image bytes in document order, drawing ids)"""
+    doc = Document(path)
+    blobs = [doc.part.related_parts[shape._inline.graphic.graphicData.pic.blipFill.blip.embed].blob
+             for shape in doc.inline_shapes]
+    ids = [doc_pr.get('id') for doc_pr in doc.element.body.iter(qn('wp:docPr'))]
+    return [paragraph.text for paragraph in doc.paragraphs], blobs, ids
+
+
+def build_in_memory(path):
+    builder = DocumentBuilder()
+    define_styles(builder)
+    for section in SECTIONS:
+        add_section(builder, *section)
+    return builder.save(str(path))
+
+
+def test_streamed_document_matches_in_memory_build(tmp_path):
+    expected = document_summary(build_in_memory(tmp_path / 'memory.docx'))
+
+    builder = StreamingDocumentBuilder(str(tmp_path / 'stream.docx'))
+    define_styles(builder)
+    for section in SECTIONS:
+        add_section(builder, *section)
+        assert builder.flush() > 0
+        assert len(builder.body) == 1  # only the sectPr stays in memory
+    path = builder.save()
+
+    texts, blobs, ids = document_summary(path)
+    assert texts == expected[0]
+    assert blobs == expected[1] == [IMAGES[index] for _, indexes in SECTIONS for index in indexes]
+    assert len(set(ids)) == len(ids)
+    with zipfile.ZipFile(path) as package:
+        assert package.testzip() is None
+        media = [name for name in package.namelist() if name.startswith('word/media/')]
+    assert len(media) == len(IMAGES)  # repeated images are stored once
+    assert builder.media_stats['flushes'] == len(SECTIONS)
+
+
+def test_streaming_builder_writes_only_to_its_own_path(tmp_path):
+    builder = StreamingDocumentBuilder(str(tmp_path / 'stream.docx'))
+    with pytest.raises(ValueError):
+        builder.save(str(tmp_path / 'other.docx'))
+    builder.close()
@@ -0,0 +1,41 @@
+"""Tests for nfl_draft_pipeline: rankings fed from the capture pass, with per-author fallback"""
+
+from types import SimpleNamespace
+import pytest
+import requests
+import nfl_player_ranking_analyzer_enhanced
+from nfl_draft_pipeline import rank_from_capture
+from nfl_player_ranking_analyzer_enhanced import NFLPlayerRankingAnalyzerEnhanced
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(nfl_player_ranking_analyzer_enhanced, 'create_cached_session', requests.Session)
+    analyzer = NFLPlayerRankingAnalyzerEnhanced()
+    analyzer.fallbacks = []
+
+    def extract_players_from_author(url, author):
+        analyzer.fallbacks.append(author)
+        return analyzer.record_picks(author, [{'pick': 3, 'player': 'Abdul Carter'}])
+
+    monkeypatch.setattr(analyzer, 'extract_players_from_author', extract_players_from_author)
+    return analyzer
+
+
+def test_captured_selections_are_ranked_without_refetching(analyzer):
+    creator = SimpleNamespace(
+        author_urls={'A': 'https://a', 'B': 'https://b', 'C': 'https://c'},
+        pick_players={
+            'A': [{'pick': 1, 'player': 'Cam Ward', 'team': 'Tennessee Titans'},
+                  {'pick': 2, 'player': 'Tet McMillan'}],
+            'B': [{'pick': 4, 'player': 'Tetairoa McMillan'}],
+            'C': [],
+        })
+    analyzer.author_urls = creator.author_urls
+    rank_from_capture(creator, analyzer)
+
+    assert analyzer.fallbacks == ['C']  # only the author whose page yielded no picks
+    assert [(player['author'], player['pick']) for player in analyzer.all_players] == [
+        ('A', 1), ('A', 2), ('B', 4), ('C', 3)]
+    assert analyzer.player_selections['Tetairoa McMillan'] == {'A': 2, 'B': 4}
+    assert analyzer.all_players[0]['team'] == 'Tennessee Titans'
@@ -0,0 +1,126 @@
+"""Tests for nfl_draft_store: upserts, merge mode, queries and the player key migration"""
+
+import sqlite3
+import pytest
+from nfl_draft_store import SCHEMA, DraftStore, drafts_from_selections
+
+URL = 'https://www.nfl.com/news/test-2025-nfl-mock-draft'
+
+
+def full_draft(players=None, analysis=True):
+    players = players or [f'Player {number}' for number in range(1, 33)]
+    return {
+        'title': '2025 NFL Mock Draft 1.0', 'author': 'Test Author', 'date': '2025-04-01', 'url': URL,
+        'picks': [{'pick': number, 'team': f'Team {number}', 'player': player, 'school': 'State',
+                   'analysis': f'Analysis {number}' if analysis else ''}
+                  for number, player in enumerate(players, 1)],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DraftStore(str(tmp_path / 'drafts.sqlite3'))
+    yield store
+    store.close()
+
+
+def analysis_count(store):
+    return store.conn.execute('SELECT COUNT(*) FROM analysis').fetchone()[0]
+
+
+def test_round_trip_and_queries(store):
+    assert store.upsert_mock_drafts([full_draft()]) == 32
+    [draft] = store.mock_drafts()
+    assert (draft['author'], draft['url'], draft['date']) == ('Test Author', URL, '2025-04-01')
+    assert [pick['pick'] for pick in draft['picks']] == list(range(1, 33))
+    assert draft['picks'][4]['analysis'] == 'Analysis 5'
+    assert store.conn.execute('SELECT draft_year FROM articles').fetchone()[0] == 2025
+
+    assert [row['team'] for row in store.picks_for_player('player 7')] == ['Team 7']
+    assert [row['player'] for row in store.picks_for_team('Team 3')] == ['Player 3']
+    assert [row['player'] for row in store.picks_at(32)] == ['Player 32']
+    assert store.descriptions(URL)[1] == 'Analysis 1'
+    assert store.selection_counts()[0] == ('Player 1', 1)
+    assert store.player_selections()['Player 2'] == {'Test Author': 2}
+    assert store.pick_rows(authors=['Someone Else']) == []
+
+
+def test_replacing_drops_picks_and_their_analysis(store):
+    store.upsert_mock_drafts([full_draft()])
+    shorter = full_draft()
+    shorter['picks'] = shorter['picks'][:10]
+    shorter['picks'][0] = dict(shorter['picks'][0], player='Someone New', analysis='')
+
+    assert store.upsert_mock_drafts([shorter]) == 10
+    rows = store.pick_rows()
+    assert len(rows) == 10
+    assert rows[0]['player'] == 'Someone New' and rows[0]['analysis'] is None
+    assert rows[1]['analysis'] == 'Analysis 2'
+    assert analysis_count(store) == 9  # no orphans for picks 11-32 or the replaced pick 1
+
+
+def test_merge_keeps_picks_missing_from_a_partial_source(store):
+    store.upsert_mock_drafts([full_draft()])
+    selections = [{'name': f'Player {number}', 'pick': number, 'author': 'Test Author'} for number in range(1, 21)]
+    selections[4] = dict(selections[4], name='Late Riser')
+
+    assert store.upsert_mock_drafts(drafts_from_selections(selections, {'Test Author': URL}), merge=True) == 20
+    rows = store.pick_rows()
+    assert len(rows) == 32
+    assert rows[31]['player'] == 'Player 32' and rows[31]['analysis'] == 'Analysis 32'
+    # A names-only source keeps the stored team; the changed pick loses the old player's write-up
+    assert (rows[4]['player'], rows[4]['team'], rows[4]['analysis']) == ('Late Riser', 'Team 5', None)
+    assert rows[5]['analysis'] == 'Analysis 6'
+
+
+def test_player_details_fill_gaps_but_never_blank(store):
+    store.upsert_mock_drafts([full_draft()])
+    other = dict(full_draft(), url=URL + '-2', author='Other Author')
+    other['picks'] = [{'pick': 1, 'player': 'Player 1', 'school': '', 'position': 'QB'}]
+    store.upsert_mock_drafts([other])
+    row = store.conn.execute("SELECT school, position FROM players WHERE name = 'Player 1'").fetchone()
+    assert tuple(row) == ('State', 'QB')
+    assert store.selection_counts()[0] == ('Player 1', 2)
+
+
+@pytest.mark.parametrize('first, second', [('Kyle Williams', 'Kyle Williamson'), ('Jack Bech', 'Jack Beck')])
+def test_look_alike_prospects_are_stored_separately(store, first, second):
+    names = [f'Player {number}' for number in range(1, 33)]
+    names[0], names[1] = first, second
+    store.upsert_mock_drafts([full_draft(names)])
+    assert [row['player'] for row in store.pick_rows()[:2]] == [first, second]
+
+
+def test_open_never_changes_rows_and_migration_keeps_merged_players(tmp_path):
+    path = str(tmp_path / 'old.sqlite3')
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA.replace(',\n    merged_into INTEGER REFERENCES players(id)', ''))
+    conn.execute("INSERT INTO authors(name) VALUES ('Test Author')")
+    conn.execute("INSERT INTO articles(url, author_id, updated_at) VALUES (?, 1, 'now')", (URL,))
+    conn.executemany('INSERT INTO players(key, name, school) VALUES (?, ?, ?)', [
+        ('player:kelvin banks jr', 'Kelvin Banks Jr.', None),
+        ('player:legacy', 'Kelvin Banks', 'Texas'),
+        ('player:kyle williams', 'Kyle Williams', None),
+        ('player:kyle williamson', 'Kyle Williamson', None),
+    ])
+    conn.executemany('INSERT INTO picks VALUES (1, ?, NULL, ?)', [(1, 1), (2, 2), (3, 3), (4, 4)])
+    conn.commit()
+    conn.close()
+
+    store = DraftStore(path)
+    players = [tuple(row) for row in store.conn.execute('SELECT id, key, merged_into FROM players')]
+    assert len(players) == 4 and all(merged is None for _, _, merged in players)
+
+    assert store.migrate_player_keys(dry_run=True) == (1, 1)
+    assert store.migrate_player_keys() == (1, 1)
+    assert store.migrate_player_keys() == (0, 0)
+
+    rows = {row['id']: dict(row) for row in store.conn.execute('SELECT * FROM players')}
+    assert len(rows) == 4
+    assert rows[1]['key'] == 'player:kelvin banks' and rows[1]['school'] == 'Texas'
+    assert rows[2]['merged_into'] == 1
+    assert rows[3]['merged_into'] is None and rows[4]['merged_into'] is None
+    assert [row['player'] for row in store.pick_rows()] == ['Kelvin Banks Jr.', 'Kelvin Banks Jr.',
+                                                              'Kyle Williams', 'Kyle Williamson']
+    assert [name for name, _, _ in store.candidate_merges()] == ['Kyle Williams']
+    store.close()
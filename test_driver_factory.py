@@ -0,0 +1,104 @@
+"""Tests for nfl_driver_factory: capture options, DevTools setup and profile defaults, without launching Chrome"""
+
+import argparse
+from fnmatch import fnmatch
+import pytest
+import nfl_driver_factory
+from nfl_driver_factory import (BLOCKED_URL_PATTERNS, KEEPALIVE_ENV, LIGHTWEIGHT_ARGUMENTS, PROFILE_ENV,
+                                add_profile_argument, apply_capture_profile, build_options, dismiss_overlays,
+                                get_driver)
+
+
+class RecordingDriver:
+    def __init__(self):
+        self.commands = []
+        self.scripts = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return 2
+
+
+def test_lightweight_options():
+    options = build_options(headless=True, window_size=(1200, 900))
+    assert '--headless=new' in options.arguments and '--window-size=1200,900' in options.arguments
+    assert set(LIGHTWEIGHT_ARGUMENTS) <= set(options.arguments)
+    assert options.page_load_strategy == 'eager'
+    assert options.experimental_options['prefs']['credentials_enable_service'] is False
+
+    plain = build_options(lightweight=False, extra_arguments=['--user-data-dir=/tmp/p'])
+    assert '--disable-extensions' not in plain.arguments and plain.page_load_strategy == 'normal'
+    assert plain.arguments[-1] == '--user-data-dir=/tmp/p'
+
+
+@pytest.mark.parametrize('url, blocked', [
+    ('https://securepubads.g.doubleclick.net/tag/js/gpt.js', True),
+    ('https://www.googletagmanager.com/gtm.js?id=1', True),
+    ('https://players.brightcove.net/player.js', True),
+    ('https://static.www.nfl.com/video/clip.mp4', True),
+    ('https://www.nfl.com/news/daniel-jeremiah-2025-nfl-mock-draft-4-0', False),
+    ('https://static.www.nfl.com/image/upload/headshot.png', False),
+])
+def test_blocked_patterns_spare_article_content(url, blocked):
+    assert any(fnmatch(url, pattern) for pattern in BLOCKED_URL_PATTERNS) is blocked
+
+
+def test_capture_profile_blocks_urls_and_sets_consent_before_page_scripts():
+    driver = RecordingDriver()
+    apply_capture_profile(driver)
+    commands = [command for command, _ in driver.commands]
+    assert commands[:2] == ['Network.enable', 'Network.setBlockedURLs']
+    assert commands.count('Network.setCookie') == 2
+    assert commands[-1] == 'Page.addScriptToEvaluateOnNewDocument'
+    assert all(params['domain'] == '.nfl.com' for command, params in driver.commands
+               if command == 'Network.setCookie')
+
+    driver = RecordingDriver()
+    apply_capture_profile(driver, block=False, consent=False)
+    assert driver.commands == []
+
+
+def test_overlays_are_dismissed_in_one_script_call():
+    driver = RecordingDriver()
+    assert dismiss_overlays(driver, ['.a', '.b'], ['.close']) == 2
+    assert driver.scripts == [('.a, .b', '.close')]
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    """Records create_driver calls instead of starting Chrome; no browser is ever running"""
+    calls = []
+    monkeypatch.setattr(nfl_driver_factory, 'browser_running', lambda port: None)
+    monkeypatch.setattr(nfl_driver_factory, 'create_driver',
+                        lambda headless, window_size, user_agent, lightweight, profile, keep_alive, port,
+                        extra_arguments: calls.append((profile, keep_alive)))
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    monkeypatch.delenv(KEEPALIVE_ENV, raising=False)
+    return calls
+
+
+def test_profile_comes_from_the_environment_unless_given(launches, monkeypatch):
+    get_driver()
+    monkeypatch.setenv(PROFILE_ENV, 'warm')
+    monkeypatch.setenv(KEEPALIVE_ENV, '1')
+    get_driver()
+    get_driver(profile='other')
+    get_driver(profile='')  # worker pools force throwaway profiles
+    assert launches == [(None, False), ('warm', True), ('other', True), ('', True)]
+
+
+def test_profile_argument_defaults_to_the_environment(monkeypatch):
+    monkeypatch.setenv(PROFILE_ENV, 'warm')
+    parser = argparse.ArgumentParser()
+    add_profile_argument(parser)
+    assert parser.parse_args([]).profile == 'warm'
+    assert parser.parse_args(['--profile', 'cold']).profile == 'cold'
+
+    monkeypatch.delenv(PROFILE_ENV)
+    parser = argparse.ArgumentParser()
+    add_profile_argument(parser)
+    assert parser.parse_args([]).profile is None
@@ -0,0 +1,81 @@
+"""Tests for nfl_fullpage_capture: crop math, strip stitching and the capture sequence on a fake driver"""
+
+import base64
+import io
+from types import SimpleNamespace
+from PIL import Image
+from nfl_fullpage_capture import PICK_RECTS_SCRIPT, capture_full_page, capture_pick_crops, crop_rects
+
+RECTS = [{'x': 10, 'y': 20, 'width': 100, 'height': 50}, {'x': 10, 'y': 300, 'width': 100, 'height': 80}]
+
+
+def striped_page(width, height):
+    """Page image whose pixel (x, y) encodes its own coordinates"""
+    page = Image.new('RGB', (width, height))
+    page.putdata([(x % 256, y % 256, y // 256) for y in range(height) for x in range(width)])
+    return page
+
+
+class FakeDriver:
+    """Serves a CSS-px page at device scale through the DevTools calls the capture makes"""
+
+    def __init__(self, css_width=200, css_height=450, scale=2):
+        self.page = striped_page(css_width * scale, css_height * scale)
+        self.size = (css_width, css_height)
+        self.scale = scale
+        self.commands = []
+        self.scripts = []
+        self.timeouts = SimpleNamespace(script=30)
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        if command == 'Page.getLayoutMetrics':
+            return {'cssContentSize': {'width': self.size[0], 'height': self.size[1]},
+                    'cssLayoutViewport': {'clientWidth': self.size[0]}}
+        if command == 'Page.captureScreenshot':
+            clip, s = params['clip'], self.scale
+            strip = self.page.crop((0, clip['y'] * s, clip['width'] * s, (clip['y'] + clip['height']) * s))
+            buffer = io.BytesIO()
+            strip.save(buffer, 'PNG')
+            return {'data': base64.b64encode(buffer.getvalue()).decode()}
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        return RECTS if script == PICK_RECTS_SCRIPT else None
+
+    def execute_async_script(self, script, *args):
+        return True
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+
+
+def test_crop_rects_scales_and_clips_to_the_page():
+    page = striped_page(400, 200)
+    rects = [{'x': 10, 'y': 20, 'width': 50.5, 'height': 30},
+             {'x': -5, 'y': 80, 'width': 300, 'height': 40},
+             {'x': 10, 'y': 500, 'width': 50, 'height': 50}]
+    crops = crop_rects(page, rects, scale=2, extra_height=5)
+    assert crops[0].size == (101, 70) and crops[0].getpixel((0, 0)) == (20, 40, 0)
+    assert crops[1].size == (400, 40)  # clipped to the page on the left, right and bottom
+    assert crops[2] is None  # entirely below the page
+
+
+def test_full_page_is_stitched_from_strips():
+    driver = FakeDriver()
+    page, scale = capture_full_page(driver, 200, 450, max_strip_height=200)
+    assert driver.commands.count('Page.captureScreenshot') == 3
+    assert scale == 2 and page.size == (400, 900)
+    assert page.tobytes() == driver.page.tobytes()
+
+
+def test_pick_crops_come_from_one_capture_with_borders_restored():
+    driver = FakeDriver()
+    crops = capture_pick_crops(driver, '.pick', max_picks=2, extra_height=10, border='2px solid red')
+    assert [crop.size for crop in crops] == [(200, 120), (200, 180)]
+    assert crops[1].getpixel((0, 0)) == (20, 600 % 256, 600 // 256)
+    assert driver.commands.count('Page.captureScreenshot') == 1
+    assert driver.commands[-1] == 'Emulation.clearDeviceMetricsOverride'
+    assert driver.scripts[0] == ('.pick', 2, '2px solid red') and driver.scripts[-1] == ('.pick', 2, '')
+    assert driver.timeouts.script == 30
@@ -0,0 +1,99 @@
+"""Tests for nfl_headshot_downloader: mirror racing, cancellation, invalid images and de-duplication"""
+
+import io
+import time
+import pytest
+import requests
+from PIL import Image
+import nfl_image_store
+from nfl_headshot_downloader import HeadshotDownloader
+from nfl_image_store import ImageStore
+
+
+def png(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (30, 30), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+        self.status, self.chunks, self.delay = session.mirrors[url]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise requests.HTTPError(str(self.status), response=self)
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            time.sleep(self.delay)
+            self.session.chunks_read[self.url] += 1
+            yield chunk
+
+
+class FakeSession:
+    """url -> (status, body chunks, delay before each chunk)"""
+
+    def __init__(self, mirrors):
+        self.mirrors = mirrors
+        self.calls = []
+        self.chunks_read = {url: 0 for url in mirrors}
+
+    def get(self, url, timeout=None, stream=False):
+        self.calls.append(url)
+        return FakeResponse(self, url)
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    store = ImageStore(str(tmp_path / 'store'))
+    monkeypatch.setattr(nfl_image_store, 'get_image_store', lambda: store)
+    return store
+
+
+def test_fastest_valid_mirror_wins_and_the_slow_one_is_cancelled():
+    slow, fast = 'https://slow.example/cam.png', 'https://fast.example/cam.png'
+    session = FakeSession({slow: (200, [b'x'] * 40, 0.02), fast: (200, [png('red')], 0)})
+    downloader = HeadshotDownloader(session, min_bytes=10)
+
+    path = downloader.download('Cam Ward', [slow, fast])
+    with open(path, 'rb') as f:
+        assert f.read() == png('red')
+    assert session.chunks_read[slow] < 40
+    report = downloader.latency_report()
+    assert report['fast.example']['won'] == 1
+    assert report['slow.example']['cancelled'] == 1
+
+
+def test_invalid_and_failed_mirrors_fall_through_to_a_valid_one():
+    page, missing, good = 'https://a.example/page', 'https://b.example/404', 'https://c.example/ok.png'
+    session = FakeSession({page: (200, [b'<html>' * 10], 0), missing: (404, [], 0),
+                           good: (200, [png('blue')], 0.05)})
+    downloader = HeadshotDownloader(session, min_bytes=10)
+    assert downloader.download('Travis Hunter', [page, missing, good])
+    report = downloader.latency_report()
+    assert report['a.example']['failed'] == report['b.example']['failed'] == 1
+
+
+def test_spellings_share_one_download_and_failures_are_not_retried():
+    url, dead = 'https://a.example/tet.png', 'https://a.example/dead.png'
+    session = FakeSession({url: (200, [png('green')], 0), dead: (500, [], 0)})
+    downloader = HeadshotDownloader(session, min_bytes=10)
+
+    results = downloader.download_all([('Tet McMillan', [url]), ('Tetairoa McMillan', [url]),
+                                       ('Abdul Carter', [dead])])
+    assert results['Tet McMillan'] == results['Tetairoa McMillan'] is not None
+    assert results['Abdul Carter'] is None
+    assert session.calls.count(url) == 1
+
+    assert downloader.download_all([('Abdul Carter', [dead])]) == {'Abdul Carter': None}
+    assert downloader.download('Tet McMillan', [url]) == results['Tet McMillan']  # now a store hit
+    assert session.calls == [url, dead] or session.calls == [dead, url]
@@ -0,0 +1,123 @@
+"""Tests for nfl_http_cache: fresh hits, ETag revalidation and LRU eviction against a local server"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from nfl_http_cache import HTTPCache, create_cached_session
+
+
+class ArticleHandler(BaseHTTPRequestHandler):
+    """Serves /<name> with an ETag that changes when the server's version does"""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('If-None-Match')))
+        etag = f'"v{server.version}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        body = f'{self.path} version {server.version} '.encode() * 50
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ArticleHandler)
+    httpd.requests = []
+    httpd.version = 1
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f'http://127.0.0.1:{httpd.server_port}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fresh_entry_is_served_without_a_request(server, tmp_path):
+    session = create_cached_session(cache_dir=str(tmp_path / 'fresh'))
+    first = session.get(f'{server.url}/a')
+    second = session.get(f'{server.url}/a')
+    assert not first.from_cache and second.from_cache
+    assert second.text == first.text
+    assert second.encoding == 'utf-8'
+    assert len(server.requests) == 1
+    assert session.cache.stats()['hits'] == 1
+
+
+def test_stale_entry_revalidates_with_etag(server, tmp_path):
+    session = create_cached_session(cache_dir=str(tmp_path / 'stale'), ttl=0)
+    body = session.get(f'{server.url}/a').content
+    revalidated = session.get(f'{server.url}/a')
+    assert revalidated.from_cache and revalidated.content == body
+    assert server.requests[-1] == ('/a', '"v1"')
+    assert session.cache.stats()['revalidations'] == 1
+
+    server.version = 2
+    changed = session.get(f'{server.url}/a')
+    assert not changed.from_cache
+    assert b'version 2' in changed.content
+    assert session.get(f'{server.url}/a').content == changed.content
+
+
+def test_no_cache_request_header_forces_revalidation(server, tmp_path):
+    session = create_cached_session(cache_dir=str(tmp_path / 'no-cache'))
+    session.get(f'{server.url}/a')
+    response = session.get(f'{server.url}/a', headers={'Cache-Control': 'no-cache'})
+    assert response.from_cache
+    assert len(server.requests) == 2
+
+
+def test_least_recently_used_entries_are_evicted(server, tmp_path):
+    cache_dir = str(tmp_path / 'lru')
+    session = create_cached_session(cache_dir=cache_dir)
+    for name in ('a', 'b'):
+        session.get(f'{server.url}/{name}')
+        time.sleep(0.01)
+    session.get(f'{server.url}/a')  # a is now more recently used than b
+    entry_size = session.cache.lookup(f'{server.url}/a')['size']
+    session.cache.max_bytes = 2 * entry_size
+
+    session.get(f'{server.url}/c')
+    assert session.cache.lookup(f'{server.url}/b') is None
+    assert session.cache.lookup(f'{server.url}/a') is not None
+    assert session.cache.stats()['evictions'] == 1
+
+    # The index on disk survives a restart
+    reopened = HTTPCache(cache_dir)
+    assert reopened.lookup(f'{server.url}/c') is not None
+    assert reopened.lookup(f'{server.url}/b') is None
+
+
+def test_cached_response_can_be_iterated_straight_from_the_adapter(server, tmp_path):
+    session = create_cached_session(cache_dir=str(tmp_path / 'iterate'))
+    body = session.get(f'{server.url}/a').content
+    # Session.send reads .content itself; a direct adapter caller gets the response untouched
+    request = session.prepare_request(requests.Request('GET', f'{server.url}/a'))
+    cached = session.get_adapter(request.url).send(request)
+    assert cached.from_cache
+    assert b''.join(cached.iter_content(64)) == body
+
+
+def test_hit_access_times_reach_the_index_on_flush(server, tmp_path):
+    cache_dir = str(tmp_path / 'access')
+    session = create_cached_session(cache_dir=cache_dir)
+    session.get(f'{server.url}/a')
+    stored = HTTPCache(cache_dir).lookup(f'{server.url}/a')['last_access']
+    time.sleep(0.01)
+    session.get(f'{server.url}/a')
+    assert HTTPCache(cache_dir).lookup(f'{server.url}/a')['last_access'] == stored
+
+    session.cache.flush()
+    assert HTTPCache(cache_dir).lookup(f'{server.url}/a')['last_access'] > stored
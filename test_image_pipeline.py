@@ -0,0 +1,59 @@
+"""Tests for nfl_image_pipeline: downscaling, re-encoding and following renamed screenshots"""
+
+import os
+import pytest
+from PIL import Image
+from nfl_image_pipeline import optimize_screenshot, optimize_screenshots, target_width
+from nfl_screenshot_complete import count_screenshot_files, optimize_author_screenshots
+
+
+def screenshot(tmp_path, name, size=(1800, 600)):
+    path = str(tmp_path / name)
+    img = Image.new('RGB', size, (250, 250, 250))
+    for x in range(0, size[0], 9):
+        img.putpixel((x, size[1] // 2), (200, 30, 30))
+    img.save(path, 'PNG')
+    return path
+
+
+def test_palette_downscales_to_document_width_in_place(tmp_path):
+    path = screenshot(tmp_path, 'A_pick_1.png')
+    new_path, before, after = optimize_screenshot(path, 'palette')
+    assert new_path == path and after < before
+    with Image.open(path) as img:
+        assert img.mode == 'P'
+        assert img.size == (target_width(), 325)
+
+    # Already optimized: left untouched
+    assert optimize_screenshot(path, 'palette') == (path, after, after)
+
+
+def test_jpeg_replaces_the_png(tmp_path):
+    path = screenshot(tmp_path, 'A_pick_2.png', size=(400, 100))
+    new_path, _, _ = optimize_screenshot(path, 'jpeg')
+    assert new_path == str(tmp_path / 'A_pick_2.jpg')
+    assert not os.path.exists(path)
+    with Image.open(new_path) as img:
+        assert img.format == 'JPEG' and img.size == (400, 100)
+
+
+def test_unknown_encodings_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        optimize_screenshot(screenshot(tmp_path, 'A.png'), 'webp')
+
+
+def test_callers_follow_renamed_files(tmp_path):
+    header, pick = screenshot(tmp_path, 'A_header.png'), screenshot(tmp_path, 'A_pick_1.png')
+    captured = {'A': [header, pick], 'B': ['Could not capture content for B']}
+
+    optimized = optimize_author_screenshots(captured, 'jpeg')
+    assert optimized == {'A': [header[:-4] + '.jpg', pick[:-4] + '.jpg'],
+                         'B': ['Could not capture content for B']}
+    assert count_screenshot_files(optimized['A']) == 2
+    assert count_screenshot_files(optimized['B']) == 0
+
+
+def test_batch_skips_missing_paths_and_duplicates(tmp_path):
+    path = screenshot(tmp_path, 'A_pick_1.png')
+    assert optimize_screenshots([path, path, str(tmp_path / 'missing.png'), None], workers=1) == {path: path}
+    assert optimize_screenshots([]) == {}
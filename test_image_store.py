@@ -0,0 +1,67 @@
+"""Tests for nfl_image_store: blob dedup, the identity/source index and headshot lookup"""
+
+import io
+import os
+import pytest
+from PIL import Image, UnidentifiedImageError
+import nfl_image_store
+from nfl_image_store import (HEADSHOT, PLACEHOLDER, ImageStore, find_headshot, placeholder_identity,
+                             player_identity, store_downloaded_headshot)
+
+URL = 'https://static.www.nfl.com/image/upload/cam-ward.png'
+
+
+def png(color, size=(20, 10)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ImageStore(str(tmp_path / 'store'))
+
+
+def test_identical_bytes_share_one_blob(store):
+    first = store.put_bytes(png('red'), player_identity('Cam Ward'), HEADSHOT, URL)
+    second = store.put_bytes(png('red'), placeholder_identity('Cam Ward', 1, 'card'), PLACEHOLDER, 'rendered')
+    assert first == second
+    assert len(store.index['blobs']) == 1
+    assert store.put_bytes(png('blue'), 'other', PLACEHOLDER, None) != first
+
+
+def test_index_records_provenance_and_survives_reopening(store):
+    path = store.put_bytes(png('red', size=(30, 12)), player_identity('Cam Ward'), HEADSHOT, URL)
+    reopened = ImageStore(store.root)
+    assert reopened.get(player_identity('cam ward')) == path
+    assert reopened.get(player_identity('Cam Ward'), kind=PLACEHOLDER) is None
+    assert reopened.get_source(URL) == path
+    entry = reopened.describe(player_identity('Cam Ward'))
+    assert (entry['kind'], entry['source'], entry['width'], entry['height']) == (HEADSHOT, URL, 30, 12)
+
+
+def test_rendered_sources_and_missing_blobs(store):
+    path = store.put_image(Image.new('RGB', (5, 5)), 'placeholder', PLACEHOLDER, 'rendered')
+    assert store.index['sources'] == {}  # only URLs are indexed as sources
+    os.remove(path)
+    assert store.get('placeholder') is None
+    assert store.put_image(Image.new('RGB', (5, 5)), 'placeholder', PLACEHOLDER, 'rendered') == path
+    assert os.path.exists(path)
+
+
+def test_non_images_are_rejected(store):
+    with pytest.raises(UnidentifiedImageError):
+        store.put_bytes(b'<html>not found</html>', 'page', HEADSHOT, URL)
+    assert store.index['identities'] == {}
+
+
+def test_headshot_found_by_identity_or_by_candidate_url(tmp_path, monkeypatch):
+    shared = ImageStore(str(tmp_path / 'shared'))
+    monkeypatch.setattr(nfl_image_store, 'get_image_store', lambda: shared)
+    assert store_downloaded_headshot('Tet McMillan', URL, b'not an image') is None
+    path = store_downloaded_headshot('Tet McMillan', URL, png('green'))
+    assert find_headshot('Tet McMillan') == path
+
+    assert find_headshot('Travis Hunter') is None
+    assert find_headshot('Travis Hunter', urls=['https://elsewhere/x.png', URL]) == path
+    assert find_headshot('Travis Hunter') == path
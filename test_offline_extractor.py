@@ -0,0 +1,61 @@
+"""Tests for nfl_offline_extractor against the archived Bucky Brooks article in ref/"""
+
+import glob
+import io
+import os
+import pathlib
+import pytest
+from nfl_offline_extractor import extract_article, extract_picks, parse_html
+
+REF_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ref')
+ARTICLE = next(iter(glob.glob(os.path.join(REF_DIR, '*.html'))), None)
+
+needs_article = pytest.mark.skipif(ARTICLE is None, reason="archived article not in ref/")
+
+
+@needs_article
+def test_extracts_all_32_picks_in_order():
+    article = extract_article(pathlib.Path(ARTICLE))
+    picks = article['picks']
+    assert article['author'] == 'Bucky Brooks'
+    assert article['date'] == '2025-04-22'
+    assert [pick['pick'] for pick in picks] == list(range(1, 33))
+    assert picks[0]['team'] == 'Tennessee Titans'
+    assert picks[0]['player'] == 'Cam Ward'
+    assert (picks[0]['school'], picks[0]['position'], picks[0]['class']) == ('Miami', 'QB', 'Senior')
+    assert picks[1]['position'] == 'WR/CB'
+    assert picks[31]['player'] == 'Donovan Ezeiruaku'
+    assert all(pick['analysis'] for pick in picks)
+    assert all('/t_lazy' not in pick['headshot_url'] for pick in picks)
+
+
+@needs_article
+def test_path_str_bytes_and_stream_parse_alike():
+    with open(ARTICLE, 'rb') as f:
+        data = f.read()
+    expected = extract_picks(pathlib.Path(ARTICLE))
+    assert extract_picks(data) == expected
+    assert extract_picks(data.decode('utf-8')) == expected
+    assert extract_picks(io.BytesIO(data)) == expected
+    assert extract_picks(data, max_picks=20) == expected[:20]
+
+
+@needs_article
+def test_bom_prefixed_markup():
+    text = '﻿' + pathlib.Path(ARTICLE).read_text(encoding='utf-8')
+    assert len(extract_picks(text)) == 32
+    assert len(extract_picks(text.encode('utf-8'))) == 32
+
+
+@pytest.mark.parametrize('body', ['Service temporarily unavailable', '', '   ', 'missing.html'])
+def test_non_html_text_is_markup_not_a_path(body):
+    article = extract_article(body, url='https://www.nfl.com/news/x')
+    assert article['picks'] == []
+    assert article['title'] == 'NFL Mock Draft'
+
+
+def test_pathlike_is_read_from_disk(tmp_path):
+    page = tmp_path / 'page.html'
+    page.write_text('<html><body><h1>Saved page</h1></body></html>', encoding='utf-8')
+    assert extract_article(page)['title'] == 'Saved page'
+    assert parse_html(page).xpath('//h1')[0].text == 'Saved page'
@@ -0,0 +1,69 @@
+"""Tests for nfl_page_readiness: condition-driven waits against a fake driver"""
+
+from types import SimpleNamespace
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from nfl_page_readiness import (NEXT_PAINT_SCRIPT, wait_for_dom_ready, wait_for_page_ready, wait_for_paint,
+                                wait_for_scroll_settled)
+
+
+class FakeDriver:
+    """document.readyState turns 'complete' after a few polls; only `present` selectors match"""
+
+    def __init__(self, polls_until_ready=2, present=(), async_result=True):
+        self.polls_until_ready = polls_until_ready
+        self.present = set(present)
+        self.async_result = async_result
+        self.async_scripts = []
+        self.timeouts = SimpleNamespace(script=7)
+        self.script_timeouts = []
+
+    def execute_script(self, script, *args):
+        self.polls_until_ready -= 1
+        return 'complete' if self.polls_until_ready <= 0 else 'loading'
+
+    def find_element(self, by, selector):
+        if not self.present.intersection(part.strip() for part in selector.split(',')):
+            raise NoSuchElementException(selector)
+        return object()
+
+    def find_elements(self, by, selector):
+        return [object()] if selector in self.present else []
+
+    def execute_async_script(self, script, *args):
+        self.async_scripts.append(script)
+        if isinstance(self.async_result, Exception):
+            raise self.async_result
+        return self.async_result
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+
+def test_dom_ready_polls_until_complete_or_times_out():
+    assert wait_for_dom_ready(FakeDriver(polls_until_ready=3), timeout=2)
+    assert not wait_for_dom_ready(FakeDriver(polls_until_ready=10 ** 6), timeout=0.2)
+
+
+def test_page_ready_returns_the_first_selector_that_matched():
+    driver = FakeDriver(present={'.nfl-o-ranked-item'})
+    assert wait_for_page_ready(driver, ['.missing', '.nfl-o-ranked-item']) == '.nfl-o-ranked-item'
+    assert len(driver.async_scripts) == 1  # then waited for images to decode
+
+    timeouts = {'element_present': 0.2}
+    assert wait_for_page_ready(FakeDriver(), ['.missing'], timeouts) is None
+
+
+def test_async_waits_restore_the_session_script_timeout():
+    driver = FakeDriver()
+    assert wait_for_paint(driver)
+    assert driver.async_scripts == [NEXT_PAINT_SCRIPT]
+    assert driver.script_timeouts == [2, 7] and driver.timeouts.script == 7
+
+
+def test_async_waits_report_timeouts_instead_of_raising():
+    assert not wait_for_scroll_settled(FakeDriver(async_result=TimeoutException('slow')))
+    driver = FakeDriver(async_result=WebDriverException('gone'))
+    assert not wait_for_paint(driver, timeout=3)
+    assert driver.script_timeouts == [4, 7]
+    assert not wait_for_paint(FakeDriver(async_result=False))
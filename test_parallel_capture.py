@@ -0,0 +1,67 @@
+"""Tests for the pooled multi-author capture in nfl_screenshot_complete, with fake browsers"""
+
+import threading
+import time
+import pytest
+import nfl_screenshot_complete
+from nfl_screenshot_complete import NFLScreenshotComplete, WebDriverPool, capture_all_authors
+
+
+class FakeBrowser:
+    def __init__(self, profile):
+        self.profile = profile
+        self.busy = threading.Lock()
+
+
+@pytest.fixture
+def browsers(monkeypatch):
+    """Fake get_driver/release_driver; screenshot_webpage_content checks one author per browser at a time"""
+    launched, released = [], []
+
+    def get_driver(headless=False, profile=None, attach=True):
+        assert headless and not attach
+        launched.append(FakeBrowser(profile))
+        return launched[-1]
+
+    def capture(self, url, author):
+        assert self.driver.busy.acquire(blocking=False), "browser shared by two authors"
+        try:
+            time.sleep(0.05 if author == 'Bucky Brooks' else 0.01)
+            if author == 'Dan Parr':
+                raise RuntimeError('tab crashed')
+            self.pick_descriptions[author] = {1: f'{author} pick 1'}
+            self.pick_players[author] = [{'pick': 1, 'player': 'Cam Ward'}]
+            return [f'{author}_pick_1.png']
+        finally:
+            self.driver.busy.release()
+
+    monkeypatch.setattr(nfl_screenshot_complete, 'get_driver', get_driver)
+    monkeypatch.setattr(nfl_screenshot_complete, 'release_driver', released.append)
+    monkeypatch.setattr(NFLScreenshotComplete, 'screenshot_webpage_content', capture)
+    return launched, released
+
+
+def test_results_merge_in_author_order_and_failures_get_a_note(browsers):
+    launched, released = browsers
+    creator = NFLScreenshotComplete(setup_driver=False, profile='', collect_players=True)
+    captured = capture_all_authors(creator, workers=3)
+
+    assert list(captured) == list(creator.author_urls)
+    assert captured['Dan Parr'] == ['Could not capture content for Dan Parr']
+    assert captured['Bucky Brooks'] == ['Bucky Brooks_pick_1.png']
+    assert creator.pick_descriptions['Marc Ross'] == {1: 'Marc Ross pick 1'}
+    assert 'Dan Parr' not in creator.pick_descriptions and 'Dan Parr' not in creator.pick_players
+    assert len(launched) == 3 and released == launched
+
+
+def test_only_requested_authors_are_captured(browsers):
+    creator = NFLScreenshotComplete(setup_driver=False, profile='')
+    captured = capture_all_authors(creator, workers=2, authors=['Marc Ross', 'Dan Parr', 'Eric Edholm'])
+    assert list(captured) == ['Eric Edholm', 'Dan Parr', 'Marc Ross']
+
+
+def test_named_profiles_are_split_per_worker(browsers):
+    launched, _ = browsers
+    WebDriverPool(2, profile='warm').close()
+    WebDriverPool(2, profile='').close()
+    assert [browser.profile for browser in launched] == ['warm-pool-0', 'warm-pool-1', '', '']
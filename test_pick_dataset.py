@@ -0,0 +1,63 @@
+"""Tests for nfl_pick_dataset: typed Parquet export, partition pruning and per-author refresh"""
+
+import os
+import pytest
+from nfl_draft_store import get_draft_store, save_mock_drafts
+from nfl_pick_dataset import export_mock_drafts, export_pick_dataset, load_pick_dataset
+
+
+def draft(author, year, players):
+    return {
+        'title': f'{year} NFL Mock Draft', 'author': author, 'date': f'{year}-04-01',
+        'url': f'https://www.nfl.com/news/{author.lower().replace(" ", "-")}-{year}-nfl-mock-draft',
+        'picks': [{'pick': number, 'team': f'Team {number}', 'player': player, 'school': 'State',
+                   'position': 'QB', 'analysis': f'{player} analysis'}
+                  for number, player in enumerate(players, 1)],
+    }
+
+
+@pytest.fixture
+def paths(tmp_path):
+    db_path, root = str(tmp_path / 'drafts.sqlite3'), str(tmp_path / 'dataset')
+    get_draft_store(db_path).upsert_mock_drafts([
+        draft('Author A', 2025, ['Cam Ward', 'Travis Hunter']),
+        draft('Author/B', 2025, ['Abdul Carter']),
+        draft('Author A', 2024, ['Caleb Williams']),
+    ])
+    yield db_path, root
+    get_draft_store(db_path).close()
+
+
+def test_round_trip_keeps_types_and_partitions(paths):
+    db_path, root = paths
+    assert export_pick_dataset(root, db_path=db_path) == 4
+    frame = load_pick_dataset(root)
+    assert len(frame) == 4
+    assert str(frame['author'].dtype) == 'category' and str(frame['team'].dtype) == 'category'
+    assert frame['pick'].dtype == 'uint16' and str(frame['draft_year'].dtype) in ('int16', 'Int16')
+    assert sorted(os.listdir(root)) == ['draft_year=2024', 'draft_year=2025']
+    assert 'author=Author%2FB' in os.listdir(os.path.join(root, 'draft_year=2025'))
+
+
+def test_filters_prune_by_author_and_year(paths):
+    db_path, root = paths
+    export_pick_dataset(root, db_path=db_path)
+    frame = load_pick_dataset(root, authors=['Author A'], years=['2025'], columns=['player', 'pick'])
+    assert sorted(frame['player']) == ['Cam Ward', 'Travis Hunter']
+    assert len(load_pick_dataset(root, authors=['Author/B'])) == 1
+
+
+def test_refreshing_one_author_leaves_the_others_untouched(paths):
+    db_path, root = paths
+    export_pick_dataset(root, db_path=db_path)
+    other = os.path.join(root, 'draft_year=2025', 'author=Author%2FB')
+    other_files = {name: os.path.getmtime(os.path.join(other, name)) for name in os.listdir(other)}
+
+    updated = draft('Author A', 2025, ['Shedeur Sanders'])
+    save_mock_drafts([updated], path=db_path, export=False)
+    assert export_mock_drafts([updated], root=root, db_path=db_path) == 2  # 2024 and 2025 for Author A
+
+    frame = load_pick_dataset(root, authors=['Author A'], years=[2025])
+    assert frame['player'].tolist() == ['Shedeur Sanders']
+    assert {name: os.path.getmtime(os.path.join(other, name)) for name in os.listdir(other)} == other_files
+    assert export_mock_drafts([{'author': 'Nobody', 'picks': []}], root=root, db_path=db_path) == 0
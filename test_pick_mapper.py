@@ -0,0 +1,67 @@
+"""Tests for nfl_pick_mapper: pick-to-analysis mapping and the sequential filter on DOM snapshots"""
+
+from nfl_pick_mapper import filter_sequential_analysis, is_analysis_paragraph, map_picks_to_analysis, parse_pick_text
+
+FILLER = ' He fits what this roster has been missing for a long while now.'
+
+
+def paragraph(y, text):
+    return {'index': 0, 'y': y, 'text': text}
+
+
+def snapshot(picks, paragraphs):
+    return {
+        'picks': [{'index': i, 'y': y, 'text': text} for i, (y, text) in enumerate(picks)],
+        'paragraphs': [paragraph(y, text) for y, text in paragraphs],
+    }
+
+
+PICKS = [(100, 'Pick 1\nTitans\nCam Ward\nQB, Miami'), (500, 'Pick 2\nBrowns\nTravis Hunter\nCB, Colorado'),
+         (900, 'Pick 3\nGiants\nAbdul Carter\nEdge, Penn State')]
+
+
+def test_parse_pick_text_finds_team_and_player():
+    assert parse_pick_text(PICKS[0][1]) == ('Titans', 'Cam Ward')
+    assert parse_pick_text('Pick 4\nSomething else entirely') == (None, None)
+
+
+def test_each_pick_gets_the_paragraph_that_mentions_it():
+    shot = snapshot(PICKS, [
+        (50, 'Finally the week is here and this draft class has plenty of intrigue.' + FILLER),
+        (200, 'The team needs a pass rusher before anything else this season.' + FILLER),
+        (250, 'Cam Ward gives the franchise a quarterback to build around.' + FILLER),
+        (600, 'Cleveland adds a two-way player with rare potential.' + FILLER),
+        (1000, 'Short.'),
+    ])
+    descriptions = map_picks_to_analysis(shot, 'Author')
+    assert descriptions[1].startswith('Cam Ward gives')
+    assert descriptions[2].startswith('Cleveland adds')
+    # Nothing usable below pick 3, so the card text stands in
+    assert descriptions[3] == 'Draft analysis for pick #3 by Author.'
+
+
+def test_closest_paragraph_wins_when_nothing_names_the_pick():
+    shot = snapshot(PICKS[:1], [(300, 'A defense that needs help on every level gets some.' + FILLER),
+                                (400, 'The offense gets a boost too this season.' + FILLER)])
+    assert map_picks_to_analysis(shot, 'Author')[1].startswith('A defense')
+
+
+def test_page_chrome_is_not_analysis():
+    assert not is_analysis_paragraph('Read more draft coverage on NFL.com for every team.' + FILLER)
+    assert not is_analysis_paragraph('Pick 1: the team takes a quarterback, as expected.' + FILLER)
+    assert not is_analysis_paragraph('draft team')
+
+
+def test_sequential_filter_keeps_the_original_keyword_list():
+    shot = snapshot(PICKS, [
+        (50, 'The team has to decide whether the draft is worth trading up for.' + FILLER),
+        (200, 'Finally the week is here and every team is on the clock.' + FILLER),
+        (300, 'A quarterback who can start right away for this franchise.' + FILLER),
+        (700, 'Elite pass protection is the first priority up front here.' + FILLER),
+        (1200, 'A defense in need of a true number one corner gets one.' + FILLER),
+        (3500, 'Another player note that sits far below the last pick card.' + FILLER),
+    ])
+    # 'protection' and 'elite' only count for the per-pick mapping, not the sequential filter
+    assert [text.split()[1] for text in filter_sequential_analysis(shot)] == ['quarterback', 'defense']
+    assert is_analysis_paragraph('Elite pass protection is the first priority up front here.' + FILLER)
+    assert filter_sequential_analysis(snapshot([], [])) == []
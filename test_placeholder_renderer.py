@@ -0,0 +1,53 @@
+"""Tests for nfl_placeholder_renderer: cached gradients and fonts, and memoized placeholders"""
+
+import pytest
+from PIL import Image
+import nfl_placeholder_renderer
+from nfl_image_store import ImageStore
+from nfl_placeholder_renderer import PLACEHOLDER_STYLES, get_font, gradient_canvas, render_placeholder
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    store = ImageStore(str(tmp_path / 'store'))
+    monkeypatch.setattr(nfl_placeholder_renderer, 'get_image_store', lambda: store)
+    return store
+
+
+def test_gradient_rows_follow_the_line_by_line_formula():
+    img = gradient_canvas(7, 50, 245, 20, (0, 2, 5))
+    for y in (0, 1, 24, 49):
+        value = int(245 - y * 20 / 50)
+        assert img.getpixel((0, y)) == img.getpixel((6, y)) == (value, value + 2, value + 5)
+
+
+def test_gradient_copies_are_independent():
+    first = gradient_canvas(10, 10, 200, 10)
+    first.putpixel((0, 0), (1, 2, 3))
+    assert gradient_canvas(10, 10, 200, 10).getpixel((0, 0)) == (200, 200, 200)
+
+
+def test_fonts_are_loaded_once():
+    assert get_font(17) is get_font(17)
+    assert get_font(17, 'no-such-font.ttf') is not None
+
+
+@pytest.mark.parametrize('style, size', [('nfl_style', (350, 254)), ('enhanced', (400, 500)),
+                                         ('professional', (300, 400)), ('compact', (200, 250))])
+def test_styles_render_their_canvas(style, size):
+    with Image.open(render_placeholder('Cam Ward', 1, style)) as img:
+        assert img.size == size
+
+
+def test_placeholders_are_rendered_once_per_player_pick_and_style(monkeypatch):
+    calls = []
+
+    def counting(player_name, pick_number):
+        calls.append((player_name, pick_number))
+        return Image.new('RGB', (10, 10), (pick_number, 0, 0))
+
+    monkeypatch.setitem(PLACEHOLDER_STYLES, 'compact', counting)
+    first = render_placeholder('Cam Ward', 1, 'compact')
+    assert render_placeholder('cam ward', 1, 'compact') == first
+    assert render_placeholder('Cam Ward', 2, 'compact') != first
+    assert calls == [('Cam Ward', 1), ('Cam Ward', 2)]
@@ -0,0 +1,66 @@
+"""Tests for nfl_player_registry: only normalization and aliases join spellings"""
+
+import pytest
+from nfl_player_registry import PlayerRegistry, normalize_name
+
+# Distinct prospects whose names score 0.80-0.87 on trigram Dice similarity
+LOOK_ALIKES = [
+    ('Kyle Williams', 'Kyle Williamson'),
+    ('Jack Bech', 'Jack Beck'),
+    ('Will Green', 'Will Greene'),
+    ('Will Johnson', 'Will Johnston'),
+]
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return PlayerRegistry(aliases_path=str(tmp_path / 'missing.json'))
+
+
+@pytest.mark.parametrize('name, key', [
+    ('Kelvin Banks Jr.', 'kelvin banks'),
+    ('KELVIN BANKS', 'kelvin banks'),
+    ('Tre Harris III', 'tre harris'),
+    ("Will O'Neil", 'will oneil'),
+    ('José Núñez', 'jose nunez'),
+    ('Jr. Smith', 'jr smith'),
+])
+def test_normalize_name(name, key):
+    assert normalize_name(name) == key
+
+
+@pytest.mark.parametrize('first, second', LOOK_ALIKES)
+def test_look_alike_names_stay_distinct_in_either_order(tmp_path, first, second):
+    for names in ((first, second), (second, first)):
+        registry = PlayerRegistry(aliases_path=str(tmp_path / 'missing.json'))
+        keys = [registry.resolve(name) for name in names]
+        assert keys[0] != keys[1]
+        assert [registry.canonical_name(name) for name in names] == list(names)
+
+
+def test_normalized_spellings_join(registry):
+    assert registry.resolve('Kelvin Banks Jr.') == registry.resolve('kelvin banks')
+    assert registry.canonical_name('kelvin banks') == 'Kelvin Banks Jr.'
+
+
+def test_alias_table_joins_and_names_the_player(tmp_path):
+    registry = PlayerRegistry(aliases={'Cam Ward Jr': 'Cameron Ward'}, aliases_path=str(tmp_path / 'missing.json'))
+    assert registry.canonical_name('Tet McMillan') == 'Tetairoa McMillan'
+    assert registry.resolve('cam ward jr') == registry.resolve('Cameron Ward')
+    registry.add_alias('T. McMillan', 'Tetairoa McMillan')
+    assert registry.resolve('T. McMillan') == 'tetairoa mcmillan'
+
+
+def test_aliases_file_is_loaded(tmp_path):
+    path = tmp_path / 'aliases.json'
+    path.write_text('{"Jack Beck": "Jack Bech"}', encoding='utf-8')
+    registry = PlayerRegistry(aliases_path=str(path))
+    assert registry.resolve('Jack Beck') == registry.resolve('Jack Bech')
+
+
+def test_look_alikes_are_only_reported(registry):
+    registry.register([name for pair in LOOK_ALIKES for name in pair] + ['Cam Ward'])
+    reported = {(first, second) for first, second, _ in registry.candidate_merges()}
+    assert reported == {tuple(sorted(pair)) for pair in LOOK_ALIKES}
+    assert [name for _, name in registry.similar('Jack Beck')] == ['Jack Bech']
+    assert registry.similar('Cam Ward') == []
@@ -0,0 +1,60 @@
+"""Tests for nfl_reference_data: team and prospect lookups and expanded reference drafts"""
+
+import json
+import pytest
+from nfl_reference_data import (ReferenceData, fallback_mock_draft, get_reference_data, headshot_sources,
+                                player_image_sources, prospect, reference_mock_drafts, sample_picks,
+                                team_abbreviation, team_city, team_color, team_names)
+
+
+def test_data_is_loaded_once_per_process():
+    assert get_reference_data() is get_reference_data()
+
+
+def test_team_lookups_by_name_or_abbreviation():
+    assert len(team_names()) == 32
+    assert team_abbreviation('Tennessee Titans') == 'TEN'
+    assert team_color('CLE') == '#FF3C00'
+    assert team_city('Cleveland Browns') == 'Cleveland'
+    assert (team_abbreviation('Unknown'), team_color('Unknown'), team_city('Unknown')) == ('NFL', '#002244', None)
+
+
+def test_prospects_match_any_spelling_and_list_espn_first():
+    assert prospect('cam ward') == prospect('Cam Ward')
+    assert prospect('Cam Ward')['school'] == 'Miami'
+    sources = headshot_sources('Cam Ward')
+    assert sources[0].endswith('/4686261.png') and len(sources) == 3
+    assert headshot_sources('Nobody Known') == []
+    assert player_image_sources()['Cam Ward'] == sources
+
+
+def test_reference_drafts_expand_to_scraper_picks():
+    draft = reference_mock_drafts('analysis')[0]
+    assert draft['author'] == 'Bucky Brooks' and draft['date'] == 'March 25, 2025'
+    first = draft['picks'][0]
+    assert (first['pick'], first['team'], first['player'], first['position']) == (1, 'Tennessee Titans', 'Cam Ward', 'QB')
+    assert 'reasoning' in first
+
+
+def test_fallback_and_sample_drafts():
+    assert fallback_mock_draft('Daniel Jeremiah')['author'] == 'Daniel Jeremiah'
+    assert fallback_mock_draft('Someone New')['author'] == 'Bucky Brooks'
+
+    picks = sample_picks('Test Author')
+    assert picks[0]['reasoning'].startswith('Test Author believes Cam Ward')
+    picks[0]['team'] = 'changed'
+    assert sample_picks('Test Author')[0]['team'] == 'Tennessee Titans'  # callers get fresh dicts
+
+
+def test_a_new_year_needs_only_data(tmp_path):
+    path = tmp_path / 'reference.json'
+    path.write_text(json.dumps({
+        'teams': {'Tennessee Titans': {'abbreviation': 'TEN', 'city': 'Tennessee', 'color': '#002244'}},
+        'prospects': {'Future Star': {'school': 'State', 'position': 'QB', 'class': 'Junior'}},
+        'drafts': {'2026': {'sample': {'picks': [['TEN', 'Future Star', '{author} likes him.']]}}},
+    }))
+    data = ReferenceData(str(path))
+    [pick] = data.expand_picks(data.edition('sample', 2026)['picks'], author='A')
+    assert (pick['team'], pick['school'], pick['reasoning']) == ('Tennessee Titans', 'State', 'A likes him.')
+    with pytest.raises(KeyError):
+        data.edition('sample', 2027)
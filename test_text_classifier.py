@@ -0,0 +1,59 @@
+"""Tests for nfl_text_classifier: one regex scan must agree with any(keyword in text) per category"""
+
+import random
+import pytest
+from nfl_text_classifier import CATEGORY_KEYWORDS, classify, looks_like_name, teams_mentioned
+
+
+def reference_categories(text):
+    text = text.lower()
+    return frozenset(category for category, keywords in CATEGORY_KEYWORDS.items()
+                     if any(keyword in text for keyword in keywords))
+
+
+def random_texts(count, seed=2025):
+    """Keyword fragments, whole keywords and filler glued together, so matches overlap and nest"""
+    rng = random.Random(seed)
+    keywords = sorted({keyword for keywords in CATEGORY_KEYWORDS.values() for keyword in keywords})
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            keyword = rng.choice(keywords)
+            roll = rng.random()
+            if roll < 0.4:
+                parts.append(keyword)
+            elif roll < 0.7:
+                start = rng.randrange(len(keyword))
+                parts.append(keyword[start:rng.randint(start + 1, len(keyword))])
+            else:
+                parts.append(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz .') for _ in range(rng.randint(1, 5))))
+            parts.append(rng.choice(['', ' ', '-']))
+        yield ''.join(parts).title() if rng.random() < 0.3 else ''.join(parts)
+
+
+def test_matches_substring_reference_on_random_text():
+    for text in random_texts(5000):
+        assert classify(text) == reference_categories(text), text
+
+
+@pytest.mark.parametrize('text', [
+    'New York Jets select Justin Fields',
+    'the jetsetter', 'titanic', 'Green Bay Packers', 'Los Angeles Chargers',
+    'University of Miami quarterback', 'Pick 1 Round 1', '', 'Cam Ward',
+])
+def test_matches_substring_reference_on_known_text(text):
+    assert classify(text) == reference_categories(text)
+
+
+def test_teams_mentioned_uses_city_and_storyline_keywords():
+    assert teams_mentioned('Drake Maye finally gets help in New England') == {'patriots'}
+    assert teams_mentioned('A New York Jets pick') == {'jets', 'giants'}
+    assert teams_mentioned('Cam Ward') == set()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Cam Ward', True), ('Tetairoa McMillan', False), ('Jaxson Dart Jr', True), ('A.J. Brown', False),
+    ('cam ward', False), ('Ward', False), ('Tennessee Titans Pick One', False), ('CAM WARD', False),
+])
+def test_looks_like_name(text, expected):
+    assert looks_like_name(text) is expected